@@ -8,23 +8,31 @@ This module demonstrates clean architecture principles:
 - Proper error handling and logging
 - Shorter, focused methods
 - Proper encapsulation and interfaces
+
+Exports are resolved lazily on first access, so ``import after`` stays cheap
+and a submodule is only imported when one of its names is used.
 """
 
-from .data_processor import DataProcessor
-from .config import load_config
-from .exceptions import (
-    APIException,
-    AuthenticationError,
-    DatabaseError,
-    ValidationError,
-    ParseError,
-    BackupError,
-    EncryptionError
-)
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'DataProcessor': '.data_processor',
+    'load_config': '.config',
+    'get_config': '.config',
+    'APIException': '.exceptions',
+    'AuthenticationError': '.exceptions',
+    'DatabaseError': '.exceptions',
+    'ValidationError': '.exceptions',
+    'ParseError': '.exceptions',
+    'BackupError': '.exceptions',
+    'EncryptionError': '.exceptions',
+}
 
 __all__ = [
     'DataProcessor',
     'load_config',
+    'get_config',
     'APIException',
     'AuthenticationError',
     'DatabaseError',
@@ -32,4 +40,16 @@ __all__ = [
     'ParseError',
     'BackupError',
     'EncryptionError'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,34 +1,140 @@
+import hashlib
+import hmac
 import logging
+import os
+import threading
+import time
 from typing import Optional
+from .cache import TTLCache
 from .config import LDAPConfig
+from .connection_pool import ConnectionPool
 from .exceptions import AuthenticationError
+from .metrics import LDAP_BIND_LATENCY
 
 logger = logging.getLogger(__name__)
 
 class AuthenticationService:
     """Handles user authentication operations."""
 
-    def __init__(self, ldap_config: LDAPConfig, admin_password: str):
+    def __init__(self, ldap_config: LDAPConfig, admin_password: str, metrics_enabled: bool = True):
         self.ldap_config = ldap_config
         self.admin_password = admin_password
-        self._ldap_conn = None
+        self.metrics_enabled = metrics_enabled
+        self._search_pool = None
+        self._bind_pool = None
+        self._pool_lock = threading.Lock()
+        self._dn_cache = TTLCache(ldap_config.dn_cache_size, ldap_config.dn_cache_ttl)
+        self._auth_cache = TTLCache(ldap_config.auth_cache_size, ldap_config.auth_cache_ttl)
+        self._cache_key = os.urandom(32)
 
-    def _connect_ldap(self) -> bool:
-        """Establish LDAP connection."""
-        try:
-            import ldap
-            self._ldap_conn = ldap.initialize(self.ldap_config.server)
-            self._ldap_conn.simple_bind_s(self.ldap_config.username, self.ldap_config.password)
+    def _service_connection(self):
+        """Open an LDAP connection bound as the service account."""
+        import ldap
+        conn = ldap.initialize(self.ldap_config.server)
+        conn.simple_bind_s(self.ldap_config.username, self.ldap_config.password)
+        return conn
+
+    def _bind_connection(self):
+        """Open an unbound LDAP connection used to verify user credentials."""
+        import ldap
+        return ldap.initialize(self.ldap_config.server)
+
+    def _new_pool(self, factory) -> ConnectionPool:
+        """Build a connection pool sized from the LDAP configuration."""
+        return ConnectionPool(
+            factory=factory,
+            min_size=0,
+            max_size=self.ldap_config.pool_size,
+            closer=lambda conn: conn.unbind(),
+            error_class=AuthenticationError
+        )
+
+    def _get_pools(self) -> bool:
+        """Create the LDAP connection pools on first use; False if python-ldap is unavailable."""
+        with self._pool_lock:
+            if self._search_pool is None:
+                try:
+                    import ldap
+                except ImportError:
+                    logger.warning("LDAP module not available")
+                    return False
+                self._search_pool = self._new_pool(self._service_connection)
+                self._bind_pool = self._new_pool(self._bind_connection)
             return True
-        except ImportError:
-            logger.warning("LDAP module not available")
-            return False
+
+    def _acquire(self, pool: ConnectionPool):
+        """Check out a pooled LDAP connection, wrapping connection failures."""
+        try:
+            return pool.acquire()
+        except AuthenticationError:
+            raise
         except Exception as e:
             logger.error(f"LDAP connection failed: {str(e)}")
             raise AuthenticationError(f"LDAP connection failed: {str(e)}")
 
+    def _credential_digest(self, username: str, password: str) -> bytes:
+        """Keyed digest of a credential pair so cached results never hold plain passwords."""
+        message = f"{username}\0{password}".encode('utf-8')
+        return hmac.new(self._cache_key, message, hashlib.sha256).digest()
+
+    def _lookup_dn(self, username: str) -> Optional[str]:
+        """Resolve a uid to its DN through the service-bound connection pool."""
+        user_dn = self._dn_cache.get(username)
+        if user_dn is not None:
+            return user_dn
+
+        import ldap
+        conn = self._acquire(self._search_pool)
+        try:
+            results = conn.search_s(
+                self.ldap_config.base_dn,
+                ldap.SCOPE_SUBTREE,
+                f"(uid={username})"
+            )
+        except Exception:
+            self._search_pool.release(conn, discard=True)
+            raise
+        self._search_pool.release(conn)
+
+        if not results:
+            return None
+
+        user_dn = results[0][0]
+        self._dn_cache.set(username, user_dn)
+        return user_dn
+
+    def _observe_bind(self, start: float, result: str):
+        """Record the latency of a bind that began at ``start``."""
+        if self.metrics_enabled:
+            LDAP_BIND_LATENCY.observe(time.perf_counter() - start, result)
+
+    def _verify_bind(self, user_dn: str, password: str) -> bool:
+        """Bind as the user on a pooled connection to check the password."""
+        import ldap
+        conn = self._acquire(self._bind_pool)
+        start = time.perf_counter()
+        try:
+            conn.simple_bind_s(user_dn, password)
+        except ldap.INVALID_CREDENTIALS:
+            self._observe_bind(start, 'invalid_credentials')
+            self._bind_pool.release(conn)
+            return False
+        except Exception:
+            self._observe_bind(start, 'error')
+            self._bind_pool.release(conn, discard=True)
+            raise
+        self._observe_bind(start, 'success')
+        self._bind_pool.release(conn)
+        return True
+
     def authenticate_user(self, username: str, password: str) -> bool:
-        """Authenticate user against LDAP or admin credentials."""
+        """
+        Authenticate user against LDAP or admin credentials.
+
+        Service-bound search connections and user-bind connections are pooled and
+        reused, uid to DN lookups are cached, and definitive results are cached
+        for ``auth_cache_ttl`` (success) or ``auth_negative_cache_ttl`` (failure).
+        """
         if not username or not password:
             return False
 
@@ -36,35 +142,58 @@ class AuthenticationService:
             logger.info("Admin user authenticated")
             return True
 
-        if not self._connect_ldap():
+        cache_key = self._credential_digest(username, password)
+        cached = self._auth_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if not self._get_pools():
             logger.warning("LDAP authentication unavailable, falling back to admin only")
             return False
 
         try:
-            import ldap
-            search_filter = f"(uid={username})"
-            results = self._ldap_conn.search_s(
-                self.ldap_config.base_dn,
-                ldap.SCOPE_SUBTREE,
-                search_filter
-            )
+            user_dn = self._lookup_dn(username)
+            if user_dn is None:
+                logger.info(f"LDAP user {username} not found")
+                self._auth_cache.set(cache_key, False, self.ldap_config.auth_negative_cache_ttl)
+                return False
 
-            if results:
-                user_dn = results[0][0]
-                self._ldap_conn.simple_bind_s(user_dn, password)
-                logger.info(f"User {username} authenticated via LDAP")
-                return True
+            authenticated = self._verify_bind(user_dn, password)
         except Exception as e:
             logger.error(f"LDAP authentication failed for {username}: {str(e)}")
+            return False
 
-        return False
+        if authenticated:
+            logger.info(f"User {username} authenticated via LDAP")
+            self._auth_cache.set(cache_key, True)
+        else:
+            logger.info(f"Invalid credentials for LDAP user {username}")
+            self._auth_cache.set(cache_key, False, self.ldap_config.auth_negative_cache_ttl)
+        return authenticated
+
+    def cache_stats(self) -> dict:
+        """Return hit/miss counters for the DN and authentication result caches."""
+        return {
+            'dn_cache': self._dn_cache.stats(),
+            'auth_cache': self._auth_cache.stats()
+        }
+
+    def clear_cache(self):
+        """Forget every cached DN and authentication result."""
+        self._dn_cache.clear()
+        self._auth_cache.clear()
 
     def close_connection(self):
-        """Close LDAP connection."""
-        if self._ldap_conn:
+        """Close pooled LDAP connections."""
+        with self._pool_lock:
+            pools = [self._search_pool, self._bind_pool]
+            self._search_pool = None
+            self._bind_pool = None
+
+        for pool in pools:
+            if pool is None:
+                continue
             try:
-                self._ldap_conn.unbind()
+                pool.close()
             except Exception as e:
-                logger.error(f"Error closing LDAP connection: {str(e)}")
-            finally:
-                self._ldap_conn = None
\ No newline at end of file
+                logger.error(f"Error closing LDAP connection: {str(e)}")
\ No newline at end of file
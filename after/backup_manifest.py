@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from .records import json_default
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUDED_FIELDS = ('created_date',)
+
+class BackupManifest:
+    """
+    Per-record content hashes of the last successful backup, keyed by record ``id``.
+
+    The manifest is a small JSON file holding a sequence number and one digest per
+    record. Comparing a dataset against it yields the records that are new or
+    changed and the ids that disappeared, so a backup only has to ship the churn.
+    Fields in ``excluded_fields`` (the processing timestamp by default) are left
+    out of the hash so that reprocessing unchanged input does not look like a change.
+    """
+
+    def __init__(self, path: Optional[str], excluded_fields: Sequence[str] = DEFAULT_EXCLUDED_FIELDS):
+        self.path = path
+        self.excluded_fields = frozenset(excluded_fields)
+        self.sequence = 0
+        self.hashes = {}
+        self._issued = 0
+        self._loaded = False
+
+    def load(self):
+        """Read the manifest from disk; a missing file is an empty manifest."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            self.sequence = int(manifest.get('sequence', 0))
+            self.hashes = dict(manifest.get('hashes', {}))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable backup manifest {self.path}: {str(e)}")
+            self.sequence = 0
+            self.hashes = {}
+
+    def save(self):
+        """Write the manifest atomically so an interrupted save keeps the previous one."""
+        if not self.path:
+            return
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'sequence': self.sequence, 'hashes': self.hashes}, f, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+    def record_hash(self, record: Mapping[str, Any]) -> str:
+        """Stable content digest of a record, ignoring the excluded fields."""
+        content = {key: value for key, value in record.items() if key not in self.excluded_fields}
+        encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), default=json_default)
+        return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+    def diff(self, data: Iterable[Mapping[str, Any]],
+             complete: bool = True) -> Tuple[List[Mapping[str, Any]], List[str], Dict[str, str]]:
+        """
+        Compare ``data`` with the manifest.
+
+        Returns the new or changed records, the ids to tombstone and the digests
+        to record once the delta has been backed up. Tombstones are only produced
+        when ``data`` is the ``complete`` dataset; a partial chunk cannot tell a
+        deleted record from one that simply is not in the chunk. Records without
+        an ``id`` cannot be tracked and are always included.
+        """
+        self.load()
+        upserts = []
+        changed = {}
+        seen = set()
+
+        for record in data:
+            record_id = record.get('id')
+            if record_id is None or record_id == '':
+                upserts.append(record)
+                continue
+
+            record_id = str(record_id)
+            seen.add(record_id)
+            digest = self.record_hash(record)
+            if self.hashes.get(record_id) != digest:
+                upserts.append(record)
+                changed[record_id] = digest
+
+        deleted = [record_id for record_id in self.hashes if record_id not in seen] if complete else []
+        return upserts, deleted, changed
+
+    def next_sequence(self) -> int:
+        """
+        Reserve the sequence number of the next payload sent.
+
+        Numbers keep increasing while payloads go out without being committed,
+        so every payload a target receives has its own place in the order.
+        """
+        self.load()
+        self._issued = max(self._issued, self.sequence) + 1
+        return self._issued
+
+    def commit(self, changed: Dict[str, str], deleted: Iterable[str], sequence: Optional[int] = None) -> int:
+        """Apply a backed-up delta sent as ``sequence``, persist the manifest and return its sequence number."""
+        self.hashes.update(changed)
+        for record_id in deleted:
+            self.hashes.pop(record_id, None)
+        self.sequence = self.sequence + 1 if sequence is None else max(self.sequence, sequence)
+        self.save()
+        return self.sequence
+
+    def reset(self):
+        """Forget every hash so the next backup is a full snapshot."""
+        self._loaded = True
+        self.sequence = 0
+        self.hashes = {}
+        self._issued = 0
+        self.save()
+
+def rebuild_snapshot(base: Iterable[Mapping[str, Any]],
+                     deltas: Iterable[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+    """
+    Rebuild a full snapshot from a base record list and backup delta payloads.
+
+    Each delta is a payload as sent by an incremental backup, with the changed
+    records under ``data`` and tombstoned ids under ``deleted``. Deltas are
+    applied in ``sequence`` order, and a payload of type 'full' replaces
+    everything before it. Records keep their first-seen position, and new
+    records are appended.
+    """
+    snapshot = {}
+    untracked = []
+
+    def upsert(record):
+        record_id = record.get('id')
+        if record_id is None or record_id == '':
+            untracked.append(record)
+        else:
+            snapshot[str(record_id)] = record
+
+    for record in base:
+        upsert(record)
+
+    for delta in sorted(deltas, key=lambda d: d.get('sequence', 0)):
+        if delta.get('type') == 'full':
+            snapshot.clear()
+            untracked.clear()
+        for record_id in delta.get('deleted', []):
+            snapshot.pop(str(record_id), None)
+        for record in delta.get('data', []):
+            upsert(record)
+
+    return list(snapshot.values()) + untracked
\ No newline at end of file
@@ -1,43 +1,418 @@
+import contextlib
 import datetime
+import http.client
+import json
 import logging
-from typing import List, Dict, Any
+import random
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+from .backup_manifest import BackupManifest
+from .chunk_codec import CONTENT_ENCODINGS, ChunkEncoder, resolve_codec
 from .config import BackupConfig, APIConfig
 from .exceptions import BackupError
+from .metrics import BACKUP_UPLOAD_FAILURES, BACKUP_UPLOAD_LATENCY
+from .records import json_default
 
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+class BackupTarget:
+    """A backup endpoint with a reusable keep-alive HTTP connection and latency counters."""
+
+    def __init__(self, url: str, timeout: float, metrics_enabled: bool = True):
+        self.url = url
+        self.timeout = timeout
+        self.metrics_enabled = metrics_enabled
+        self._conn = None
+        self._lock = threading.Lock()
+        self.uploads = 0
+        self.failures = 0
+        self.retries = 0
+        self.total_latency = 0.0
+        self.min_latency = None
+        self.max_latency = None
+        self.last_latency = None
+
+        parts = urlsplit(url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return the open connection, creating it on first use or after a reset."""
+        if self._conn is None:
+            if self._scheme not in ('http', 'https') or not self._host:
+                raise BackupError(f"Unsupported backup URL: {self.url}")
+            conn_class = http.client.HTTPSConnection if self._scheme == 'https' else http.client.HTTPConnection
+            self._conn = conn_class(self._host, self._port, timeout=self.timeout)
+        return self._conn
+
+    def _reset(self):
+        """Drop the current connection so the next request reconnects."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _abort(conn: http.client.HTTPConnection):
+        """Shut the connection's socket down, waking a request blocked on it."""
+        sock = conn.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _send(self, body: bytes, headers: Dict[str, str], deadline: Optional[float] = None) -> int:
+        """
+        POST ``body`` over the current connection and return the response status.
+
+        ``timeout`` bounds each socket operation; a ``deadline`` (a
+        time.monotonic() value) bounds the whole request, so a server trickling
+        bytes cannot hold it open. Past the deadline the socket is shut down
+        and TimeoutError is raised.
+        """
+        conn = self._connection()
+        watchdog = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("upload deadline exceeded")
+            conn.timeout = min(self.timeout, remaining)
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            watchdog = threading.Timer(remaining, self._abort, args=(conn,))
+            watchdog.daemon = True
+            watchdog.start()
+        try:
+            conn.request('POST', self._path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except Exception as e:
+            self._reset()
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError("upload deadline exceeded") from e
+            raise
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+        if response.will_close:
+            self._reset()
+        return response.status
+
+    def _post(self, body: bytes, headers: Dict[str, str], deadline: Optional[float] = None) -> int:
+        """Send one request, reconnecting once if the server closed an idle keep-alive connection."""
+        reused = self._conn is not None
+        try:
+            return self._send(body, headers, deadline)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            if not reused:
+                raise
+            return self._send(body, headers, deadline)
+
+    def upload(self, body: bytes, headers: Dict[str, str], max_retries: int = 0,
+               retry_backoff: float = 0.0, deadline: Optional[float] = None) -> float:
+        """
+        Upload ``body`` and return the latency in seconds, retries included.
+
+        Connection errors, timeouts and retryable HTTP statuses are retried up to
+        ``max_retries`` times with full-jitter exponential backoff. With
+        ``deadline`` set, attempts and backoff together take at most that many
+        seconds. Raises BackupError once the attempts or the time are exhausted,
+        or the server rejects the payload.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            expires = time.monotonic() + deadline if deadline is not None else None
+            attempt = 0
+            while True:
+                try:
+                    status = self._post(body, headers, expires)
+                except BackupError:
+                    self.failures += 1
+                    if self.metrics_enabled:
+                        BACKUP_UPLOAD_FAILURES.inc(1, self.url)
+                    raise
+                except (OSError, http.client.HTTPException) as e:
+                    error = f"{type(e).__name__}: {str(e)}"
+                    retryable = True
+                else:
+                    if 200 <= status < 300:
+                        break
+                    error = f"HTTP {status}"
+                    retryable = status in RETRYABLE_STATUSES
+
+                backoff = random.uniform(0, retry_backoff * 2 ** attempt)
+                out_of_time = expires is not None and time.monotonic() + backoff >= expires
+                if not retryable or attempt >= max_retries or out_of_time:
+                    self.failures += 1
+                    if self.metrics_enabled:
+                        BACKUP_UPLOAD_FAILURES.inc(1, self.url)
+                    if out_of_time and retryable:
+                        error = f"{error}, deadline of {deadline}s reached"
+                    raise BackupError(f"{error} after {attempt + 1} attempt(s)")
+
+                attempt += 1
+                self.retries += 1
+                time.sleep(backoff)
+
+            latency = time.perf_counter() - start
+            self.uploads += 1
+            self.total_latency += latency
+            self.last_latency = latency
+            if self.metrics_enabled:
+                BACKUP_UPLOAD_LATENCY.observe(latency, self.url)
+            self.min_latency = latency if self.min_latency is None else min(self.min_latency, latency)
+            self.max_latency = latency if self.max_latency is None else max(self.max_latency, latency)
+            return latency
+
+    def stats(self) -> Dict[str, Any]:
+        """Return upload, failure and latency counters for this target."""
+        with self._lock:
+            return {
+                'uploads': self.uploads,
+                'failures': self.failures,
+                'retries': self.retries,
+                'avg_latency': self.total_latency / self.uploads if self.uploads else None,
+                'min_latency': self.min_latency,
+                'max_latency': self.max_latency,
+                'last_latency': self.last_latency
+            }
+
+    def close(self):
+        """Close the kept-alive connection."""
+        with self._lock:
+            self._reset()
+
+class BackupStreamWriter:
+    """
+    One chunked backup fed by any number of write_many calls.
+
+    Records are framed into chunks by a ChunkEncoder and each chunk is POSTed
+    as soon as the encoder releases it, so the chunk indices continue across
+    writes under a single backup id and only close sends the final chunk.
+    Targets that fail are dropped and their next index is kept in the
+    service's ``stream_progress``.
+    """
+
+    def __init__(self, service: 'BackupService', metadata: Dict[str, Any], resume: bool = False):
+        self._service = service
+        self.codec = resolve_codec(service.config.compression)
+        self.chunk_records = service.config.chunk_records
+        self._simulate = service.config.simulate
+
+        targets = [] if self._simulate else service._get_targets()
+        if resume and service.stream_progress:
+            self.backup_id = service.stream_progress['backup_id']
+            self._next_index = dict(service.stream_progress['pending'])
+        else:
+            self.backup_id = uuid.uuid4().hex
+            self._next_index = {target.url: 0 for target in targets}
+        self._active = [target for target in targets if target.url in self._next_index]
+
+        metadata = dict(metadata, backup_id=self.backup_id, compression=self.codec,
+                        chunk_records=self.chunk_records)
+        self._encoder = ChunkEncoder(metadata, self.chunk_records, self.codec)
+        self.errors = []
+        self.sent_bytes = 0
+        self.completed = 0
+        self.closed = False
+
+    def _send(self, index: int, body: bytes, final: bool):
+        """POST one chunk to every active target that still needs it."""
+        senders = [target for target in self._active if self._next_index[target.url] <= index]
+        if not senders:
+            return
+
+        headers = {
+            'Content-Type': 'application/x-ndjson',
+            'Content-Encoding': CONTENT_ENCODINGS[self.codec],
+            'X-Backup-Id': self.backup_id,
+            'X-Chunk-Index': str(index),
+            'X-Chunk-Final': 'true' if final else 'false'
+        }
+        for target, latency, error in self._service._upload_to(senders, body, headers):
+            if error is None:
+                self._next_index[target.url] = index + 1
+                self.sent_bytes += len(body)
+            else:
+                error_msg = f"Backup failed for {target.url} at chunk {index}: {str(error)}"
+                logger.error(error_msg)
+                self.errors.append(error_msg)
+                self._active.remove(target)
+
+    @property
+    def record_count(self) -> int:
+        return self._encoder.record_count
+
+    def write_many(self, records: Iterable[Dict[str, Any]]):
+        """Add records to the backup, raising BackupError once every target has failed."""
+        if self.closed:
+            raise ValueError("Backup stream is closed")
+        for index, body, final in self._encoder.add(records):
+            if self._simulate:
+                continue
+            self._send(index, body, final)
+            if not self._active:
+                raise BackupError(f"All backup operations failed: {'; '.join(self.errors)}")
+
+    def close(self):
+        """Send the final chunk and record the progress; raises BackupError if no target completed."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            chunks = self._encoder.finish()
+            if self._simulate:
+                for url in self._service.backup_urls:
+                    logger.info(f"Simulating chunked backup {self.backup_id} to {url}: {self.record_count} records")
+                self.completed = len(self._service.backup_urls)
+                return
+            for index, body, final in chunks:
+                if not self._active:
+                    break
+                self._send(index, body, final)
+        finally:
+            if not self._simulate:
+                for target in self._active:
+                    del self._next_index[target.url]
+                    logger.info(f"Chunked backup {self.backup_id} to {target.url} completed")
+                self.completed = len(self._active)
+                self._service.stream_progress = (
+                    {'backup_id': self.backup_id, 'pending': self._next_index} if self._next_index else None)
+                logger.info(f"Chunked backup {self.backup_id}: {self.sent_bytes} compressed bytes sent ({self.codec})")
+
+        if self.completed == 0:
+            raise BackupError(f"All backup operations failed: {'; '.join(self.errors)}")
+
 class BackupService:
     """Handles data backup operations."""
 
-    def __init__(self, backup_config: BackupConfig, api_config: APIConfig):
+    def __init__(self, backup_config: BackupConfig, api_config: APIConfig, metrics_enabled: bool = True):
         self.backup_urls = backup_config.urls
         self.api_key = api_config.api_key
+        self.config = backup_config
+        self.metrics_enabled = metrics_enabled
+        self._targets = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self.manifest = BackupManifest(backup_config.manifest_path) if backup_config.incremental else None
+        self._manifest_lock = threading.Lock()
+        self.stream_progress = None
 
-    def backup_data(self, data: List[Dict[str, Any]]) -> bool:
-        """Backup data to configured URLs."""
-        if not data:
-            logger.info("No data to backup")
-            return True
+    def _get_targets(self) -> List[BackupTarget]:
+        """Create one target per backup URL on first use."""
+        with self._lock:
+            if self._targets is None:
+                self._targets = [BackupTarget(url, self.config.timeout, self.metrics_enabled) for url in self.backup_urls]
+            return self._targets
 
-        backup_payload = {
-            'timestamp': datetime.datetime.now().isoformat(),
-            'data': data,
-            'api_key': self.api_key
-        }
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the upload thread pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                max_workers = max(1, min(self.config.max_workers, len(self.backup_urls)))
+                self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='backup')
+            return self._executor
 
+    def _simulate_backup(self, data: Iterable[Dict[str, Any]]) -> Tuple[int, List[str]]:
+        """Log the backup instead of sending it."""
         success_count = 0
         errors = []
+        record_count = len(data) if hasattr(data, '__len__') else sum(1 for _ in data)
 
         for url in self.backup_urls:
             try:
                 logger.info(f"Simulating backup to {url}")
-                logger.info(f"Backup payload size: {len(data)} records")
+                logger.info(f"Backup payload size: {record_count} records")
                 success_count += 1
             except Exception as e:
                 error_msg = f"Backup failed for {url}: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
 
+        return success_count, errors
+
+    def _upload_to(self, targets: List[BackupTarget], body: bytes,
+                   headers: Dict[str, str]) -> List[Tuple[BackupTarget, Optional[float], Optional[Exception]]]:
+        """POST one body to several targets concurrently, returning each latency or error."""
+        def upload(target: BackupTarget) -> float:
+            return target.upload(body, headers, self.config.max_retries, self.config.retry_backoff,
+                                 self.config.deadline)
+
+        if len(targets) == 1:
+            pending = [(targets[0], None)]
+        else:
+            executor = self._get_executor()
+            pending = [(target, executor.submit(upload, target)) for target in targets]
+
+        results = []
+        for target, future in pending:
+            try:
+                latency = upload(target) if future is None else future.result()
+                results.append((target, latency, None))
+            except Exception as e:
+                results.append((target, None, e))
+        return results
+
+    def _upload_backup(self, backup_payload: Dict[str, Any]) -> Tuple[int, List[str]]:
+        """POST the payload to every target concurrently."""
+        body = json.dumps(backup_payload, default=json_default).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+
+        success_count = 0
+        errors = []
+
+        for target, latency, error in self._upload_to(self._get_targets(), body, headers):
+            if error is None:
+                logger.info(f"Backup to {target.url} completed in {latency:.3f}s "
+                            f"({len(backup_payload['data'])} records)")
+                success_count += 1
+            else:
+                error_msg = f"Backup failed for {target.url}: {str(error)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+        return success_count, errors
+
+    def _upload_chunked(self, backup_payload: Dict[str, Any], resume: bool = False) -> Tuple[int, List[str]]:
+        """
+        Stream the payload to every target as compressed NDJSON chunks.
+
+        Records are serialized ``chunk_records`` at a time, so peak memory is one
+        compressed chunk regardless of dataset size. Each chunk is POSTed with its
+        backup id and index in the headers. Targets that fail are dropped from the
+        rest of the stream and their next index is kept in ``stream_progress``;
+        with ``resume`` the same backup id is reused and each target continues
+        from that index (earlier chunks are re-encoded but not re-sent).
+        """
+        metadata = {key: value for key, value in backup_payload.items() if key != 'data'}
+        writer = BackupStreamWriter(self, metadata, resume)
+        # Failures are reported through the returned count and errors; closing
+        # after every target failed still records where each one stopped
+        with contextlib.suppress(BackupError):
+            writer.write_many(backup_payload['data'])
+        with contextlib.suppress(BackupError):
+            writer.close()
+        return writer.completed, writer.errors
+
+    def _send_backup(self, backup_payload: Dict[str, Any], chunked: Optional[bool] = None, resume: bool = False) -> int:
+        """Deliver a payload to the backup URLs, raising BackupError if none accepted it; return how many did."""
+        if self.config.simulate:
+            success_count, errors = self._simulate_backup(backup_payload['data'])
+        elif self.config.chunked if chunked is None else chunked:
+            success_count, errors = self._upload_chunked(backup_payload, resume)
+        else:
+            success_count, errors = self._upload_backup(backup_payload)
+
         if success_count == 0:
             raise BackupError(f"All backup operations failed: {'; '.join(errors)}")
 
@@ -45,4 +420,120 @@ class BackupService:
             logger.warning(f"Some backups failed: {'; '.join(errors)}")
 
         logger.info(f"Backup completed: {success_count}/{len(self.backup_urls)} successful")
-        return success_count > 0
\ No newline at end of file
+        return success_count
+
+    def _backup_delta(self, data: List[Dict[str, Any]], complete: bool) -> bool:
+        """
+        Send only the records that changed since the last backup, plus tombstones.
+
+        The manifest only advances once every target accepted the delta, and
+        never in simulate mode, where nothing was delivered. Otherwise the next
+        backup resends the same changes to all targets; re-applying a delta a
+        target already holds is harmless. Only a ``complete`` dataset sent against
+        an empty manifest is a 'full' snapshot, and every payload gets its own
+        sequence number, so uncommitted chunks still rebuild in order.
+        """
+        with self._manifest_lock:
+            upserts, deleted, changed = self.manifest.diff(data, complete)
+            if not upserts and not deleted:
+                logger.info(f"No changes since last backup ({len(data)} records unchanged)")
+                return True
+
+            backup_payload = {
+                'timestamp': datetime.datetime.now().isoformat(),
+                'type': 'full' if complete and not self.manifest.hashes else 'delta',
+                'sequence': self.manifest.next_sequence(),
+                'data': upserts,
+                'deleted': deleted,
+                'api_key': self.api_key
+            }
+
+            logger.info(f"Incremental backup: {len(upserts)} changed, {len(deleted)} deleted, "
+                        f"{len(data) - len(upserts)} unchanged")
+            delivered = self._send_backup(backup_payload)
+            if self.config.simulate:
+                logger.info("Simulated backup, backup manifest not advanced")
+            elif delivered < len(self.backup_urls):
+                logger.warning(f"Delta accepted by {delivered}/{len(self.backup_urls)} targets, "
+                               f"backup manifest not advanced")
+            else:
+                self.manifest.commit(changed, deleted, backup_payload['sequence'])
+            return True
+
+    def backup_data(self, data: List[Dict[str, Any]], complete: bool = True) -> bool:
+        """
+        Backup data to configured URLs.
+
+        With ``simulate`` off the payload is POSTed to every URL at once, so total
+        latency follows the slowest target rather than the sum over all of them.
+        In ``incremental`` mode only new or changed records are sent, along with
+        tombstones for ids missing from ``data`` when it is the ``complete`` dataset.
+        """
+        if not data:
+            logger.info("No data to backup")
+            return True
+
+        if self.manifest is not None:
+            return self._backup_delta(data, complete)
+
+        backup_payload = {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'data': data,
+            'api_key': self.api_key
+        }
+
+        self._send_backup(backup_payload)
+        return True
+
+    def backup_stream(self, records: Iterable[Dict[str, Any]], resume: bool = False) -> bool:
+        """
+        Back up records from any iterable as compressed chunks without materializing them.
+
+        Unlike backup_data this always uses the chunked upload and sends every
+        record (no incremental diff). Pass ``resume`` to retry a stream that
+        failed part-way, continuing each target from ``stream_progress``; the
+        iterable must yield the same records in the same order.
+        """
+        backup_payload = {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'data': records,
+            'api_key': self.api_key
+        }
+
+        self._send_backup(backup_payload, chunked=True, resume=resume)
+        return True
+
+    def open_stream(self, resume: bool = False) -> BackupStreamWriter:
+        """
+        Open a chunked backup that is fed with write_many and finished with close.
+
+        Every write continues the same backup id and chunk indices, so a caller
+        producing records in batches sends one backup instead of one per batch.
+        ``resume`` continues a failed stream as in backup_stream.
+        """
+        metadata = {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'api_key': self.api_key
+        }
+        return BackupStreamWriter(self, metadata, resume)
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return upload and latency counters per backup URL."""
+        with self._lock:
+            targets = self._targets or []
+        return {target.url: target.stats() for target in targets}
+
+    def close(self):
+        """Shut down the upload threads and close kept-alive connections."""
+        with self._lock:
+            executor, targets = self._executor, self._targets or []
+            self._executor = None
+            self._targets = None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for target in targets:
+            try:
+                target.close()
+            except Exception as e:
+                logger.error(f"Error closing backup connection: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,111 @@
+import gzip
+import json
+import logging
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+from .records import json_default
+
+logger = logging.getLogger(__name__)
+
+CODECS = ('gzip', 'zlib', 'zstd', 'none')
+
+# Content-Encoding values for each codec
+CONTENT_ENCODINGS = {'gzip': 'gzip', 'zlib': 'deflate', 'zstd': 'zstd', 'none': 'identity'}
+
+def _load_zstandard():
+    """Return the zstandard module, or None if it is not installed."""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+def resolve_codec(codec: str) -> str:
+    """Validate a codec name, falling back to gzip when zstd is requested but unavailable."""
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported compression codec: {codec}")
+    if codec == 'zstd' and _load_zstandard() is None:
+        logger.warning("zstandard module not available, compressing backups with gzip")
+        return 'gzip'
+    return codec
+
+def compress(data: bytes, codec: str) -> bytes:
+    """Compress ``data`` with a resolved codec."""
+    if codec == 'gzip':
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if codec == 'zlib':
+        return zlib.compress(data, 6)
+    if codec == 'zstd':
+        return _load_zstandard().ZstdCompressor(level=3).compress(data)
+    return data
+
+def decompress(data: bytes, codec: str) -> bytes:
+    """Reverse compress."""
+    if codec == 'gzip':
+        return gzip.decompress(data)
+    if codec == 'zlib':
+        return zlib.decompress(data)
+    if codec == 'zstd':
+        return _load_zstandard().ZstdDecompressor().decompress(data)
+    return data
+
+def encode_ndjson(records: Iterable[Mapping[str, Any]]) -> bytes:
+    """Serialize records as compact newline-delimited JSON."""
+    return b''.join(
+        json.dumps(record, separators=(',', ':'), default=json_default).encode('utf-8') + b'\n'
+        for record in records
+    )
+
+class ChunkEncoder:
+    """
+    Encode a backup as independently compressed NDJSON chunks, fed in batches.
+
+    Chunk 0 holds the ``metadata`` object; each following chunk holds at most
+    ``chunk_records`` records. Encoded chunks are held back by one so the last
+    one can be flagged: add yields the ``(index, body, final)`` chunks that are
+    ready, and finish returns the final one. Only one full chunk and one
+    partial batch are ever held in memory.
+    """
+
+    def __init__(self, metadata: Mapping[str, Any], chunk_records: int, codec: str):
+        if chunk_records < 1:
+            raise ValueError("chunk_records must be at least 1")
+        self.chunk_records = chunk_records
+        self.codec = codec
+        self._pending = (0, compress(encode_ndjson([metadata]), codec))
+        self._index = 1
+        self._batch = []
+        self.record_count = 0
+
+    def _encode_batch(self) -> Tuple[int, bytes, bool]:
+        """Encode the buffered batch as the next chunk and return the one held back before it."""
+        previous = self._pending
+        self._pending = (self._index, compress(encode_ndjson(self._batch), self.codec))
+        self._index += 1
+        self._batch = []
+        return previous[0], previous[1], False
+
+    def add(self, records: Iterable[Mapping[str, Any]]) -> Iterator[Tuple[int, bytes, bool]]:
+        """Buffer records, yielding each chunk that is known not to be the last."""
+        for record in records:
+            self._batch.append(record)
+            self.record_count += 1
+            if len(self._batch) >= self.chunk_records:
+                yield self._encode_batch()
+
+    def finish(self) -> List[Tuple[int, bytes, bool]]:
+        """Encode what is left and return the remaining chunks, the last one flagged final."""
+        chunks = [self._encode_batch()] if self._batch else []
+        chunks.append((self._pending[0], self._pending[1], True))
+        return chunks
+
+def decode_chunk(body: bytes, codec: str) -> List[Dict[str, Any]]:
+    """Decode one chunk back into its records."""
+    return [json.loads(line) for line in decompress(body, codec).splitlines() if line]
+
+def decode_chunks(chunks: Iterable[bytes], codec: str) -> Dict[str, Any]:
+    """Reassemble chunk bodies, in index order, into a backup payload dict."""
+    iterator = iter(chunks)
+    metadata = decode_chunk(next(iterator), codec)[0]
+    records = [record for body in iterator for record in decode_chunk(body, codec)]
+    return dict(metadata, data=records)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import os
-from dataclasses import dataclass
-from typing import List
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 @dataclass
 class DatabaseConfig:
@@ -9,6 +10,13 @@ class DatabaseConfig:
     database: str
     username: str
     password: str
+    batch_size: int = 1000
+    fast_executemany: bool = True
+    pool_min_size: int = 1
+    pool_max_size: int = 5
+    pool_max_idle_time: float = 300.0
+    pool_health_check_interval: float = 30.0
+    pool_checkout_timeout: float = 30.0
 
     @property
     def connection_string(self) -> str:
@@ -20,6 +28,12 @@ class LDAPConfig:
     username: str
     password: str
     base_dn: str = "dc=company,dc=com"
+    pool_size: int = 4
+    dn_cache_size: int = 10000
+    dn_cache_ttl: float = 3600.0
+    auth_cache_size: int = 10000
+    auth_cache_ttl: float = 300.0
+    auth_negative_cache_ttl: float = 30.0
 
 @dataclass
 class APIConfig:
@@ -30,6 +44,41 @@ class APIConfig:
 @dataclass
 class BackupConfig:
     urls: List[str]
+    simulate: bool = True
+    timeout: float = 10.0
+    deadline: Optional[float] = 30.0
+    max_retries: int = 2
+    retry_backoff: float = 0.5
+    max_workers: int = 4
+    incremental: bool = False
+    manifest_path: str = "backup_manifest.json"
+    chunked: bool = False
+    chunk_records: int = 1000
+    compression: str = "gzip"
+
+@dataclass
+class ValidationConfig:
+    cache_enabled: bool = True
+    cache_size: int = 100000
+
+@dataclass
+class InstrumentationConfig:
+    profile: bool = False
+    trace_memory: bool = False
+    profile_top: int = 20
+    profile_output: Optional[str] = None
+
+@dataclass
+class MetricsConfig:
+    enabled: bool = True
+    textfile: Optional[str] = None
+    port: Optional[int] = None
+    host: str = "127.0.0.1"
+
+@dataclass
+class ErrorConfig:
+    max_samples: int = 100
+    spill_path: Optional[str] = None
 
 @dataclass
 class AppConfig:
@@ -38,6 +87,10 @@ class AppConfig:
     api: APIConfig
     backup: BackupConfig
     admin_password: str
+    validation: ValidationConfig = field(default_factory=ValidationConfig)
+    instrumentation: InstrumentationConfig = field(default_factory=InstrumentationConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
+    errors: ErrorConfig = field(default_factory=ErrorConfig)
 
 def load_config() -> AppConfig:
     """Load configuration from environment variables with fallback defaults for demo purposes."""
@@ -47,14 +100,27 @@ def load_config() -> AppConfig:
         server=os.getenv("DB_SERVER", "localhost"),
         database=os.getenv("DB_DATABASE", "TestDB"),
         username=os.getenv("DB_USERNAME", "testuser"),
-        password=os.getenv("DB_PASSWORD", "testpass")
+        password=os.getenv("DB_PASSWORD", "testpass"),
+        batch_size=int(os.getenv("DB_BATCH_SIZE", "1000")),
+        fast_executemany=os.getenv("DB_FAST_EXECUTEMANY", "true").lower() == "true",
+        pool_min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+        pool_max_size=int(os.getenv("DB_POOL_MAX_SIZE", "5")),
+        pool_max_idle_time=float(os.getenv("DB_POOL_MAX_IDLE_TIME", "300")),
+        pool_health_check_interval=float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30")),
+        pool_checkout_timeout=float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "30"))
     )
 
     ldap_config = LDAPConfig(
         server=os.getenv("LDAP_SERVER", "ldap://localhost:389"),
         username=os.getenv("LDAP_USERNAME", "testadmin"),
         password=os.getenv("LDAP_PASSWORD", "testpass"),
-        base_dn=os.getenv("LDAP_BASE_DN", "dc=company,dc=com")
+        base_dn=os.getenv("LDAP_BASE_DN", "dc=company,dc=com"),
+        pool_size=int(os.getenv("LDAP_POOL_SIZE", "4")),
+        dn_cache_size=int(os.getenv("LDAP_DN_CACHE_SIZE", "10000")),
+        dn_cache_ttl=float(os.getenv("LDAP_DN_CACHE_TTL", "3600")),
+        auth_cache_size=int(os.getenv("LDAP_AUTH_CACHE_SIZE", "10000")),
+        auth_cache_ttl=float(os.getenv("LDAP_AUTH_CACHE_TTL", "300")),
+        auth_negative_cache_ttl=float(os.getenv("LDAP_AUTH_NEGATIVE_CACHE_TTL", "30"))
     )
 
     api_config = APIConfig(
@@ -64,7 +130,43 @@ def load_config() -> AppConfig:
     )
 
     backup_config = BackupConfig(
-        urls=os.getenv("BACKUP_URLS", "http://localhost:8080,http://localhost:8081").split(",")
+        urls=os.getenv("BACKUP_URLS", "http://localhost:8080,http://localhost:8081").split(","),
+        simulate=os.getenv("BACKUP_SIMULATE", "true").lower() == "true",
+        timeout=float(os.getenv("BACKUP_TIMEOUT", "10")),
+        deadline=float(os.getenv("BACKUP_DEADLINE", "30")) or None,
+        max_retries=int(os.getenv("BACKUP_MAX_RETRIES", "2")),
+        retry_backoff=float(os.getenv("BACKUP_RETRY_BACKOFF", "0.5")),
+        max_workers=int(os.getenv("BACKUP_MAX_WORKERS", "4")),
+        incremental=os.getenv("BACKUP_INCREMENTAL", "false").lower() == "true",
+        manifest_path=os.getenv("BACKUP_MANIFEST_PATH", "backup_manifest.json"),
+        chunked=os.getenv("BACKUP_CHUNKED", "false").lower() == "true",
+        chunk_records=int(os.getenv("BACKUP_CHUNK_RECORDS", "1000")),
+        compression=os.getenv("BACKUP_COMPRESSION", "gzip")
+    )
+
+    validation_config = ValidationConfig(
+        cache_enabled=os.getenv("VALIDATION_CACHE_ENABLED", "true").lower() == "true",
+        cache_size=int(os.getenv("VALIDATION_CACHE_SIZE", "100000"))
+    )
+
+    instrumentation_config = InstrumentationConfig(
+        profile=os.getenv("PIPELINE_PROFILE", "false").lower() == "true",
+        trace_memory=os.getenv("PIPELINE_TRACE_MEMORY", "false").lower() == "true",
+        profile_top=int(os.getenv("PIPELINE_PROFILE_TOP", "20")),
+        profile_output=os.getenv("PIPELINE_PROFILE_OUTPUT") or None
+    )
+
+    metrics_port = os.getenv("METRICS_PORT")
+    metrics_config = MetricsConfig(
+        enabled=os.getenv("METRICS_ENABLED", "true").lower() == "true",
+        textfile=os.getenv("METRICS_TEXTFILE") or None,
+        port=int(metrics_port) if metrics_port else None,
+        host=os.getenv("METRICS_HOST", "127.0.0.1")
+    )
+
+    error_config = ErrorConfig(
+        max_samples=int(os.getenv("ERROR_MAX_SAMPLES", "100")),
+        spill_path=os.getenv("ERROR_LOG_PATH") or None
     )
 
     return AppConfig(
@@ -72,5 +174,25 @@ def load_config() -> AppConfig:
         ldap=ldap_config,
         api=api_config,
         backup=backup_config,
-        admin_password=os.getenv("ADMIN_PASSWORD", "testadmin")
-    )
\ No newline at end of file
+        admin_password=os.getenv("ADMIN_PASSWORD", "testadmin"),
+        validation=validation_config,
+        instrumentation=instrumentation_config,
+        metrics=metrics_config,
+        errors=error_config
+    )
+
+_config = None
+_config_lock = threading.Lock()
+
+def get_config(reload: bool = False) -> AppConfig:
+    """
+    Return the process-wide AppConfig, reading the environment only on first use.
+
+    The instance is shared, so treat it as read-only; pass ``reload`` to pick up
+    environment changes.
+    """
+    global _config
+    with _config_lock:
+        if _config is None or reload:
+            _config = load_config()
+        return _config
\ No newline at end of file
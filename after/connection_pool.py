@@ -0,0 +1,179 @@
+import collections
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Type
+from .exceptions import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable connections (database, LDAP, ...).
+
+    ``min_size`` connections are opened when the pool is created and kept open
+    while idle; connections above that are closed once idle for
+    ``max_idle_time``, checked whenever a connection is acquired or released.
+    """
+
+    def __init__(self, factory: Callable[[], Any], min_size: int = 1, max_size: int = 5,
+                 max_idle_time: float = 300.0, health_check: Optional[Callable[[Any], None]] = None,
+                 health_check_interval: float = 30.0, checkout_timeout: float = 30.0,
+                 closer: Optional[Callable[[Any], None]] = None, error_class: Type[Exception] = DatabaseError):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self._health_check = health_check
+        self.health_check_interval = health_check_interval
+        self.checkout_timeout = checkout_timeout
+        self._closer = closer or (lambda conn: conn.close())
+        self._error_class = error_class
+
+        self._idle = collections.deque()
+        self._in_use = set()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._prewarm()
+
+    def _prewarm(self):
+        """Open min_size connections up front; failures are logged and left to acquire."""
+        for _ in range(self.min_size):
+            try:
+                conn = self._factory()
+            except Exception as e:
+                logger.warning(f"Could not pre-open pooled connection: {str(e)}")
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._size += 1
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or checked out."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle connections waiting in the pool."""
+        return len(self._idle)
+
+    def _take_expired(self) -> list:
+        """Remove idle connections past max_idle_time, keeping min_size open. Caller holds the lock."""
+        expired = []
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.max_idle_time:
+            conn, _ = self._idle.popleft()
+            self._size -= 1
+            expired.append(conn)
+        return expired
+
+    def _close_all(self, connections):
+        """Close connections, logging rather than raising on failure."""
+        for conn in connections:
+            try:
+                self._closer(conn)
+            except Exception as e:
+                logger.warning(f"Error closing pooled connection: {str(e)}")
+
+    def _is_healthy(self, conn: Any) -> bool:
+        """Run the health check against a connection."""
+        try:
+            self._health_check(conn)
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy pooled connection: {str(e)}")
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Check out a connection, waiting up to ``timeout`` seconds for one to free up."""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            conn = None
+            idle_since = None
+            expired = []
+            try:
+                with self._cond:
+                    while True:
+                        if self._closed:
+                            raise self._error_class("Connection pool is closed")
+
+                        expired.extend(self._take_expired())
+                        if self._idle:
+                            conn, idle_since = self._idle.pop()
+                            self._in_use.add(conn)
+                            break
+                        if self._size < self.max_size:
+                            self._size += 1
+                            break
+
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise self._error_class(f"Timed out waiting for a pooled connection after {timeout}s")
+                        self._cond.wait(remaining)
+            finally:
+                self._close_all(expired)
+
+            if conn is None:
+                try:
+                    conn = self._factory()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._in_use.add(conn)
+                return conn
+
+            needs_check = (self._health_check is not None
+                           and time.monotonic() - idle_since >= self.health_check_interval)
+            if not needs_check or self._is_healthy(conn):
+                return conn
+
+            self.release(conn, discard=True)
+
+    def release(self, conn: Any, discard: bool = False):
+        """Return a checked-out connection to the pool, or close it if ``discard`` is set."""
+        with self._cond:
+            if conn not in self._in_use:
+                logger.debug("Ignoring release of a connection not owned by the pool")
+                return
+            self._in_use.discard(conn)
+
+            expired = self._take_expired()
+            if discard or self._closed:
+                self._size -= 1
+                expired.append(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+        self._close_all(expired)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Context manager that checks out a connection and returns it on exit."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close idle connections and refuse new checkouts; in-use connections close on release."""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        self._close_all(idle)
+        logger.info(f"Connection pool drained: closed {len(idle)} idle connections")
\ No newline at end of file
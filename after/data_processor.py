@@ -1,35 +1,201 @@
+import collections
 import datetime
+import functools
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
+import os
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Iterable, Iterator, Tuple, BinaryIO, Union, Callable
 
-from .config import load_config
-from .validators import DataValidator
+from .config import AppConfig, get_config
+from .validators import DataValidator, ValidationCache
 from .parsers import DataParser
-from .auth_service import AuthenticationService
-from .database_service import DatabaseService
-from .encryption_service import EncryptionService
-from .file_service import FileService
-from .backup_service import BackupService
-from .reporting_service import ReportingService
+from .reporting_service import ReportingService, ReportAccumulator
+from .instrumentation import Instrumentation, PipelineHooks
+from .error_collector import DEFAULT_MAX_SAMPLES, ErrorCollector
+from .metrics import REGISTRY, RECORDS_FAILED, RECORDS_SAVED, StageMetricsHooks
 from .exceptions import APIException, ValidationError, ParseError
 
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .auth_service import AuthenticationService
+    from .backup_service import BackupService
+    from .database_service import DatabaseService
+    from .encryption_service import EncryptionService
+    from .file_service import FileService
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 1000
+
+def _parse_item(item: Any, errors: ErrorCollector) -> Optional[Dict[str, Any]]:
+    """Parse a single input item, recording any error in ``errors``."""
+    try:
+        return DataParser.parse_data(item)
+    except ParseError as e:
+        logger.warning(f"Parse error: {str(e)}")
+        errors.add('parse', type(e).__name__, str(e))
+    except Exception as e:
+        logger.error(f"Unexpected parse error: {str(e)}")
+        errors.add('parse', type(e).__name__, "Unexpected parse error: %s", str(e))
+    return None
+
+def _validate_item(data_item: Dict[str, Any], errors: ErrorCollector, compact: bool = False,
+                   cache: Optional[ValidationCache] = None) -> Optional[Dict[str, Any]]:
+    """
+    Validate a single parsed item, recording any error in ``errors``.
+
+    With ``compact`` set the processed record is a UserRecord instead of a dict.
+    """
+    try:
+        if compact:
+            result = DataValidator.validate_user_record(data_item, errors, cache)
+        else:
+            result = DataValidator.validate_user_data(data_item, errors, cache)
+        processed_item = result['data']
+        processed_item['created_date'] = datetime.datetime.now().isoformat()
+        return processed_item
+
+    except ValidationError as e:
+        logger.warning(f"Validation error: {str(e)}")
+        errors.add('validate', type(e).__name__, str(e))
+    except Exception as e:
+        logger.error(f"Unexpected validation error: {str(e)}")
+        errors.add('validate', type(e).__name__, "Unexpected validation error: %s", str(e))
+    return None
+
+def _parse_and_validate_chunk(items: List[Any], compact: bool = False, max_samples: int = DEFAULT_MAX_SAMPLES,
+                              spill_path: Optional[str] = None, cache: Optional[ValidationCache] = None
+                              ) -> Tuple[int, List[Dict[str, Any]], ErrorCollector, ErrorCollector, ReportAccumulator]:
+    """
+    Parse and validate a chunk of input items in a worker process.
+
+    Returns the number of parsed items, the processed records, the parse and
+    validation errors, kept apart so the caller can merge them in the same order
+    as the single-process pipeline, and the chunk's report counters. Errors go
+    to collectors keeping ``max_samples`` samples each. With ``spill_path`` set
+    they spill to this chunk's own files, named after it, which the caller
+    merges into its spill file. ``cache`` arrives with the caller's settings
+    but empty, as a worker cannot share the caller's memoized results.
+    """
+    parse_errors = ErrorCollector(max_samples, f"{spill_path}.parse" if spill_path else None)
+    validation_errors = ErrorCollector(max_samples, f"{spill_path}.validate" if spill_path else None)
+    parsed_data = []
+    accumulator = ReportAccumulator()
+
+    for item in items:
+        parsed = _parse_item(item, parse_errors)
+        if parsed:
+            parsed_data.append(parsed)
+
+    processed_data = []
+    for data_item in parsed_data:
+        processed_item = _validate_item(data_item, validation_errors, compact, cache)
+        if processed_item is not None:
+            processed_data.append(processed_item)
+            accumulator.add(processed_item)
+
+    parse_errors.close()
+    validation_errors.close()
+    return len(parsed_data), processed_data, parse_errors, validation_errors, accumulator
+
+def _input_size(item: Any) -> int:
+    """Size in bytes (characters for text) of a raw string input; 0 for dicts and other objects."""
+    return len(item) if isinstance(item, (str, bytes)) else 0
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _measure_chunks(chunks: Iterable[List[Any]], stage) -> Iterator[List[Any]]:
+    """Pass chunks through, adding their item counts and input sizes to ``stage``."""
+    for chunk in chunks:
+        stage.records += len(chunk)
+        stage.bytes += sum(_input_size(item) for item in chunk)
+        yield chunk
+
 class DataProcessor:
     """Main data processing facade with proper separation of concerns."""
 
-    def __init__(self):
-        self.config = load_config()
-        self.auth_service = AuthenticationService(self.config.ldap, self.config.admin_password)
-        self.database_service = DatabaseService(self.config.database)
-        self.encryption_service = EncryptionService(self.config.api)
-        self.file_service = FileService()
-        self.backup_service = BackupService(self.config.backup, self.config.api)
-        self.reporting_service = ReportingService()
+    SERVICES = ('auth_service', 'database_service', 'encryption_service', 'file_service',
+                'backup_service', 'reporting_service')
+
+    def __init__(self, workers: int = 1, worker_chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 compact_records: bool = False, config: Optional[AppConfig] = None,
+                 hooks: Optional[List[PipelineHooks]] = None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if worker_chunk_size < 1:
+            raise ValueError("worker_chunk_size must be at least 1")
+
+        self.workers = workers
+        self.worker_chunk_size = worker_chunk_size
+        self.compact_records = compact_records
+        self.config = config if config is not None else get_config()
+        self.validation_cache = ValidationCache(self.config.validation.cache_enabled,
+                                                self.config.validation.cache_size)
 
         self.processed_data = []
-        self.errors = []
+        self.errors = ErrorCollector(self.config.errors.max_samples, self.config.errors.spill_path)
+        self.report_accumulator = ReportAccumulator()
+        # Error counts already added to the metrics registry
+        self._published_errors = collections.Counter()
+        instrumentation = self.config.instrumentation
+        self.instrumentation = Instrumentation(
+            hooks=hooks,
+            profile=instrumentation.profile,
+            trace_memory=instrumentation.trace_memory,
+            profile_top=instrumentation.profile_top,
+            profile_output=instrumentation.profile_output
+        )
+
+        self.metrics_enabled = self.config.metrics.enabled
+        if self.metrics_enabled:
+            self.instrumentation.add_hook(StageMetricsHooks())
+            if self.config.metrics.port is not None:
+                try:
+                    REGISTRY.serve(self.config.metrics.port, self.config.metrics.host)
+                except OSError as e:
+                    logger.error(f"Could not start metrics endpoint: {str(e)}")
+
+    # Services are imported and built on first access, so a job only pays for the ones it uses.
+
+    @functools.cached_property
+    def auth_service(self) -> 'AuthenticationService':
+        from .auth_service import AuthenticationService
+        return AuthenticationService(self.config.ldap, self.config.admin_password, self.metrics_enabled)
+
+    @functools.cached_property
+    def database_service(self) -> 'DatabaseService':
+        from .database_service import DatabaseService
+        return DatabaseService(self.config.database, self.metrics_enabled)
+
+    @functools.cached_property
+    def encryption_service(self) -> 'EncryptionService':
+        from .encryption_service import EncryptionService
+        return EncryptionService(self.config.api)
+
+    @functools.cached_property
+    def file_service(self) -> 'FileService':
+        from .file_service import FileService
+        return FileService()
+
+    @functools.cached_property
+    def backup_service(self) -> 'BackupService':
+        from .backup_service import BackupService
+        return BackupService(self.config.backup, self.config.api, self.metrics_enabled)
+
+    @functools.cached_property
+    def reporting_service(self) -> ReportingService:
+        return ReportingService()
+
+    def active_services(self) -> List[str]:
+        """Names of the services constructed so far."""
+        return [name for name in self.SERVICES if name in self.__dict__]
 
     def authenticate_user(self, username: str, password: str) -> bool:
         """Authenticate user credentials."""
@@ -37,24 +203,40 @@ class DataProcessor:
             return self.auth_service.authenticate_user(username, password)
         except Exception as e:
             logger.error(f"Authentication error: {str(e)}")
-            self.errors.append(f"Authentication error: {str(e)}")
+            self.errors.add('auth', type(e).__name__, "Authentication error: %s", str(e))
             return False
 
+    def _parse_item(self, item: Any) -> Optional[Dict[str, Any]]:
+        """Parse a single input item, recording any error."""
+        return _parse_item(item, self.errors)
+
+    def _validate_item(self, data_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate a single parsed item, recording any error and counting it in the running report."""
+        processed_item = _validate_item(data_item, self.errors, self.compact_records, self.validation_cache)
+        if processed_item is not None:
+            self.report_accumulator.add(processed_item)
+        return processed_item
+
+    def _record_saved(self, sink: str, count: int):
+        """Count records a sink accepted."""
+        if self.metrics_enabled:
+            RECORDS_SAVED.labels(sink).inc(count)
+
+    def partial_report(self) -> Dict[str, Any]:
+        """Report on the records processed so far by the current run."""
+        return self.report_accumulator.report(self.errors.total)
+
     def parse_input_data(self, input_data: List[Any]) -> List[Dict[str, Any]]:
         """Parse input data from various formats."""
         parsed_data = []
 
-        for item in input_data:
-            try:
-                parsed = DataParser.parse_data(item)
+        with self.instrumentation.stage('parse') as stage:
+            for item in input_data:
+                stage.records += 1
+                stage.bytes += _input_size(item)
+                parsed = self._parse_item(item)
                 if parsed:
                     parsed_data.append(parsed)
-            except ParseError as e:
-                logger.warning(f"Parse error: {str(e)}")
-                self.errors.append(str(e))
-            except Exception as e:
-                logger.error(f"Unexpected parse error: {str(e)}")
-                self.errors.append(f"Unexpected parse error: {str(e)}")
 
         return parsed_data
 
@@ -62,81 +244,195 @@ class DataProcessor:
         """Validate and process parsed data."""
         processed_data = []
 
-        for data_item in parsed_data:
-            try:
-                result = DataValidator.validate_user_data(data_item)
-                processed_item = result['data']
-                processed_item['created_date'] = datetime.datetime.now().isoformat()
+        with self.instrumentation.stage('validate', records=len(parsed_data)):
+            for data_item in parsed_data:
+                processed_item = self._validate_item(data_item)
+                if processed_item is not None:
+                    processed_data.append(processed_item)
 
-                processed_data.append(processed_item)
-                self.errors.extend(result['errors'])
+        return processed_data
 
-            except ValidationError as e:
-                logger.warning(f"Validation error: {str(e)}")
-                self.errors.append(str(e))
-            except Exception as e:
-                logger.error(f"Unexpected validation error: {str(e)}")
-                self.errors.append(f"Unexpected validation error: {str(e)}")
+    def parse_and_validate_parallel(self, input_data: Iterable[Any]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Parse and validate input across a pool of worker processes.
+
+        Input is split into chunks of ``worker_chunk_size`` items. Record order is
+        preserved and per-record errors are merged back into ``self.errors`` with
+        all parse errors ahead of validation errors, as in the sequential path.
+        With a spill file, each chunk spills to files of its own that are
+        appended to it in that same order, so worker writes never interleave.
+        Each worker returns its chunk's report counters, which are merged into
+        ``report_accumulator``. Returns the number of parsed items and the processed records.
+        """
+        from concurrent.futures import ProcessPoolExecutor
 
-        return processed_data
+        parsed_count = 0
+        processed_data = []
+        spill_path = self.errors.spill_path
+        # Validation errors wait in their own spill file until every parse error is written
+        validation_errors = ErrorCollector(self.errors.max_samples, f"{spill_path}.{os.getpid()}.validate"
+                                           if spill_path else None)
+        chunk_spill_paths = ((f"{spill_path}.{os.getpid()}.{index}" for index in itertools.count())
+                             if spill_path else itertools.repeat(None))
+
+        with self.instrumentation.stage('parse_validate') as stage, \
+                ProcessPoolExecutor(max_workers=self.workers) as executor:
+            chunks = _measure_chunks(_chunked(input_data, self.worker_chunk_size), stage)
+            for chunk_parsed, chunk_processed, chunk_parse_errors, chunk_validation_errors, chunk_report in executor.map(
+                    _parse_and_validate_chunk, chunks, itertools.repeat(self.compact_records),
+                    itertools.repeat(self.errors.max_samples), chunk_spill_paths,
+                    itertools.repeat(self.validation_cache)):
+                parsed_count += chunk_parsed
+                processed_data.extend(chunk_processed)
+                self.report_accumulator.merge(chunk_report)
+                self.errors.merge(chunk_parse_errors)
+                validation_errors.merge(chunk_validation_errors)
+
+        validation_errors.close()
+        self.errors.merge(validation_errors)
+        return parsed_count, processed_data
 
     def save_processed_data(self, processed_data: List[Dict[str, Any]]) -> bool:
         """Save processed data to database."""
         try:
-            return self.database_service.save_user_data(processed_data)
+            with self.instrumentation.stage('database', records=len(processed_data)):
+                saved = self.database_service.save_user_data(processed_data)
         except Exception as e:
             logger.error(f"Database save error: {str(e)}")
-            self.errors.append(f"Database save error: {str(e)}")
+            self.errors.add('database', type(e).__name__, "Database save error: %s", str(e))
             return False
+        if saved:
+            self._record_saved('database', len(processed_data))
+        return saved
 
     def save_to_file(self, filename: str, data: List[Dict[str, Any]], format_type: str = 'json') -> bool:
         """Save data to file."""
         try:
-            return self.file_service.save_to_file(filename, data, format_type)
+            with self.instrumentation.stage('file', records=len(data)) as stage:
+                saved = self.file_service.save_to_file(filename, data, format_type)
+                stage.bytes = os.path.getsize(filename)
         except Exception as e:
             logger.error(f"File save error: {str(e)}")
-            self.errors.append(f"File save error: {str(e)}")
+            self.errors.add('file', type(e).__name__, "File save error: %s", str(e))
             return False
+        if saved:
+            self._record_saved('file', len(data))
+        return saved
 
-    def backup_data(self, data: List[Dict[str, Any]]) -> bool:
-        """Backup data to configured locations."""
+    def backup_data(self, data: List[Dict[str, Any]], complete: bool = True) -> bool:
+        """Backup data to configured locations; ``complete`` is False for a partial chunk."""
         try:
-            return self.backup_service.backup_data(data)
+            with self.instrumentation.stage('backup', records=len(data)):
+                saved = self.backup_service.backup_data(data, complete)
         except Exception as e:
             logger.error(f"Backup error: {str(e)}")
-            self.errors.append(f"Backup error: {str(e)}")
+            self.errors.add('backup', type(e).__name__, "Backup error: %s", str(e))
             return False
+        if saved:
+            self._record_saved('backup', len(data))
+        return saved
 
     def generate_report(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate processing report."""
         return self.reporting_service.generate_report(data, self.errors)
 
+    def _prepare_data(self, input_data: List[Any]) -> List[Dict[str, Any]]:
+        """Run the parse and validate stages, returning the processed records."""
+        self.report_accumulator = ReportAccumulator()
+        if self.workers > 1:
+            parsed_count, processed_data = self.parse_and_validate_parallel(input_data)
+        else:
+            parsed_data = self.parse_input_data(input_data)
+            parsed_count = len(parsed_data)
+            processed_data = self.validate_and_process_data(parsed_data) if parsed_data else []
+
+        if not parsed_count:
+            logger.warning("No valid data to process")
+        elif not processed_data:
+            logger.warning("No data passed validation")
+
+        return processed_data
+
+    def _build_result(self, processed_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the pipeline result dict for the processed records."""
+        if not processed_data:
+            return {
+                'success': False,
+                'processed_count': 0,
+                'errors': self.errors.messages(),
+                'error_summary': self.errors.summary()
+            }
+
+        with self.instrumentation.stage('report', records=len(processed_data)):
+            report = self.partial_report()
+
+        logger.info(f"Data processing completed: {len(processed_data)} records processed")
+
+        return {
+            'success': True,
+            'processed_count': len(processed_data),
+            'report': report,
+            'errors': self.errors.messages(),
+            'error_summary': self.errors.summary()
+        }
+
+    def _attach_instrumentation(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the per-stage counters, and any profile, to the result's report."""
+        target = result.get('report', result)
+        target['stages'] = self.instrumentation.summary()
+        if self.instrumentation.profile_report is not None:
+            target['profile'] = self.instrumentation.profile_report
+        return result
+
+    def publish_metrics(self):
+        """
+        Add the errors recorded since the last call to the metrics registry.
+
+        Errors are counted by the collector and published in bulk instead of
+        touching the registry for every record. The registry is then written
+        to the configured textfile, if any.
+        """
+        if not self.metrics_enabled:
+            return
+
+        for (stage, error_type), count in self.errors.counts.items():
+            published = self._published_errors[stage, error_type]
+            if count > published:
+                RECORDS_FAILED.labels(stage, error_type).inc(count - published)
+                self._published_errors[stage, error_type] = count
+
+        if self.config.metrics.textfile:
+            try:
+                REGISTRY.write_textfile(self.config.metrics.textfile)
+            except OSError as e:
+                logger.error(f"Could not write metrics to {self.config.metrics.textfile}: {str(e)}")
+
+    def _run_instrumented(self, run: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+        """Run a pipeline with fresh stage counters under the opt-in profilers."""
+        self.instrumentation.reset()
+        with self.instrumentation.profiling():
+            result = run(*args)
+        self.errors.flush()
+        self.publish_metrics()
+        return self._attach_instrumentation(result)
+
     def process_everything(self, input_data: List[Any], output_file: Optional[str] = None, backup: bool = True) -> Dict[str, Any]:
         """
         Main processing method that maintains the same interface as the original god class.
 
         This method orchestrates the entire data processing pipeline while maintaining
-        the same input/output behavior as the original implementation.
+        the same input/output behavior as the original implementation. The report
+        also carries per-stage timings under ``stages``.
         """
-        logger.info("Starting data processing pipeline")
+        return self._run_instrumented(self._process_everything, input_data, output_file, backup)
 
-        parsed_data = self.parse_input_data(input_data)
-        if not parsed_data:
-            logger.warning("No valid data to process")
-            return {
-                'success': False,
-                'processed_count': 0,
-                'errors': self.errors
-            }
+    def _process_everything(self, input_data: List[Any], output_file: Optional[str], backup: bool) -> Dict[str, Any]:
+        """Body of process_everything."""
+        logger.info("Starting data processing pipeline")
 
-        processed_data = self.validate_and_process_data(parsed_data)
+        processed_data = self._prepare_data(input_data)
         if not processed_data:
-            logger.warning("No data passed validation")
-            return {
-                'success': False,
-                'processed_count': 0,
-                'errors': self.errors
-            }
+            return self._build_result(processed_data)
 
         self.processed_data = processed_data
 
@@ -148,23 +444,273 @@ class DataProcessor:
         if backup:
             self.backup_data(processed_data)
 
-        report = self.generate_report(processed_data)
+        return self._build_result(processed_data)
 
-        logger.info(f"Data processing completed: {len(processed_data)} records processed")
+    async def process_everything_async(self, input_data: List[Any], output_file: Optional[str] = None,
+                                       backup: bool = True, executor: Optional['Executor'] = None) -> Dict[str, Any]:
+        """
+        Asynchronous variant of process_everything that runs the sinks concurrently.
+
+        The database save, file write and backup are independent, so they are
+        dispatched to ``executor`` (the loop's default thread pool when None) at
+        the same time and awaited together. End-to-end latency is bounded by the
+        slowest sink rather than their sum.
+        """
+        self.instrumentation.reset()
+        with self.instrumentation.profiling():
+            result = await self._process_everything_async(input_data, output_file, backup, executor)
+        self.errors.flush()
+        self.publish_metrics()
+        return self._attach_instrumentation(result)
+
+    async def _process_everything_async(self, input_data: List[Any], output_file: Optional[str],
+                                        backup: bool, executor: Optional['Executor']) -> Dict[str, Any]:
+        """Body of process_everything_async."""
+        logger.info("Starting asynchronous data processing pipeline")
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        processed_data = await loop.run_in_executor(executor, self._prepare_data, input_data)
+        if not processed_data:
+            return self._build_result(processed_data)
+
+        self.processed_data = processed_data
+
+        sinks = [loop.run_in_executor(executor, self.save_processed_data, processed_data)]
+
+        if output_file:
+            sinks.append(loop.run_in_executor(executor, self.save_to_file, output_file, processed_data))
+
+        if backup:
+            sinks.append(loop.run_in_executor(executor, self.backup_data, processed_data))
+
+        await asyncio.gather(*sinks)
+
+        return self._build_result(processed_data)
+
+    def iter_process(self, input_data: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """Parse and validate input lazily, yielding processed records one at a time."""
+        for item in input_data:
+            parsed = self._parse_item(item)
+            if not parsed:
+                continue
+            processed_item = self._validate_item(parsed)
+            if processed_item is not None:
+                yield processed_item
+
+    def _open_output(self, output_file: str, output_format: str, compress: bool):
+        """Open a streaming writer for the output file, recording any error."""
+        try:
+            return self.file_service.open_stream(output_file, output_format, compress=compress)
+        except Exception as e:
+            logger.error(f"File save error: {str(e)}")
+            self.errors.add('file', type(e).__name__, "File save error: %s", str(e))
+            return None
+
+    def _flush_chunk(self, chunk: List[Dict[str, Any]], writer, backup: bool):
+        """Send a chunk of processed records to the configured sinks."""
+        self.save_processed_data(chunk)
+
+        if writer is not None:
+            try:
+                with self.instrumentation.stage('file', records=len(chunk)):
+                    writer.write_many(chunk)
+                self._record_saved('file', len(chunk))
+            except Exception as e:
+                logger.error(f"File save error: {str(e)}")
+                self.errors.add('file', type(e).__name__, "File save error: %s", str(e))
+
+        if backup:
+            self.backup_data(chunk, complete=False)
+
+    def _open_backup_stream(self):
+        """Open one chunked backup for a streaming run, recording any error."""
+        try:
+            return self.backup_service.open_stream()
+        except Exception as e:
+            logger.error(f"Backup error: {str(e)}")
+            self.errors.add('backup', type(e).__name__, "Backup error: %s", str(e))
+            return None
+
+    def _write_backup_stream(self, backup_writer, chunk: List[Dict[str, Any]]):
+        """Add a chunk to the run's backup stream; returns None once the stream has failed."""
+        try:
+            with self.instrumentation.stage('backup', records=len(chunk)):
+                backup_writer.write_many(chunk)
+            return backup_writer
+        except Exception as e:
+            logger.error(f"Backup error: {str(e)}")
+            self.errors.add('backup', type(e).__name__, "Backup error: %s", str(e))
+            return None
+
+    def _close_backup_stream(self, backup_writer):
+        """Send the final backup chunk and count the streamed records as saved."""
+        try:
+            with self.instrumentation.stage('backup') as stage:
+                backup_writer.close()
+                stage.bytes = backup_writer.sent_bytes
+        except Exception as e:
+            logger.error(f"Backup error: {str(e)}")
+            self.errors.add('backup', type(e).__name__, "Backup error: %s", str(e))
+            return
+        self._record_saved('backup', backup_writer.record_count)
+
+    def process_stream(self, input_data: Iterable[Any], output_file: Optional[str] = None,
+                       backup: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       output_format: str = 'json', compress: bool = False,
+                       progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Streaming variant of process_everything with bounded memory use.
+
+        Records are parsed and validated one at a time and handed to the database,
+        file and backup sinks in chunks of at most ``chunk_size`` records. The
+        output file is written incrementally in ``output_format`` ('json',
+        'ndjson' or 'xml'), gzipped when ``compress`` is set. When given,
+        ``progress_callback`` receives a partial report after each chunk is flushed.
+        With chunked, non-incremental backups the whole run is sent as a single
+        backup stream; otherwise each chunk is backed up on its own.
+        The returned dict has the same shape as the one from process_everything.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        return self._run_instrumented(self._process_stream, input_data, output_file, backup, chunk_size,
+                                      output_format, compress, progress_callback)
+
+    def _process_stream(self, input_data: Iterable[Any], output_file: Optional[str], backup: bool,
+                        chunk_size: int, output_format: str, compress: bool,
+                        progress_callback: Optional[Callable[[Dict[str, Any]], None]]) -> Dict[str, Any]:
+        """Body of process_stream; parsing and validation are timed per chunk as 'parse_validate'."""
+        logger.info("Starting streaming data processing pipeline")
+
+        self.report_accumulator = ReportAccumulator()
+        parsed_count = 0
+        chunk = []
+        writer = None
+        open_output = bool(output_file)
+        backup_writer = None
+        stream_backup = backup and self.config.backup.chunked and not self.config.backup.incremental
+        open_backup = stream_backup
+        items = iter(input_data)
+        exhausted = False
+
+        try:
+            while not exhausted:
+                exhausted = True
+                with self.instrumentation.stage('parse_validate') as stage:
+                    for item in items:
+                        stage.records += 1
+                        stage.bytes += _input_size(item)
+                        parsed = self._parse_item(item)
+                        if not parsed:
+                            continue
+                        parsed_count += 1
+
+                        processed_item = self._validate_item(parsed)
+                        if processed_item is None:
+                            continue
+
+                        chunk.append(processed_item)
+                        if len(chunk) >= chunk_size:
+                            exhausted = False
+                            break
+
+                if not chunk:
+                    continue
+
+                if open_output:
+                    writer = self._open_output(output_file, output_format, compress)
+                    open_output = False
+                self._flush_chunk(chunk, writer, backup and not stream_backup)
+                if open_backup:
+                    backup_writer = self._open_backup_stream()
+                    open_backup = False
+                if backup_writer is not None:
+                    backup_writer = self._write_backup_stream(backup_writer, chunk)
+                chunk = []
+                self.publish_metrics()
+                if progress_callback is not None:
+                    progress_callback(self.partial_report())
+
+            # Only a run that read all of its input marks the backup as final
+            if backup_writer is not None:
+                self._close_backup_stream(backup_writer)
+        finally:
+            if writer is not None:
+                try:
+                    with self.instrumentation.stage('file') as stage:
+                        writer.close()
+                        stage.bytes = os.path.getsize(output_file)
+                except Exception as e:
+                    logger.error(f"File save error: {str(e)}")
+                    self.errors.add('file', type(e).__name__, "File save error: %s", str(e))
+
+        processed_count = self.report_accumulator.total_records
+        if parsed_count == 0:
+            logger.warning("No valid data to process")
+        elif processed_count == 0:
+            logger.warning("No data passed validation")
+
+        if processed_count == 0:
+            return {
+                'success': False,
+                'processed_count': 0,
+                'errors': self.errors.messages(),
+                'error_summary': self.errors.summary()
+            }
+
+        with self.instrumentation.stage('report', records=processed_count):
+            report = self.partial_report()
+
+        logger.info(f"Streaming data processing completed: {processed_count} records processed")
 
         return {
             'success': True,
-            'processed_count': len(processed_data),
+            'processed_count': processed_count,
             'report': report,
-            'errors': self.errors
+            'errors': self.errors.messages(),
+            'error_summary': self.errors.summary()
         }
 
+    def _record_source_error(self, error: ParseError):
+        """Record a parse error raised while reading an input source."""
+        logger.error(f"Input source error: {str(error)}")
+        self.errors.add('parse', type(error).__name__, str(error))
+
+    def _read_source(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Yield records from an input source, recording a source-level parse error."""
+        try:
+            yield from records
+        except ParseError as e:
+            self._record_source_error(e)
+
+    def process_file(self, source: Union[str, BinaryIO], output_file: Optional[str] = None,
+                     backup: bool = True, input_format: Optional[str] = None, **stream_options) -> Dict[str, Any]:
+        """
+        Stream records from a file path or binary file object through process_stream.
+
+        ``input_format`` is 'json', 'ndjson' or 'xml' and is detected when omitted.
+        A malformed NDJSON line is recorded and skipped. A malformed JSON array or
+        XML document stops reading at the offending record; records read before
+        it are still processed. Every error is included in the result.
+        """
+        records = DataParser.iter_records(source, input_format, on_error=self._record_source_error)
+        return self.process_stream(self._read_source(records), output_file, backup, **stream_options)
+
     def cleanup(self):
-        """Clean up resources and temporary files."""
+        """Clean up resources and temporary files of the services that were used."""
         try:
-            self.file_service.cleanup_temp_files()
-            self.database_service.close_connection()
-            self.auth_service.close_connection()
+            services = self.__dict__
+            if 'file_service' in services:
+                self.file_service.cleanup_temp_files()
+            if 'database_service' in services:
+                self.database_service.close_connection()
+            if 'auth_service' in services:
+                self.auth_service.close_connection()
+            if 'backup_service' in services:
+                self.backup_service.close()
+            self.errors.close()
             logger.info("Cleanup completed")
         except Exception as e:
             logger.error(f"Cleanup error: {str(e)}")
@@ -1,74 +1,163 @@
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 from .config import DatabaseConfig
+from .connection_pool import ConnectionPool
 from .exceptions import DatabaseError
+from .metrics import DATABASE_COMMIT_LATENCY
 
 logger = logging.getLogger(__name__)
 
 class DatabaseService:
     """Handles database operations with proper parameterized queries."""
 
-    def __init__(self, db_config: DatabaseConfig):
+    def __init__(self, db_config: DatabaseConfig, metrics_enabled: bool = True):
         self.db_config = db_config
-        self._connection = None
+        self.metrics_enabled = metrics_enabled
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    @staticmethod
+    def _check_connection(connection):
+        """Health check run on pooled connections that have been idle for a while."""
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+
+    def _get_pool(self) -> Optional[ConnectionPool]:
+        """Create the connection pool on first use, or return None if pyodbc is unavailable."""
+        with self._pool_lock:
+            if self._pool is None:
+                try:
+                    import pyodbc
+                except ImportError:
+                    logger.warning("pyodbc module not available")
+                    return None
+
+                connection_string = self.db_config.connection_string
+                self._pool = ConnectionPool(
+                    factory=lambda: pyodbc.connect(connection_string),
+                    min_size=self.db_config.pool_min_size,
+                    max_size=self.db_config.pool_max_size,
+                    max_idle_time=self.db_config.pool_max_idle_time,
+                    health_check=self._check_connection,
+                    health_check_interval=self.db_config.pool_health_check_interval,
+                    checkout_timeout=self.db_config.pool_checkout_timeout
+                )
+            return self._pool
+
+    def _get_connection(self):
+        """Check out a pooled database connection, or return None if the driver is unavailable."""
+        pool = self._get_pool()
+        if pool is None:
+            return None
 
-    def _connect(self) -> bool:
-        """Establish database connection."""
         try:
-            import pyodbc
-            self._connection = pyodbc.connect(self.db_config.connection_string)
-            return True
-        except ImportError:
-            logger.warning("pyodbc module not available")
-            return False
+            return pool.acquire()
+        except DatabaseError:
+            raise
         except Exception as e:
             logger.error(f"Database connection failed: {str(e)}")
             raise DatabaseError(f"Database connection failed: {str(e)}")
 
-    def save_user_data(self, data: List[Dict[str, Any]]) -> bool:
-        """Save user data using parameterized queries to prevent SQL injection."""
-        if not data:
-            return True
+    def _release_connection(self, connection, discard: bool = False):
+        """Return a connection obtained from _get_connection to the pool."""
+        if self._pool is not None:
+            self._pool.release(connection, discard=discard)
 
-        if not self._connect():
-            logger.warning("Database not available, skipping save operation")
-            return False
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """
+        Context manager that checks out a pooled connection (None if unavailable).
 
+        A connection whose block raised is discarded rather than returned to the
+        pool, since it may be left mid-transaction or broken.
+        """
+        connection = self._get_connection()
+        discard = False
         try:
-            cursor = self._connection.cursor()
-
-            query = """
-            INSERT INTO users (id, name, email, phone, created_date, email_valid, phone_valid)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-
-            for record in data:
-                cursor.execute(query, (
-                    record.get('id', ''),
-                    record.get('name', ''),
-                    record.get('email', ''),
-                    record.get('phone', ''),
-                    record.get('created_date', ''),
-                    record.get('email_valid', False),
-                    record.get('phone_valid', False)
-                ))
-
-            self._connection.commit()
-            logger.info(f"Successfully saved {len(data)} records to database")
+            yield connection
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            if connection is not None:
+                self._release_connection(connection, discard)
+
+    @staticmethod
+    def _record_params(record: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Map a record to the positional parameters of the insert query."""
+        return (
+            record.get('id', ''),
+            record.get('name', ''),
+            record.get('email', ''),
+            record.get('phone', ''),
+            record.get('created_date', ''),
+            record.get('email_valid', False),
+            record.get('phone_valid', False)
+        )
+
+    def save_user_data(self, data: Iterable[Dict[str, Any]], batch_size: Optional[int] = None) -> bool:
+        """
+        Save user data using parameterized queries to prevent SQL injection.
+
+        Records are inserted with ``executemany`` in chunks of ``batch_size``
+        (``DatabaseConfig.batch_size`` by default) and each chunk is committed on
+        its own, so a failure only rolls back the chunk in flight.
+        """
+        if batch_size is None:
+            batch_size = self.db_config.batch_size
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        if not data:
             return True
 
-        except Exception as e:
-            logger.error(f"Database save error: {str(e)}")
-            if self._connection:
-                self._connection.rollback()
-            raise DatabaseError(f"Database save error: {str(e)}")
+        with self.checkout() as connection:
+            if connection is None:
+                logger.warning("Database not available, skipping save operation")
+                return False
+
+            saved_count = 0
+            try:
+                cursor = connection.cursor()
+                if self.db_config.fast_executemany and hasattr(cursor, 'fast_executemany'):
+                    cursor.fast_executemany = True
+
+                query = """
+                INSERT INTO users (id, name, email, phone, created_date, email_valid, phone_valid)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """
+
+                records = iter(data)
+                while True:
+                    batch = [self._record_params(record) for record in itertools.islice(records, batch_size)]
+                    if not batch:
+                        break
+                    start = time.perf_counter()
+                    cursor.executemany(query, batch)
+                    connection.commit()
+                    if self.metrics_enabled:
+                        DATABASE_COMMIT_LATENCY.observe(time.perf_counter() - start)
+                    saved_count += len(batch)
+
+                logger.info(f"Successfully saved {saved_count} records to database")
+                return True
+
+            except Exception as e:
+                logger.error(f"Database save error after {saved_count} committed records: {str(e)}")
+                connection.rollback()
+                raise DatabaseError(f"Database save error: {str(e)}")
 
     def close_connection(self):
-        """Close database connection."""
-        if self._connection:
+        """Drain the connection pool, closing every idle connection."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
             try:
-                self._connection.close()
+                pool.close()
             except Exception as e:
-                logger.error(f"Error closing database connection: {str(e)}")
-            finally:
-                self._connection = None
\ No newline at end of file
+                logger.error(f"Error closing database connection: {str(e)}")
\ No newline at end of file
@@ -4,6 +4,7 @@ Demo script showing the refactored data processor in action.
 """
 
 import json
+import logging
 import sys
 import os
 
@@ -42,4 +43,5 @@ def main():
             print("Admin authentication failed")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     main()
\ No newline at end of file
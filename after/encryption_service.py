@@ -1,11 +1,82 @@
 import base64
+import binascii
+import io
 import logging
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterable, List, Optional
 from .config import APIConfig
 from .exceptions import EncryptionError
 
 logger = logging.getLogger(__name__)
 
+# Multiple of 3 so each block encodes to base64 without padding; its
+# encoded size (4/3 of it) is the matching block size for decryption.
+DEFAULT_BLOCK_SIZE = 3 << 16
+
+def _read_block(source: BinaryIO, view: memoryview) -> int:
+    """Fill ``view`` from ``source`` until it is full or the stream ends; return the bytes read."""
+    filled = 0
+    while filled < len(view):
+        count = source.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+class EncryptingWriter(io.RawIOBase):
+    """
+    Writable binary stream that encrypts everything written to it into ``destination``.
+
+    Bytes are encoded as they arrive; at most two trailing bytes are held back
+    until the next write or close so the output equals encrypting the whole
+    stream at once. Wrap it in io.TextIOWrapper to encrypt text output.
+    """
+
+    def __init__(self, destination: BinaryIO, close_destination: bool = True):
+        super().__init__()
+        self._destination = destination
+        self._close_destination = close_destination
+        self._pending = b''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        view = memoryview(data).cast('B')
+        size = len(view)
+        try:
+            if self._pending:
+                needed = 3 - len(self._pending)
+                self._pending += bytes(view[:needed])
+                view = view[needed:]
+                if len(self._pending) < 3:
+                    return size
+                self._destination.write(binascii.b2a_base64(self._pending, newline=False))
+                self._pending = b''
+
+            aligned = len(view) - len(view) % 3
+            if aligned:
+                self._destination.write(binascii.b2a_base64(view[:aligned], newline=False))
+            self._pending = bytes(view[aligned:])
+        except Exception as e:
+            logger.error(f"Encryption failed: {str(e)}")
+            raise EncryptionError(f"Encryption failed: {str(e)}")
+        return size
+
+    def close(self):
+        """Write the held-back bytes and close the destination if owned."""
+        if self.closed:
+            return
+        try:
+            if self._pending:
+                self._destination.write(binascii.b2a_base64(self._pending, newline=False))
+                self._pending = b''
+            if self._close_destination:
+                self._destination.close()
+            else:
+                self._destination.flush()
+        finally:
+            super().close()
+
 class EncryptionService:
     """Handles data encryption and decryption operations."""
 
@@ -32,4 +103,97 @@ class EncryptionService:
             return decrypted
         except Exception as e:
             logger.error(f"Decryption failed: {str(e)}")
-            raise EncryptionError(f"Decryption failed: {str(e)}")
\ No newline at end of file
+            raise EncryptionError(f"Decryption failed: {str(e)}")
+
+    def encrypt_many(self, values: Iterable[Any]) -> List[str]:
+        """Encrypt a batch of small values; each result equals encrypt_data(value)."""
+        encode = binascii.b2a_base64
+        try:
+            encrypted = [encode(str(value).encode('utf-8'), newline=False).decode('ascii') for value in values]
+        except Exception as e:
+            logger.error(f"Encryption failed: {str(e)}")
+            raise EncryptionError(f"Encryption failed: {str(e)}")
+        logger.debug(f"{len(encrypted)} values encrypted successfully")
+        return encrypted
+
+    def decrypt_many(self, encrypted_values: Iterable[str]) -> List[str]:
+        """Decrypt a batch produced by encrypt_many or encrypt_data."""
+        decode = binascii.a2b_base64
+        try:
+            decrypted = [decode(value).decode('utf-8') for value in encrypted_values]
+        except Exception as e:
+            logger.error(f"Decryption failed: {str(e)}")
+            raise EncryptionError(f"Decryption failed: {str(e)}")
+        logger.debug(f"{len(decrypted)} values decrypted successfully")
+        return decrypted
+
+    def encrypt_stream(self, source: BinaryIO, destination: BinaryIO,
+                       block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+        """
+        Encrypt a binary stream into ``destination`` in fixed-size blocks.
+
+        Blocks are read into one reused buffer and encoded through memoryview
+        slices, so memory use is bounded by ``block_size`` (rounded down to a
+        multiple of 3) whatever the stream length. The output is identical to
+        encrypting the whole content at once. Returns the number of bytes written.
+        """
+        block_size -= block_size % 3
+        if block_size < 3:
+            raise ValueError("block_size must be at least 3")
+
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+        written = 0
+        try:
+            while True:
+                count = _read_block(source, view)
+                if not count:
+                    break
+                encoded = binascii.b2a_base64(view[:count], newline=False)
+                destination.write(encoded)
+                written += len(encoded)
+                if count < block_size:
+                    break
+        except Exception as e:
+            logger.error(f"Encryption failed: {str(e)}")
+            raise EncryptionError(f"Encryption failed: {str(e)}")
+
+        logger.debug(f"Stream encrypted successfully ({written} bytes)")
+        return written
+
+    def decrypt_stream(self, source: BinaryIO, destination: BinaryIO,
+                       block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+        """
+        Decrypt a stream written by encrypt_stream into ``destination`` in fixed-size blocks.
+
+        ``block_size`` is the decrypted block size; encrypted input is read in
+        blocks of 4/3 of it through a reused buffer. Returns the number of bytes written.
+        """
+        block_size -= block_size % 3
+        if block_size < 3:
+            raise ValueError("block_size must be at least 3")
+
+        encoded_size = block_size // 3 * 4
+        buffer = bytearray(encoded_size)
+        view = memoryview(buffer)
+        written = 0
+        try:
+            while True:
+                count = _read_block(source, view)
+                if not count:
+                    break
+                decoded = binascii.a2b_base64(view[:count])
+                destination.write(decoded)
+                written += len(decoded)
+                if count < encoded_size:
+                    break
+        except Exception as e:
+            logger.error(f"Decryption failed: {str(e)}")
+            raise EncryptionError(f"Decryption failed: {str(e)}")
+
+        logger.debug(f"Stream decrypted successfully ({written} bytes)")
+        return written
+
+    def encrypting_writer(self, destination: BinaryIO, close_destination: bool = True) -> EncryptingWriter:
+        """Return a writable stream that encrypts into ``destination`` as data is written."""
+        return EncryptingWriter(destination, close_destination)
\ No newline at end of file
@@ -0,0 +1,173 @@
+import collections
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SAMPLES = 100
+
+class ErrorEntry:
+    """
+    One recorded error, formatted only when its message is read.
+
+    The message is ``template % args``, the same lazy style as logging calls,
+    so recording an error that is never displayed costs no string building.
+    """
+
+    __slots__ = ('stage', 'error_type', 'template', 'args')
+
+    def __init__(self, stage: str, error_type: str, template: str, args: Tuple[Any, ...] = ()):
+        self.stage = stage
+        self.error_type = error_type
+        self.template = template
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        return self.template % self.args if self.args else self.template
+
+    def to_dict(self) -> Dict[str, str]:
+        return {'stage': self.stage, 'error_type': self.error_type, 'message': self.message}
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"ErrorEntry({self.stage!r}, {self.error_type!r}, {self.message!r})"
+
+class ErrorCollector:
+    """
+    Bounded, structured record of the errors raised while processing.
+
+    Every error is counted by ``(stage, error_type)``; only the most recent
+    ``max_samples`` are kept, in a ring buffer, so memory does not grow with the
+    number of bad records. With ``spill_path`` set, every error is also appended
+    to that file as one JSON object per line. ``len()`` is the total count.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES, spill_path: Optional[str] = None):
+        if max_samples < 0:
+            raise ValueError("max_samples must not be negative")
+        self.max_samples = max_samples
+        self.spill_path = spill_path
+        self.counts = collections.Counter()
+        self.samples = collections.deque(maxlen=max_samples)
+        self._spill = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Sent back from worker processes without the lock or the spill file handle
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_spill'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, error_type: str, template: str, *args: Any):
+        """Record an error whose message is ``template % args``."""
+        self.add_entry(ErrorEntry(stage, error_type, template, args))
+
+    def add_entry(self, entry: ErrorEntry):
+        """Record an already built entry."""
+        with self._lock:
+            self.counts[entry.stage, entry.error_type] += 1
+            self.samples.append(entry)
+            if self.spill_path:
+                self._write_spill(entry)
+
+    def _write_spill(self, entry: ErrorEntry):
+        try:
+            if self._spill is None:
+                self._spill = open(self.spill_path, 'a', encoding='utf-8')
+            self._spill.write(json.dumps(entry.to_dict()) + '\n')
+        except OSError as e:
+            logger.error(f"Could not write error log {self.spill_path}: {str(e)}")
+            self.spill_path = None
+
+    def _append_spill(self, path: str):
+        """Append another collector's closed spill file to this one's and remove it."""
+        try:
+            if self.spill_path:
+                if self._spill is None:
+                    self._spill = open(self.spill_path, 'a', encoding='utf-8')
+                with open(path, 'r', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, self._spill)
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Could not merge error log {path}: {str(e)}")
+
+    def merge(self, other: 'ErrorCollector') -> 'ErrorCollector':
+        """
+        Add another collector's counts and samples into this one and return self.
+
+        A collector filled elsewhere, such as in a worker process, spills to its
+        own file; that file must be closed and is appended to this collector's
+        spill file, then removed. Entries therefore reach the shared file in
+        merge order, one writer at a time.
+        """
+        with self._lock:
+            self.counts.update(other.counts)
+            self.samples.extend(other.samples)
+            if other.spill_path and other.spill_path != self.spill_path:
+                self._append_spill(other.spill_path)
+        return self
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.messages())
+
+    def messages(self) -> List[str]:
+        """Formatted messages of the sampled errors, oldest first."""
+        return [entry.message for entry in list(self.samples)]
+
+    def by_category(self) -> Dict[str, Dict[str, int]]:
+        """Error counts as ``{stage: {error_type: count}}``."""
+        categories = {}
+        for (stage, error_type), count in self.counts.items():
+            categories.setdefault(stage, {})[error_type] = count
+        return categories
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, per-category counts and how many errors were left out of the samples."""
+        total = self.total
+        return {
+            'total': total,
+            'by_category': self.by_category(),
+            'sampled': len(self.samples),
+            'dropped': total - len(self.samples),
+            'spill_path': self.spill_path
+        }
+
+    def flush(self):
+        """Flush the spill file, if open."""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.flush()
+
+    def close(self):
+        """Close the spill file, if open; later errors reopen it in append mode."""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    def clear(self):
+        """Forget every count and sample; the spill file is left as is."""
+        with self._lock:
+            self.counts.clear()
+            self.samples.clear()
\ No newline at end of file
@@ -1,12 +1,145 @@
+import gzip
+import io
 import json
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 import os
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
+from .encryption_service import EncryptingWriter
 from .exceptions import APIException
+from .records import json_default
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+class RecordStreamWriter:
+    """
+    Base class for writers that emit records to a file one at a time.
+
+    With ``encrypt`` set the file holds the encrypted document, encoded as it is
+    written, so the plaintext is never materialized; gzip compression, when also
+    requested, applies before encryption.
+    """
+
+    def __init__(self, filename: str, compress: bool = False, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 encrypt: bool = False):
+        self.filename = filename
+        self.count = 0
+        self._sink = None
+        if encrypt:
+            self._sink = io.BufferedWriter(EncryptingWriter(open(filename, 'wb')), buffer_size)
+            binary = gzip.GzipFile(filename, 'wb', fileobj=self._sink) if compress else self._sink
+            self._file = io.TextIOWrapper(binary, encoding='utf-8')
+        elif compress:
+            self._file = gzip.open(filename, 'wt', encoding='utf-8')
+        else:
+            self._file = open(filename, 'w', encoding='utf-8', buffering=buffer_size)
+        self._start()
+
+    def _start(self):
+        """Write any leading document content."""
+
+    def _finish(self):
+        """Write any trailing document content."""
+
+    def write(self, record: Dict[str, Any]):
+        """Append a single record."""
+        raise NotImplementedError
+
+    def write_many(self, records: Iterable[Dict[str, Any]]):
+        """Append several records."""
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        """Finish the document and close the file."""
+        if self._file.closed:
+            return
+        try:
+            self._finish()
+        finally:
+            self._file.close()
+            # GzipFile leaves a caller-supplied fileobj open
+            if self._sink is not None:
+                self._sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+class JSONArrayWriter(RecordStreamWriter):
+    """
+    Writes records to a JSON array file one at a time.
+
+    With ``compact`` unset the output matches ``json.dump(data, f, indent=2)``.
+    """
+
+    def __init__(self, filename: str, compact: bool = False, compress: bool = False,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE, encrypt: bool = False):
+        self.compact = compact
+        super().__init__(filename, compress, buffer_size, encrypt)
+
+    def write(self, record: Dict[str, Any]):
+        """Append a single record to the array."""
+        if self.compact:
+            encoded = json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=json_default)
+            self._file.write(('[' if self.count == 0 else ',') + encoded)
+        else:
+            encoded = json.dumps(record, indent=2, ensure_ascii=False, default=json_default).replace('\n', '\n  ')
+            self._file.write(('[\n  ' if self.count == 0 else ',\n  ') + encoded)
+        self.count += 1
+
+    def _finish(self):
+        """Terminate the array."""
+        if self.count == 0:
+            self._file.write('[]')
+        else:
+            self._file.write(']' if self.compact else '\n]')
+
+class NDJSONWriter(RecordStreamWriter):
+    """Writes records as newline-delimited JSON, one compact object per line."""
+
+    def write(self, record: Dict[str, Any]):
+        """Append a single record as one line."""
+        self._file.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=json_default) + '\n')
+        self.count += 1
+
+class XMLRecordWriter(RecordStreamWriter):
+    """
+    Writes records as ``<record>`` elements of a ``<data>`` document one at a time.
+
+    The output is byte-identical to building the equivalent ElementTree and calling
+    ``tree.write(filename, encoding='utf-8', xml_declaration=True)``.
+    """
+
+    def _start(self):
+        """Write the XML declaration; the root tag is opened by the first record."""
+        self._file.write("<?xml version='1.0' encoding='utf-8'?>\n")
+
+    def write(self, record: Dict[str, Any]):
+        """Append a single record element."""
+        parts = ['<data>'] if self.count == 0 else []
+        # ElementTree self-closes an element without children or text
+        parts.append('<record>' if record else '<record />')
+        for key, value in record.items():
+            tag = str(key)
+            text = str(value) if value is not None else ""
+            if text:
+                parts.append(f"<{tag}>{escape(text)}</{tag}>")
+            else:
+                parts.append(f"<{tag} />")
+        if record:
+            parts.append('</record>')
+        self._file.write(''.join(parts))
+        self.count += 1
+
+    def _finish(self):
+        """Close the root element."""
+        self._file.write('<data />' if self.count == 0 else '</data>')
+
 class FileService:
     """Handles file operations."""
 
@@ -17,7 +150,7 @@ class FileService:
         """Save data to JSON file."""
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, indent=2, ensure_ascii=False, default=json_default)
             self.temp_files.append(filename)
             logger.info(f"Data saved to JSON file: {filename}")
             return True
@@ -25,18 +158,53 @@ class FileService:
             logger.error(f"Failed to save JSON file {filename}: {str(e)}")
             raise APIException(f"File save error: {str(e)}")
 
-    def save_to_xml(self, filename: str, data: List[Dict[str, Any]]) -> bool:
-        """Save data to XML file."""
+    def open_stream(self, filename: str, format_type: str = 'json', compact: bool = False,
+                    compress: bool = False, encrypt: bool = False) -> RecordStreamWriter:
+        """
+        Open a writer that accepts records incrementally.
+
+        ``format_type`` is 'json' (a JSON array), 'ndjson' or 'xml'. ``compact`` drops the
+        indentation of JSON arrays, ``compress`` gzips the output and ``encrypt`` stores
+        it the way EncryptionService.encrypt_stream would, readable with decrypt_stream.
+        """
+        format_type = format_type.lower()
+        try:
+            if format_type == 'json':
+                writer = JSONArrayWriter(filename, compact=compact, compress=compress, encrypt=encrypt)
+            elif format_type == 'ndjson':
+                writer = NDJSONWriter(filename, compress=compress, encrypt=encrypt)
+            elif format_type == 'xml':
+                writer = XMLRecordWriter(filename, compress=compress, encrypt=encrypt)
+            else:
+                raise APIException(f"Unsupported stream format: {format_type}")
+        except APIException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to open {format_type} file {filename}: {str(e)}")
+            raise APIException(f"File save error: {str(e)}")
+
+        self.temp_files.append(filename)
+        return writer
+
+    def save_stream(self, filename: str, records: Iterable[Dict[str, Any]], format_type: str = 'json',
+                    compact: bool = False, compress: bool = False, encrypt: bool = False) -> bool:
+        """Save records from an iterable to a file without materializing them."""
+        try:
+            with self.open_stream(filename, format_type, compact, compress, encrypt) as writer:
+                writer.write_many(records)
+            logger.info(f"Streamed {writer.count} records to {format_type} file: {filename}")
+            return True
+        except APIException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to save {format_type} file {filename}: {str(e)}")
+            raise APIException(f"File save error: {str(e)}")
+
+    def save_to_xml(self, filename: str, data: Iterable[Dict[str, Any]]) -> bool:
+        """Save data to XML file, streaming one record element at a time."""
         try:
-            root = ET.Element("data")
-            for item in data:
-                record = ET.SubElement(root, "record")
-                for key, value in item.items():
-                    elem = ET.SubElement(record, str(key))
-                    elem.text = str(value) if value is not None else ""
-
-            tree = ET.ElementTree(root)
-            tree.write(filename, encoding='utf-8', xml_declaration=True)
+            with XMLRecordWriter(filename) as writer:
+                writer.write_many(data)
             self.temp_files.append(filename)
             logger.info(f"Data saved to XML file: {filename}")
             return True
@@ -50,6 +218,8 @@ class FileService:
             return self.save_to_json(filename, data)
         elif format_type.lower() == 'xml':
             return self.save_to_xml(filename, data)
+        elif format_type.lower() == 'ndjson':
+            return self.save_stream(filename, data, 'ndjson')
         else:
             raise APIException(f"Unsupported file format: {format_type}")
 
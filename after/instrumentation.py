@@ -0,0 +1,168 @@
+import io
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class StageStats:
+    """Timing and volume counters for one pipeline stage, accumulated over its calls."""
+
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    records: int = 0
+    bytes: int = 0
+
+class StageContext:
+    """Counters a running stage fills in; handed to the ``with`` block of Instrumentation.stage."""
+
+    __slots__ = ('stage', 'records', 'bytes')
+
+    def __init__(self, stage: str, records: int = 0, bytes: int = 0):
+        self.stage = stage
+        self.records = records
+        self.bytes = bytes
+
+class PipelineHooks:
+    """
+    Base class for pipeline instrumentation hooks.
+
+    Override either method; both are no-ops here. ``on_stage_end`` receives the
+    counters of that single stage call (wall_time, cpu_time, records, bytes).
+    Exceptions raised by a hook are logged and never interrupt the pipeline.
+    """
+
+    def on_stage_start(self, stage: str):
+        """Called before a stage runs."""
+
+    def on_stage_end(self, stage: str, stats: Dict[str, Any]):
+        """Called after a stage finished, successfully or not."""
+
+class Instrumentation:
+    """
+    Per-stage wall/CPU timers, record and byte counts, hooks and opt-in profiling.
+
+    CPU time is measured with ``time.thread_time`` in the thread running the
+    stage, so it stays meaningful when sinks run concurrently; work done in
+    worker processes is not included. With ``profile`` set a cProfile capture
+    of the calling thread is taken around each run, and with ``trace_memory``
+    tracemalloc records the peak and the top allocation sites.
+    """
+
+    def __init__(self, hooks: Optional[List[PipelineHooks]] = None, profile: bool = False,
+                 trace_memory: bool = False, profile_top: int = 20, profile_output: Optional[str] = None):
+        self.hooks = list(hooks or [])
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profile_top = profile_top
+        self.profile_output = profile_output
+        self.stages = {}
+        self.profile_report = None
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: PipelineHooks):
+        """Register a hook for subsequent stages."""
+        self.hooks.append(hook)
+
+    def reset(self):
+        """Forget the counters and profile of the previous run."""
+        with self._lock:
+            self.stages = {}
+            self.profile_report = None
+
+    def _call_hooks(self, method: str, *args):
+        for hook in self.hooks:
+            try:
+                getattr(hook, method)(*args)
+            except Exception as e:
+                logger.error(f"Instrumentation hook {type(hook).__name__}.{method} failed: {str(e)}")
+
+    @contextmanager
+    def stage(self, name: str, records: int = 0, bytes: int = 0) -> Iterator[StageContext]:
+        """Time a block as one call of stage ``name``; set records/bytes on the yielded context."""
+        context = StageContext(name, records, bytes)
+        self._call_hooks('on_stage_start', name)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield context
+        finally:
+            call = {
+                'wall_time': time.perf_counter() - wall_start,
+                'cpu_time': time.thread_time() - cpu_start,
+                'records': context.records,
+                'bytes': context.bytes
+            }
+            with self._lock:
+                stats = self.stages.setdefault(name, StageStats())
+                stats.calls += 1
+                stats.wall_time += call['wall_time']
+                stats.cpu_time += call['cpu_time']
+                stats.records += call['records']
+                stats.bytes += call['bytes']
+            self._call_hooks('on_stage_end', name, call)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage counters in the order the stages first ran."""
+        with self._lock:
+            return {name: asdict(stats) for name, stats in self.stages.items()}
+
+    @contextmanager
+    def profiling(self) -> Iterator[None]:
+        """Capture cProfile and/or tracemalloc data around a run when enabled."""
+        if not self.profile and not self.trace_memory:
+            yield
+            return
+
+        profiler = None
+        started_tracing = False
+        if self.profile:
+            import cProfile
+            profiler = cProfile.Profile()
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            report = {}
+            if profiler is not None:
+                report['profile'] = self._profile_text(profiler)
+            if self.trace_memory:
+                report['memory'] = self._memory_snapshot(started_tracing)
+            self.profile_report = report
+
+    def _profile_text(self, profiler) -> str:
+        """Top functions by cumulative time, optionally dumping the raw stats file."""
+        import pstats
+        if self.profile_output:
+            profiler.dump_stats(self.profile_output)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(self.profile_top)
+        return stream.getvalue()
+
+    def _memory_snapshot(self, stop: bool) -> Dict[str, Any]:
+        """Current and peak traced memory plus the top allocation sites."""
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().statistics('lineno')[:self.profile_top]
+        if stop:
+            tracemalloc.stop()
+        return {
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'top': [{'location': str(stat.traceback), 'size': stat.size, 'count': stat.count} for stat in top]
+        }
\ No newline at end of file
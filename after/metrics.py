@@ -0,0 +1,307 @@
+import bisect
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from .instrumentation import PipelineHooks
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond commits to slow remote uploads
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    """Format a sample value; integers without a fraction, infinities as +Inf/-Inf."""
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(value)
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+class _CounterChild:
+    """One labelled series of a Counter."""
+
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        """Add ``amount``, which must not be negative."""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        with self._lock:
+            self.value += amount
+
+class _HistogramChild:
+    """One labelled series of a Histogram."""
+
+    __slots__ = ('buckets', 'counts', 'sum', '_lock')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # One slot per bucket plus the +Inf overflow; cumulated when exported
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+class _Metric:
+    """Shared label handling for counters and histograms."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: Any):
+        """
+        Return the series for these label values, in ``labelnames`` order.
+
+        Series are created on first use and cached, so callers on a hot path can
+        keep the returned object and skip the lookup entirely.
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {len(values)} value(s)")
+        key = tuple(str(value) for value in values)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+            return child
+
+    def _series(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            children = list(self._children.items())
+        return [(dict(zip(self.labelnames, values)), child) for values, child in children]
+
+class Counter(_Metric):
+    """Monotonically increasing count, optionally split by labels."""
+
+    kind = 'counter'
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1, *values: Any):
+        """Increment the series for ``values`` (none for an unlabelled counter)."""
+        self.labels(*values).inc(amount)
+
+    def value(self, *values: Any) -> float:
+        """Current value of one series; 0 if it was never incremented."""
+        child = self._children.get(tuple(str(value) for value in values))
+        return child.value if child is not None else 0
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._series():
+            yield self.name, labels, child.value
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets, optionally split by labels."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets if not math.isinf(bucket)))
+        if not self.buckets:
+            raise ValueError("Histogram needs at least one finite bucket")
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float, *values: Any):
+        """Record an observation in the series for ``values``."""
+        self.labels(*values).observe(value)
+
+    def count(self, *values: Any) -> int:
+        """Number of observations in one series."""
+        child = self._children.get(tuple(str(value) for value in values))
+        return child.count if child is not None else 0
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._series():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", dict(labels, le=_format_value(bound)), cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+class MetricsServer:
+    """Background HTTP server exposing a registry at ``/metrics``."""
+
+    def __init__(self, registry: 'MetricsRegistry', port: int, host: str = '127.0.0.1'):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics request: {format % args}")
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                                        name='metrics-server', daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    def close(self):
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+class MetricsRegistry:
+    """
+    In-process collection of counters and histograms with Prometheus text export.
+
+    Recording is an in-memory increment under a per-series lock; nothing is
+    formatted or written until the registry is rendered, written to a textfile
+    (for node_exporter's textfile collector) or scraped over HTTP.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._servers = {}
+
+    def _register(self, metric_class, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, *args, **kwargs)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter called ``name``, creating it on first use."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram called ``name``, creating it on first use."""
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get_sample_value(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """Value of one exported sample, or None if it does not exist."""
+        labels = labels or {}
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            for sample_name, sample_labels, value in metric.samples():
+                if sample_name == name and sample_labels == labels:
+                    return value
+        return None
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str):
+        """Write the rendered metrics atomically so a scraper never reads a partial file."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(temp_path, path)
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> MetricsServer:
+        """Start (once per host and port) an HTTP endpoint serving this registry."""
+        with self._lock:
+            server = self._servers.get((host, port))
+            if server is None:
+                server = MetricsServer(self, port, host)
+                self._servers[(host, port)] = server
+                if port == 0:
+                    self._servers[(host, server.port)] = server
+            return server
+
+    def stop_servers(self):
+        """Stop every HTTP endpoint started by serve."""
+        with self._lock:
+            servers = set(self._servers.values())
+            self._servers = {}
+        for server in servers:
+            server.close()
+
+# Process-wide registry used by the pipeline and its services
+REGISTRY = MetricsRegistry()
+
+RECORDS_PROCESSED = REGISTRY.counter(
+    'pipeline_records_total', 'Records that entered a pipeline stage', ('stage',))
+RECORDS_SAVED = REGISTRY.counter(
+    'pipeline_records_saved_total', 'Records successfully written to a sink', ('sink',))
+RECORDS_FAILED = REGISTRY.counter(
+    'pipeline_records_failed_total', 'Errors recorded by pipeline stage and error type', ('stage', 'error_type'))
+STAGE_DURATION = REGISTRY.histogram(
+    'pipeline_stage_duration_seconds', 'Wall time of one pipeline stage call', ('stage',))
+DATABASE_COMMIT_LATENCY = REGISTRY.histogram(
+    'database_commit_seconds', 'Time to insert and commit one database batch')
+BACKUP_UPLOAD_LATENCY = REGISTRY.histogram(
+    'backup_upload_seconds', 'Latency of a successful backup upload, retries included', ('target',))
+BACKUP_UPLOAD_FAILURES = REGISTRY.counter(
+    'backup_upload_failures_total', 'Backup uploads that failed after all retries', ('target',))
+LDAP_BIND_LATENCY = REGISTRY.histogram(
+    'ldap_bind_seconds', 'Time of one LDAP user bind', ('result',))
+
+class StageMetricsHooks(PipelineHooks):
+    """Pipeline hooks feeding per-stage record counts and durations into the metrics."""
+
+    def on_stage_end(self, stage: str, stats: Dict[str, Any]):
+        RECORDS_PROCESSED.labels(stage).inc(stats['records'])
+        STAGE_DURATION.labels(stage).observe(stats['wall_time'])
\ No newline at end of file
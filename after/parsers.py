@@ -1,7 +1,26 @@
+import codecs
+import io
 import json
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Optional, Iterator, BinaryIO, Union
 from .exceptions import ParseError
+from .records import UserRecord
+
+DEFAULT_READ_SIZE = 1 << 16
+MAX_RECORD_SIZE = 1 << 24
+
+_WHITESPACE = ' \t\n\r'
+# Characters that can continue a JSON number
+_NUMBER_CHARS = '0123456789+-.eE'
+
+@contextmanager
+def _open_source(source: Union[str, BinaryIO], read_size: int = DEFAULT_READ_SIZE) -> Iterator[BinaryIO]:
+    """Open a path for buffered binary reading, or pass a file object through."""
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        with open(source, 'rb', buffering=read_size) as f:
+            yield f
+    else:
+        yield source
 
 class DataParser:
     """Handles data parsing operations."""
@@ -17,6 +36,7 @@ class DataParser:
     @staticmethod
     def parse_xml(xml_string: str) -> Dict[str, Any]:
         """Parse XML string to dictionary."""
+        import xml.etree.ElementTree as ET
         try:
             root = ET.fromstring(xml_string)
             data = {}
@@ -26,10 +46,192 @@ class DataParser:
         except ET.ParseError as e:
             raise ParseError(f"XML parse error: {str(e)}")
 
+    @staticmethod
+    def iter_xml_records(source: Union[str, BinaryIO], record_tag: str = 'user') -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a multi-record XML document.
+
+        ``source`` is a path or binary file object. Each ``record_tag`` element is
+        yielded as a dict in the same shape as parse_xml and then cleared, and the
+        processed siblings are dropped from its parent, so memory stays bounded
+        regardless of document size or of how deeply records are nested.
+        """
+        import xml.etree.ElementTree as ET
+        root = None
+        # Open elements from the root down; records are detached from the
+        # element that actually contains them, not just from the root
+        open_elements = []
+        try:
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                    open_elements.append(elem)
+                    continue
+
+                open_elements.pop()
+                if elem.tag == record_tag:
+                    yield {child.tag: child.text for child in elem}
+                    elem.clear()
+                    if open_elements:
+                        del open_elements[-1][:]
+        except ET.ParseError as e:
+            raise ParseError(f"XML parse error: {str(e)}")
+
+    @staticmethod
+    def iter_ndjson(source: Union[str, BinaryIO], read_size: int = DEFAULT_READ_SIZE,
+                    on_error: Optional[Callable[[ParseError], None]] = None) -> Iterator[Any]:
+        """
+        Stream records from newline-delimited JSON, one line at a time.
+
+        Blank lines are skipped. A malformed line produces a ParseError naming the
+        byte offset at which the line starts; it is raised, or passed to
+        ``on_error`` when given and reading continues with the next line.
+        """
+        with _open_source(source, read_size) as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        error = ParseError(f"JSON parse error at byte {offset}: {str(e)}")
+                        if on_error is None:
+                            raise error
+                        on_error(error)
+                    else:
+                        yield record
+                offset += len(line)
+
+    @staticmethod
+    def iter_json_array(source: Union[str, BinaryIO], read_size: int = DEFAULT_READ_SIZE) -> Iterator[Any]:
+        """
+        Stream the elements of a top-level JSON array without loading the whole document.
+
+        The input is read in ``read_size`` chunks and each element is decoded as soon
+        as it is complete. Errors raise ParseError naming the byte offset of the
+        offending element; a single element larger than MAX_RECORD_SIZE is
+        treated as malformed.
+        """
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+
+        with _open_source(source, read_size) as f:
+            buffer = ''
+            pos = 0
+            base_offset = 0
+            eof = False
+
+            def fill() -> bool:
+                """Read another chunk, dropping consumed text. Returns False at EOF."""
+                nonlocal buffer, pos, base_offset, eof
+                if eof:
+                    return False
+                chunk = f.read(read_size)
+                if not chunk:
+                    eof = True
+                text = text_decoder.decode(chunk, final=eof)
+                base_offset += len(buffer[:pos].encode('utf-8'))
+                buffer = buffer[pos:] + text
+                pos = 0
+                return True
+
+            def byte_offset(index: int) -> int:
+                """Translate a buffer index into an offset in the underlying byte stream."""
+                return base_offset + len(buffer[:index].encode('utf-8'))
+
+            def skip_whitespace() -> Optional[str]:
+                """Advance past whitespace and return the next character, or None at EOF."""
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                        pos += 1
+                    if pos < len(buffer):
+                        return buffer[pos]
+                    if not fill():
+                        return None
+
+            if skip_whitespace() != '[':
+                raise ParseError(f"JSON parse error at byte {byte_offset(pos)}: expected a top-level array")
+            pos += 1
+
+            if skip_whitespace() == ']':
+                return
+
+            while True:
+                if skip_whitespace() is None:
+                    raise ParseError(f"JSON parse error at byte {byte_offset(pos)}: unterminated array")
+
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        if len(buffer) - pos <= MAX_RECORD_SIZE and fill():
+                            continue
+                        raise ParseError(f"JSON parse error at byte {byte_offset(pos)}: {e.msg}")
+                    # A value ending at the buffer edge, or a number followed by a character
+                    # that could continue it (b'1.' of b'1.5'), may go on in the next chunk.
+                    truncated = end == len(buffer) or (
+                        isinstance(value, (int, float)) and not isinstance(value, bool)
+                        and buffer[end] in _NUMBER_CHARS)
+                    if truncated and len(buffer) - pos <= MAX_RECORD_SIZE and fill():
+                        continue
+                    break
+
+                pos = end
+                yield value
+
+                separator = skip_whitespace()
+                if separator == ']':
+                    return
+                if separator != ',':
+                    raise ParseError(f"JSON parse error at byte {byte_offset(pos)}: expected ',' or ']'")
+                pos += 1
+
+    @staticmethod
+    def detect_format(source: BinaryIO) -> str:
+        """Guess the format ('json', 'ndjson' or 'xml') of a peekable binary stream."""
+        head = source.peek(DEFAULT_READ_SIZE).lstrip(codecs.BOM_UTF8).lstrip()
+        if head.startswith(b'['):
+            return 'json'
+        if head.startswith(b'{'):
+            return 'ndjson'
+        if head.startswith(b'<'):
+            return 'xml'
+        raise ParseError(f"Unrecognized input format: {head[:50]!r}")
+
+    @staticmethod
+    def iter_records(source: Union[str, BinaryIO], format_type: Optional[str] = None,
+                     record_tag: str = 'user', read_size: int = DEFAULT_READ_SIZE,
+                     on_error: Optional[Callable[[ParseError], None]] = None) -> Iterator[Any]:
+        """
+        Lazily read records from a path or binary file object.
+
+        ``format_type`` is 'json' (top-level array), 'ndjson' or 'xml'; when omitted
+        it is detected from the first non-whitespace byte. ``on_error`` receives
+        malformed NDJSON lines, which are then skipped; errors in a JSON array or
+        XML document are always raised since the rest of it cannot be read.
+        """
+        with _open_source(source, read_size) as f:
+            if format_type is None:
+                if not hasattr(f, 'peek'):
+                    f = io.BufferedReader(f, read_size)
+                format_type = DataParser.detect_format(f)
+
+            format_type = format_type.lower()
+            if format_type == 'json':
+                yield from DataParser.iter_json_array(f, read_size)
+            elif format_type == 'ndjson':
+                yield from DataParser.iter_ndjson(f, read_size, on_error)
+            elif format_type == 'xml':
+                yield from DataParser.iter_xml_records(f, record_tag)
+            else:
+                raise ParseError(f"Unsupported input format: {format_type}")
+
     @staticmethod
     def parse_data(data_input: Any) -> Optional[Dict[str, Any]]:
         """Parse input data based on its type and format."""
-        if isinstance(data_input, dict):
+        if isinstance(data_input, (dict, UserRecord)):
             return data_input
 
         if isinstance(data_input, str):
@@ -0,0 +1,83 @@
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator
+
+class UserRecord(MutableMapping):
+    """
+    Compact processed user record backed by ``__slots__``.
+
+    Behaves like the dict built by ``DataValidator.validate_user_data`` (``get``,
+    item access, ``items`` and key order all match) while storing its fields in
+    fixed slots. A field that was never assigned is absent, as a missing key would be.
+    """
+
+    FIELDS = ('id', 'name', 'email', 'phone', 'email_valid', 'phone_valid', 'created_date')
+
+    __slots__ = FIELDS
+
+    def __init__(self, id: str = '', name: str = '', email: str = '', phone: str = '',
+                 email_valid: bool = False, phone_valid: bool = False, **optional):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.phone = phone
+        self.email_valid = email_valid
+        self.phone_valid = phone_valid
+        for key, value in optional.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UserRecord':
+        """Build a record from a processed-record dict."""
+        record = cls.__new__(cls)
+        for key, value in data.items():
+            record[key] = value
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict copy of the record."""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.FIELDS:
+            raise KeyError(f"UserRecord has no field {key!r}")
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"UserRecord({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for key, value in state.items():
+            self[key] = value
+
+def json_default(obj: Any) -> Any:
+    """``default`` hook for json.dump(s) that serializes UserRecord as a plain object."""
+    if isinstance(obj, UserRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
\ No newline at end of file
@@ -1,23 +1,75 @@
 import datetime
 import logging
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class ReportAccumulator:
+    """
+    Incremental, mergeable report counters.
+
+    Counters are updated as records stream through the pipeline, so producing the
+    final report is O(1). Accumulators from separate chunks or worker processes
+    can be combined with merge. Errors are not counted here: the pipeline's
+    ErrorCollector already holds the total, which is passed to report.
+    """
+
+    total_records: int = 0
+    valid_emails: int = 0
+    valid_phones: int = 0
+
+    def add(self, record: Dict[str, Any]):
+        """Count a single processed record."""
+        self.total_records += 1
+        if record.get('email_valid', False):
+            self.valid_emails += 1
+        if record.get('phone_valid', False):
+            self.valid_phones += 1
+
+    def add_many(self, records: Iterable[Dict[str, Any]]):
+        """Count several processed records."""
+        for record in records:
+            self.add(record)
+
+    def merge(self, other: 'ReportAccumulator') -> 'ReportAccumulator':
+        """Add another accumulator's counters into this one and return self."""
+        self.total_records += other.total_records
+        self.valid_emails += other.valid_emails
+        self.valid_phones += other.valid_phones
+        return self
+
+    def report(self, error_count: int = 0) -> Dict[str, Any]:
+        """Build a report from the current counters and the run's total error count."""
+        return ReportingService.build_report(
+            total_records=self.total_records,
+            valid_emails=self.valid_emails,
+            valid_phones=self.valid_phones,
+            error_count=error_count
+        )
+
 class ReportingService:
     """Handles report generation operations."""
 
     @staticmethod
-    def generate_report(data: List[Dict[str, Any]], errors: List[str]) -> Dict[str, Any]:
-        """Generate processing report."""
+    def build_report(total_records: int, valid_emails: int, valid_phones: int, error_count: int) -> Dict[str, Any]:
+        """Build a processing report from precomputed counts."""
         report = {
-            'total_records': len(data),
-            'valid_emails': sum(1 for r in data if r.get('email_valid', False)),
-            'valid_phones': sum(1 for r in data if r.get('phone_valid', False)),
-            'error_count': len(errors),
+            'total_records': total_records,
+            'valid_emails': valid_emails,
+            'valid_phones': valid_phones,
+            'error_count': error_count,
             'generated_at': datetime.datetime.now().isoformat(),
             'generated_by': 'system'
         }
 
         logger.info(f"Generated report: {report['total_records']} records processed")
-        return report
\ No newline at end of file
+        return report
+
+    @staticmethod
+    def generate_report(data: List[Dict[str, Any]], errors: List[str]) -> Dict[str, Any]:
+        """Generate processing report by scanning the records; see ReportAccumulator for the incremental form."""
+        accumulator = ReportAccumulator()
+        accumulator.add_many(data)
+        return accumulator.report(len(errors))
\ No newline at end of file
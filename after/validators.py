@@ -1,24 +1,108 @@
+import functools
+import logging
 import re
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Iterable, Iterator, Optional, Sequence
 from .exceptions import ValidationError
+from .records import UserRecord
+
+if TYPE_CHECKING:
+    from .error_collector import ErrorCollector
+
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+SSN_PATTERN = re.compile(r'^\d{3}-\d{2}-\d{4}$')
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+
+BATCH_FIELDS = ('id', 'name', 'email', 'phone', 'email_valid', 'phone_valid')
+
+RECORD_TYPES = (dict, UserRecord)
+
+def _load_numpy():
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        logger.debug("numpy not available, using scalar column validators")
+        return None
+
+def _to_byte_array(np, values):
+    """
+    Convert a column to a fixed-width ASCII byte array; missing values become empty.
+
+    Also returns the positions of strings the byte checks cannot judge like the
+    scalar validators do: non-ASCII text, where ``\\d`` matches any Unicode digit,
+    and text with a newline, which ``$`` accepts at the end. Callers re-check
+    those rows with the scalar validator.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'S':
+        return np.ascontiguousarray(values), []
+    encoded = []
+    fallback = []
+    for index, value in enumerate(values):
+        text = str(value) if value else ''
+        if not text.isascii() or '\n' in text:
+            fallback.append(index)
+        encoded.append(text.encode('ascii', 'replace'))
+    column = np.array(encoded, dtype=bytes) if encoded else np.zeros(0, dtype='S1')
+    return column, fallback
+
+def _digit_matrix(np, column):
+    """View a byte column as a (rows, width) uint8 matrix and its ASCII-digit mask."""
+    matrix = column.view(np.uint8).reshape(len(column), column.dtype.itemsize)
+    return matrix, (matrix >= 0x30) & (matrix <= 0x39)
+
+def _luhn_valid(digits: str) -> bool:
+    """Scalar Luhn checksum over a string of digits."""
+    total = 0
+    for index, char in enumerate(reversed(digits)):
+        value = int(char)
+        if index % 2 == 1:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return total % 10 == 0
 
 class DataValidator:
     """Handles data validation operations."""
 
+    DEFAULT_CACHE_SIZE = 100000
+
+    # Process-wide cache used when validate_user_data is not given one; set below the class
+    default_cache = None
+
+    @classmethod
+    def configure_cache(cls, enabled: bool = True, max_size: int = DEFAULT_CACHE_SIZE):
+        """Replace the process-wide default cache unless it already has these settings."""
+        cache = cls.default_cache
+        if cache is None or cache.enabled != (enabled and max_size > 0) or cache.max_size != max_size:
+            cls.default_cache = ValidationCache(enabled, max_size)
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget the default cache's memoized results and reset its counters."""
+        cls.default_cache.clear()
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Any]:
+        """Return hit/miss counters of the default email and phone result caches."""
+        return cls.default_cache.stats()
+
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format."""
         if not email:
             return False
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_PATTERN.match(email) is not None
 
     @staticmethod
     def validate_phone(phone: str) -> bool:
         """Validate phone number format."""
         if not phone:
             return False
-        cleaned = re.sub(r'[^\d]', '', phone)
+        cleaned = NON_DIGIT_PATTERN.sub('', phone)
         return len(cleaned) >= 10
 
     @staticmethod
@@ -26,21 +110,28 @@ class DataValidator:
         """Validate SSN format."""
         if not ssn:
             return False
-        pattern = r'^\d{3}-\d{2}-\d{4}$'
-        return re.match(pattern, ssn) is not None
+        return SSN_PATTERN.match(ssn) is not None
 
     @staticmethod
     def validate_credit_card(cc: str) -> bool:
         """Validate credit card format."""
         if not cc:
             return False
-        cleaned = re.sub(r'[^\d]', '', cc)
+        cleaned = NON_DIGIT_PATTERN.sub('', cc)
         return len(cleaned) == 16
 
     @staticmethod
-    def validate_user_data(user_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate and process user data."""
-        if not isinstance(user_data, dict):
+    def validate_user_data(user_data: Dict[str, Any], collector: Optional['ErrorCollector'] = None,
+                           cache: Optional['ValidationCache'] = None) -> Dict[str, Any]:
+        """
+        Validate and process user data.
+
+        Invalid fields are reported as messages under ``errors``, or, when a
+        ``collector`` is given, recorded there without formatting a message and
+        ``errors`` is left empty. Email and phone results are memoized in
+        ``cache``, the process-wide default_cache when None.
+        """
+        if not isinstance(user_data, RECORD_TYPES):
             raise ValidationError("User data must be a dictionary")
 
         errors = []
@@ -49,19 +140,238 @@ class DataValidator:
             'id': str(user_data.get('id', '')),
             'name': str(user_data.get('name', '')).upper(),
             'email': str(user_data.get('email', '')).lower(),
-            'phone': re.sub(r'[^\d]', '', str(user_data.get('phone', ''))),
+            'phone': NON_DIGIT_PATTERN.sub('', str(user_data.get('phone', ''))),
         }
 
-        processed['email_valid'] = DataValidator.validate_email(processed['email'])
-        processed['phone_valid'] = DataValidator.validate_phone(processed['phone'])
+        if cache is None:
+            cache = DataValidator.default_cache
+        processed['email_valid'] = cache.email_valid(processed['email'])
+        processed['phone_valid'] = cache.phone_valid(processed['phone'])
 
-        if not processed['email_valid']:
-            errors.append(f"Invalid email: {processed['email']}")
-
-        if not processed['phone_valid']:
-            errors.append(f"Invalid phone: {processed['phone']}")
+        if collector is not None:
+            if not processed['email_valid']:
+                collector.add('validate', 'invalid_email', "Invalid email: %s", processed['email'])
+            if not processed['phone_valid']:
+                collector.add('validate', 'invalid_phone', "Invalid phone: %s", processed['phone'])
+        else:
+            if not processed['email_valid']:
+                errors.append(f"Invalid email: {processed['email']}")
+            if not processed['phone_valid']:
+                errors.append(f"Invalid phone: {processed['phone']}")
 
         return {
             'data': processed,
             'errors': errors
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def validate_user_record(user_data: Dict[str, Any], collector: Optional['ErrorCollector'] = None,
+                             cache: Optional['ValidationCache'] = None) -> Dict[str, Any]:
+        """Like validate_user_data, but returns the processed data as a compact UserRecord."""
+        result = DataValidator.validate_user_data(user_data, collector, cache)
+        processed = result['data']
+        result['data'] = UserRecord(
+            processed['id'], processed['name'], processed['email'], processed['phone'],
+            processed['email_valid'], processed['phone_valid']
+        )
+        return result
+
+    @staticmethod
+    def validate_batch(records: Iterable[Any], collector: Optional['ErrorCollector'] = None) -> Dict[str, Any]:
+        """
+        Validate many records at once, column by column.
+
+        Returns parallel lists ``id``, ``name``, ``email``, ``phone``,
+        ``email_valid`` and ``phone_valid`` with one entry per dict record, the
+        input positions of records that were not dicts under ``rejected``, and
+        ``errors`` in the same order the per-record path would produce them.
+        As in validate_user_data, a ``collector`` receives the errors instead.
+        """
+        records = records if isinstance(records, list) else list(records)
+        accepted = [r for r in records if isinstance(r, RECORD_TYPES)]
+
+        ids = [str(r.get('id', '')) for r in accepted]
+        names = [str(r.get('name', '')).upper() for r in accepted]
+        emails = [str(r.get('email', '')).lower() for r in accepted]
+
+        strip_non_digits = NON_DIGIT_PATTERN.sub
+        phones = [strip_non_digits('', str(r.get('phone', ''))) for r in accepted]
+
+        match_email = EMAIL_PATTERN.match
+        email_valid = [match_email(email) is not None for email in emails]
+        phone_valid = [len(phone) >= 10 for phone in phones]
+
+        errors = []
+        rejected = []
+        j = 0
+        for i, record in enumerate(records):
+            if not isinstance(record, RECORD_TYPES):
+                rejected.append(i)
+                if collector is not None:
+                    collector.add('validate', 'ValidationError', "User data must be a dictionary")
+                else:
+                    errors.append("User data must be a dictionary")
+                continue
+            if collector is not None:
+                if not email_valid[j]:
+                    collector.add('validate', 'invalid_email', "Invalid email: %s", emails[j])
+                if not phone_valid[j]:
+                    collector.add('validate', 'invalid_phone', "Invalid phone: %s", phones[j])
+            else:
+                if not email_valid[j]:
+                    errors.append(f"Invalid email: {emails[j]}")
+                if not phone_valid[j]:
+                    errors.append(f"Invalid phone: {phones[j]}")
+            j += 1
+
+        return {
+            'id': ids,
+            'name': names,
+            'email': emails,
+            'phone': phones,
+            'email_valid': email_valid,
+            'phone_valid': phone_valid,
+            'rejected': rejected,
+            'errors': errors
+        }
+
+    @staticmethod
+    def iter_batch_records(batch: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield per-record dicts, as built by validate_user_data, from a validate_batch result."""
+        for values in zip(batch['id'], batch['name'], batch['email'], batch['phone'],
+                          batch['email_valid'], batch['phone_valid']):
+            yield dict(zip(BATCH_FIELDS, values))
+
+    @staticmethod
+    def validate_phone_column(phones: Sequence[Any]):
+        """
+        Validate a whole column of phone numbers at once.
+
+        Accepts a sequence of strings or a numpy fixed-width bytes array and
+        returns a boolean numpy array (a list of bools without numpy). Results
+        match validate_phone; strings the byte checks cannot judge are passed to it.
+        """
+        np = _load_numpy()
+        if np is None:
+            return [DataValidator.validate_phone(phone) for phone in phones]
+
+        column, fallback = _to_byte_array(np, phones)
+        _, is_digit = _digit_matrix(np, column)
+        valid = is_digit.sum(axis=1) >= 10
+        for index in fallback:
+            valid[index] = DataValidator.validate_phone(phones[index])
+        return valid
+
+    @staticmethod
+    def validate_ssn_column(ssns: Sequence[Any]):
+        """Validate a whole column of SSNs (``ddd-dd-dddd``) at once; see validate_phone_column."""
+        np = _load_numpy()
+        if np is None:
+            return [DataValidator.validate_ssn(ssn) for ssn in ssns]
+
+        column, fallback = _to_byte_array(np, ssns)
+        if column.dtype.itemsize < 11:
+            column = column.astype('S11')
+        matrix, is_digit = _digit_matrix(np, column)
+
+        digit_positions = [0, 1, 2, 4, 5, 7, 8, 9, 10]
+        valid = is_digit[:, digit_positions].all(axis=1)
+        valid &= (matrix[:, 3] == ord('-')) & (matrix[:, 6] == ord('-'))
+        if matrix.shape[1] > 11:
+            valid &= (matrix[:, 11:] == 0).all(axis=1)
+        for index in fallback:
+            valid[index] = DataValidator.validate_ssn(ssns[index])
+        return valid
+
+    @staticmethod
+    def validate_credit_card_column(cards: Sequence[Any], luhn: bool = False):
+        """
+        Validate a whole column of card numbers at once; see validate_phone_column.
+
+        A card is valid when it has exactly 16 digits, matching validate_credit_card.
+        With ``luhn`` set the Luhn checksum must also hold.
+        """
+        np = _load_numpy()
+        if np is None:
+            valid = [DataValidator.validate_credit_card(card) for card in cards]
+            if luhn:
+                valid = [ok and _luhn_valid(NON_DIGIT_PATTERN.sub('', card)) for ok, card in zip(valid, cards)]
+            return valid
+
+        column, fallback = _to_byte_array(np, cards)
+        matrix, is_digit = _digit_matrix(np, column)
+        valid = is_digit.sum(axis=1) == 16
+        if luhn:
+            values = np.where(is_digit, matrix.astype(np.int16) - 0x30, 0)
+            rank_from_right = np.cumsum(is_digit[:, ::-1], axis=1)[:, ::-1]
+            doubled = is_digit & (rank_from_right % 2 == 0)
+            values = np.where(doubled, values * 2, values)
+            values = np.where(values > 9, values - 9, values)
+            valid &= values.sum(axis=1) % 10 == 0
+
+        for index in fallback:
+            card = cards[index]
+            valid[index] = DataValidator.validate_credit_card(card) and (
+                not luhn or _luhn_valid(NON_DIGIT_PATTERN.sub('', card)))
+        return valid
+
+class ValidationCache:
+    """
+    Memoized email and phone checks for validate_user_data.
+
+    Each check is wrapped in its own functools.lru_cache, whose C lookup is
+    cheaper than the regex it skips. Instances are independent, so each
+    DataProcessor keeps its own settings and results. A pickled cache (sent to
+    a worker process) carries only its settings and starts empty.
+    """
+
+    def __init__(self, enabled: bool = True, max_size: int = DataValidator.DEFAULT_CACHE_SIZE):
+        self.enabled = enabled and max_size > 0
+        self.max_size = max_size
+        if self.enabled:
+            self.email_valid = functools.lru_cache(maxsize=max_size)(DataValidator.validate_email)
+            self.phone_valid = functools.lru_cache(maxsize=max_size)(DataValidator.validate_phone)
+        else:
+            self.email_valid = DataValidator.validate_email
+            self.phone_valid = DataValidator.validate_phone
+
+    def __reduce__(self):
+        return ValidationCache, (self.enabled, self.max_size)
+
+    def clear(self):
+        """Forget memoized results and reset the counters."""
+        if self.enabled:
+            self.email_valid.cache_clear()
+            self.phone_valid.cache_clear()
+
+    @staticmethod
+    def _check_stats(check) -> Dict[str, Any]:
+        """
+        Counters of one memoized check.
+
+        lru_cache does not count evictions, so ``estimated_evictions`` is derived
+        as misses minus the entries still held; every miss inserts an entry, but
+        concurrent calls can insert the same value twice, so it may overcount.
+        """
+        info = check.cache_info() if hasattr(check, 'cache_info') else None
+        if info is None:
+            return {'hits': 0, 'misses': 0, 'estimated_evictions': 0, 'size': 0, 'max_size': 0, 'hit_rate': 0.0}
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'estimated_evictions': info.misses - info.currsize,
+            'size': info.currsize,
+            'max_size': info.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters of the email and phone result caches."""
+        return {
+            'enabled': self.enabled,
+            'email': self._check_stats(self.email_valid),
+            'phone': self._check_stats(self.phone_valid)
+        }
+
+DataValidator.configure_cache()
\ No newline at end of file
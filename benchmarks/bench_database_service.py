@@ -0,0 +1,102 @@
+"""
+Benchmark DatabaseService.save_user_data against a SQLite stand-in.
+
+Compares the legacy row-at-a-time insert loop with the chunked executemany
+path and prints rows/sec for each dataset size.
+
+Usage:
+    python benchmarks/bench_database_service.py [--sizes 10000 100000 1000000] [--batch-size 1000]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from after.config import DatabaseConfig
+from after.database_service import DatabaseService
+
+CREATE_TABLE = '''
+CREATE TABLE users (
+    id TEXT,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    created_date TEXT,
+    email_valid INTEGER,
+    phone_valid INTEGER
+)
+'''
+
+
+def make_records(count):
+    """Generate synthetic processed records."""
+    return [{
+        'id': str(i),
+        'name': f'USER {i}',
+        'email': f'user{i}@example.com',
+        'phone': f'555{i:07d}',
+        'created_date': '2024-01-01T00:00:00',
+        'email_valid': True,
+        'phone_valid': True
+    } for i in range(count)]
+
+
+def new_connection():
+    conn = sqlite3.connect(':memory:')
+    conn.execute(CREATE_TABLE)
+    return conn
+
+
+def bench_legacy(records):
+    """Time the original one-execute-per-row loop with a single commit."""
+    conn = new_connection()
+    cursor = conn.cursor()
+    query = "INSERT INTO users (id, name, email, phone, created_date, email_valid, phone_valid) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    start = time.perf_counter()
+    for record in records:
+        cursor.execute(query, DatabaseService._record_params(record))
+    conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def bench_bulk(records, batch_size):
+    """Time the chunked executemany path of DatabaseService."""
+    service = DatabaseService(DatabaseConfig(
+        driver="SQLite", server=":memory:", database="bench",
+        username="bench", password="bench", batch_size=batch_size
+    ))
+    conn = new_connection()
+    with patch.object(service, '_get_connection', return_value=conn):
+        start = time.perf_counter()
+        service.save_user_data(records)
+        elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{'records':>10} {'legacy rows/s':>15} {'bulk rows/s':>15} {'speedup':>8}")
+    for size in args.sizes:
+        records = make_records(size)
+        legacy = bench_legacy(records)
+        bulk = bench_bulk(records, args.batch_size)
+        print(f"{size:>10} {size / legacy:>15,.0f} {size / bulk:>15,.0f} {legacy / bulk:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+End-to-end DataProcessor benchmark suite.
+
+Times each pipeline stage (parse, validate, SQLite save, JSON and XML file
+output, report) and the full process_everything run on seeded synthetic input,
+prints records/sec per stage and size, and optionally writes the results as
+JSON for comparison between releases.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 1000 100000 1000000] [--stages parse validate ...]
+                                        [--invalid-ratio 0.1] [--repeat 1] [--output results.json]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from after.data_processor import DataProcessor
+from bench_database_service import new_connection
+from synthetic import generate_inputs
+
+STAGES = ('parse', 'validate', 'db_sqlite', 'file_json', 'file_xml', 'report', 'process_everything')
+
+
+def timed(func, repeat, processor):
+    """Best wall-clock time of ``repeat`` calls to ``func``, each starting with cold email/phone caches."""
+    best = None
+    for _ in range(repeat):
+        processor.validation_cache.clear()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def stage_runners(inputs, workdir):
+    """Build a callable per stage; stages after parsing reuse the earlier stage output."""
+    processor = DataProcessor()
+    parsed = processor.parse_input_data(inputs)
+    processed = processor.validate_and_process_data(parsed)
+
+    def save_sqlite():
+        conn = new_connection()
+        with patch.object(processor.database_service, '_get_connection', return_value=conn):
+            processor.database_service.save_user_data(processed)
+        conn.close()
+
+    def run_pipeline():
+        fresh = DataProcessor()
+        conn = new_connection()
+        with patch.object(fresh.database_service, '_get_connection', return_value=conn):
+            fresh.process_everything(inputs, output_file=os.path.join(workdir, 'pipeline.json'))
+        conn.close()
+
+    return processor, {
+        'parse': (len(inputs), lambda: processor.parse_input_data(inputs)),
+        'validate': (len(parsed), lambda: processor.validate_and_process_data(parsed)),
+        'db_sqlite': (len(processed), save_sqlite),
+        'file_json': (len(processed), lambda: processor.file_service.save_to_file(
+            os.path.join(workdir, 'out.json'), processed, 'json')),
+        'file_xml': (len(processed), lambda: processor.file_service.save_to_file(
+            os.path.join(workdir, 'out.xml'), processed, 'xml')),
+        'report': (len(processed), lambda: processor.generate_report(processed)),
+        'process_everything': (len(inputs), run_pipeline),
+    }
+
+
+def git_revision():
+    """Current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(__file__) or '.',
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--invalid-ratio', type=float, default=0.1)
+    parser.add_argument('--unparseable-ratio', type=float, default=0.01)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help='report the best of N runs')
+    parser.add_argument('--output', help='write machine-readable results to this JSON file')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    results = []
+    print(f"{'records':>10} {'stage':>20} {'seconds':>10} {'records/s':>14}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            inputs = generate_inputs(size, invalid_ratio=args.invalid_ratio,
+                                     unparseable_ratio=args.unparseable_ratio, seed=args.seed)
+            processor, runners = stage_runners(inputs, workdir)
+            for stage in args.stages:
+                count, func = runners[stage]
+                seconds = timed(func, args.repeat, processor)
+                rate = count / seconds if seconds else None
+                results.append({'stage': stage, 'size': size, 'records': count,
+                                'seconds': seconds, 'records_per_sec': rate})
+                print(f"{size:>10} {stage:>20} {seconds:>10.4f} {rate or 0:>14,.0f}")
+
+    if args.output:
+        document = {
+            'meta': {
+                'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                'git_revision': git_revision(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'invalid_ratio': args.invalid_ratio,
+                'unparseable_ratio': args.unparseable_ratio,
+                'repeat': args.repeat
+            },
+            'results': results
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
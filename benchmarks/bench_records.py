@@ -0,0 +1,58 @@
+"""
+Measure the memory held by processed records as dicts versus UserRecord.
+
+Usage:
+    python benchmarks/bench_records.py [--count 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from after.records import UserRecord
+
+
+def build(count, compact):
+    """Build ``count`` processed records sharing no string objects between them."""
+    records = []
+    for i in range(count):
+        fields = (str(i), f'USER {i}', f'user{i}@example.com', f'555{i:07d}', True, True)
+        if compact:
+            record = UserRecord(*fields)
+        else:
+            record = dict(zip(UserRecord.FIELDS, fields))
+        record['created_date'] = f'2024-01-01T00:00:{i % 60:02d}'
+        records.append(record)
+    return records
+
+
+def measure(count, compact):
+    tracemalloc.start()
+    records = build(count, compact)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    as_dicts = measure(args.count, compact=False)
+    as_records = measure(args.count, compact=True)
+    scale = 1_000_000 / args.count
+
+    print(f"records: {args.count}")
+    print(f"dict:       {as_dicts / 2**20:8.1f} MiB")
+    print(f"UserRecord: {as_records / 2**20:8.1f} MiB")
+    print(f"saving per million records: {(as_dicts - as_records) * scale / 2**20:.1f} MiB "
+          f"({(as_dicts - as_records) / as_dicts:.0%})")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Measure DataProcessor startup: construction with lazy services and a cached
+config versus reloading the config and touching every service, plus a cold
+import of the package in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 1000]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+
+from after.config import get_config, load_config
+from after.data_processor import DataProcessor
+
+
+def time_construction(repeat, eager):
+    """Average seconds to build a processor, optionally reloading config and touching every service."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        processor = DataProcessor(config=load_config() if eager else None)
+        if eager:
+            for name in DataProcessor.SERVICES:
+                getattr(processor, name)
+    return (time.perf_counter() - start) / repeat
+
+
+def time_cold_start():
+    """Seconds for a fresh interpreter to import the package and build a processor."""
+    code = "from after.data_processor import DataProcessor; DataProcessor()"
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=1000)
+    args = parser.parse_args()
+
+    get_config()
+    eager = time_construction(args.repeat, eager=True)
+    lazy = time_construction(args.repeat, eager=False)
+
+    print(f"eager (reload config, build all services): {eager * 1e6:9.1f} us")
+    print(f"lazy  (cached config, no services):        {lazy * 1e6:9.1f} us")
+    print(f"speedup: {eager / lazy:.1f}x")
+    print(f"cold start (import + construct): {time_cold_start() * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
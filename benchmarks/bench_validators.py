@@ -0,0 +1,130 @@
+"""
+Benchmark DataValidator.validate_batch against the per-record path, and the
+column validators for phone, SSN and card numbers against scalar loops, and
+the memoized email/phone checks against uncached validation.
+
+Usage:
+    python benchmarks/bench_validators.py [--sizes 10000 100000 1000000] [--columns] [--cache]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from after.exceptions import ValidationError
+from after.validators import DataValidator
+
+
+def make_records(count, seed=0):
+    """Generate raw user records with roughly 10% invalid emails and phones."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        email = f'User{i}@Example.com' if rng.random() > 0.1 else f'user{i}-at-example'
+        phone = f'({rng.randint(200, 999)}) 555-{i % 10000:04d}' if rng.random() > 0.1 else '555'
+        records.append({'id': i, 'name': f'user {i}', 'email': email, 'phone': phone})
+    return records
+
+
+def per_record(records):
+    """Validate one record at a time, as DataProcessor does."""
+    processed = []
+    errors = []
+    for record in records:
+        try:
+            result = DataValidator.validate_user_data(record)
+        except ValidationError as e:
+            errors.append(str(e))
+            continue
+        processed.append(result['data'])
+        errors.extend(result['errors'])
+    return processed, errors
+
+
+def bench_columns(size):
+    """Time scalar loops against the column validators on fixed-width byte columns."""
+    import numpy as np
+
+    phones = [f'(555) 123-{i % 10000:04d}' for i in range(size)]
+    ssns = [f'{i % 1000:03d}-45-{i % 10000:04d}' for i in range(size)]
+    cards = [f'4111 1111 {i % 10000:04d} 1111' for i in range(size)]
+    columns = [
+        ('phone', DataValidator.validate_phone, DataValidator.validate_phone_column, phones),
+        ('ssn', DataValidator.validate_ssn, DataValidator.validate_ssn_column, ssns),
+        ('card', DataValidator.validate_credit_card, DataValidator.validate_credit_card_column, cards),
+    ]
+
+    for name, scalar, column, values in columns:
+        byte_column = np.array([v.encode('ascii') for v in values])
+
+        start = time.perf_counter()
+        [scalar(v) for v in values]
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        column(byte_column)
+        vectorized = time.perf_counter() - start
+
+        print(f"{size:>10} {name:>6} {single:>10.3f}s {vectorized:>10.3f}s {single / vectorized:>8.1f}x")
+
+
+def bench_cache(size, distinct=200):
+    """Time validate_user_data with and without memoization on records repeating ``distinct`` values."""
+    records = [{'id': i, 'name': 'user', 'email': f'User{i % distinct}@Example.com',
+                'phone': f'(555) 123-{i % distinct:04d}'} for i in range(size)]
+
+    timings = {}
+    for enabled in (False, True):
+        DataValidator.configure_cache(enabled=enabled)
+        DataValidator.clear_cache()
+        start = time.perf_counter()
+        for record in records:
+            DataValidator.validate_user_data(record)
+        timings[enabled] = time.perf_counter() - start
+    hit_rate = DataValidator.cache_stats()['email']['hit_rate']
+    DataValidator.configure_cache()
+
+    print(f"{size:>10} {timings[False]:>10.3f}s {timings[True]:>10.3f}s {hit_rate:>9.1%} "
+          f"{timings[False] / timings[True]:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--columns', action='store_true', help='benchmark the numpy column validators')
+    parser.add_argument('--cache', action='store_true', help='benchmark memoized against uncached validation')
+    args = parser.parse_args()
+
+    if args.cache:
+        print(f"{'records':>10} {'uncached':>11} {'cached':>11} {'hit rate':>9} {'speedup':>9}")
+        for size in args.sizes:
+            bench_cache(size)
+        return
+
+    if args.columns:
+        print(f"{'records':>10} {'column':>6} {'scalar':>11} {'vectorized':>11} {'speedup':>9}")
+        for size in args.sizes:
+            bench_columns(size)
+        return
+
+    print(f"{'records':>10} {'per-record s':>13} {'batch s':>9} {'speedup':>8}")
+    for size in args.sizes:
+        records = make_records(size)
+
+        start = time.perf_counter()
+        per_record(records)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        DataValidator.validate_batch(records)
+        batch = time.perf_counter() - start
+
+        print(f"{size:>10} {single:>13.3f} {batch:>9.3f} {single / batch:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Seeded synthetic input generator for the pipeline benchmarks.
+
+Produces the raw inputs DataProcessor accepts (dicts, JSON strings and XML
+strings) in a tunable mix, with a configurable share of records that fail
+validation and of items that cannot be parsed at all. The same seed always
+produces the same inputs.
+"""
+
+import json
+import random
+from typing import Any, Dict, Iterator, List, Sequence
+
+FORMATS = ('dict', 'json', 'xml')
+
+
+def make_record(i: int, rng: random.Random, invalid_ratio: float) -> Dict[str, str]:
+    """Build one raw user record; roughly ``invalid_ratio`` of them have a bad email or phone."""
+    email = f'user{i}@example.com'
+    phone = f'({rng.randint(200, 999)}) 555-{i % 10000:04d}'
+    if rng.random() < invalid_ratio:
+        if rng.random() < 0.5:
+            email = f'user{i}-at-example'
+        else:
+            phone = str(rng.randint(100, 99999))
+    return {'id': str(i), 'name': f'user {i}', 'email': email, 'phone': phone}
+
+
+def encode(record: Dict[str, str], fmt: str) -> Any:
+    """Render a record as a dict, JSON string or XML string."""
+    if fmt == 'json':
+        return json.dumps(record)
+    if fmt == 'xml':
+        fields = ''.join(f'<{key}>{value}</{key}>' for key, value in record.items())
+        return f'<user>{fields}</user>'
+    return record
+
+
+def iter_inputs(count: int, invalid_ratio: float = 0.1, unparseable_ratio: float = 0.01,
+                formats: Sequence[str] = FORMATS, weights: Sequence[float] = None,
+                seed: int = 0) -> Iterator[Any]:
+    """Lazily yield ``count`` raw inputs in the requested format mix."""
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown input formats: {sorted(unknown)}")
+
+    rng = random.Random(seed)
+    for i in range(count):
+        if rng.random() < unparseable_ratio:
+            yield f'plain text {i}'
+            continue
+        fmt = rng.choices(formats, weights)[0]
+        yield encode(make_record(i, rng, invalid_ratio), fmt)
+
+
+def generate_inputs(count: int, **options) -> List[Any]:
+    """Materialize iter_inputs as a list."""
+    return list(iter_inputs(count, **options))
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pytest
 import sys
 import os
+import types
 from unittest.mock import Mock, patch
 
 # Add the after directory to the Python path
@@ -132,4 +133,130 @@ class TestAuthenticationService:
         assert result is False
         
         # Verify that search was called (implementation should escape the input)
-        mock_conn.search_s.assert_called()
\ No newline at end of file
+        mock_conn.search_s.assert_called()
+
+class FakeLDAPConnection:
+    """Minimal stand-in for an ldap.ldapobject.LDAPObject."""
+
+    def __init__(self, directory, server):
+        self.directory = directory
+        self.server = server
+        self.search_count = 0
+        self.unbound = False
+
+    def simple_bind_s(self, who, cred):
+        if self.directory.passwords.get(who) != cred:
+            raise self.directory.module.INVALID_CREDENTIALS("Invalid credentials")
+
+    def search_s(self, base, scope, filterstr):
+        self.search_count += 1
+        self.directory.searches += 1
+        uid = filterstr[len("(uid="):-1]
+        dn = f"uid={uid},ou=users,{base}"
+        return [(dn, {"uid": [uid]})] if dn in self.directory.passwords else []
+
+    def unbind(self):
+        self.unbound = True
+
+
+class FakeLDAPDirectory:
+    """Fake python-ldap module backed by an in-memory password table."""
+
+    def __init__(self, passwords):
+        self.passwords = passwords
+        self.connections = []
+        self.searches = 0
+        self.module = types.ModuleType('ldap')
+        self.module.SCOPE_SUBTREE = 2
+        self.module.INVALID_CREDENTIALS = type('INVALID_CREDENTIALS', (Exception,), {})
+        self.module.initialize = self.initialize
+
+    def initialize(self, server):
+        conn = FakeLDAPConnection(self, server)
+        self.connections.append(conn)
+        return conn
+
+
+class TestAuthenticationServiceCaching:
+    """Test cases for LDAP connection reuse and authentication caches."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.ldap_config = LDAPConfig(
+            server="ldap://test-server:389",
+            username="cn=service,dc=test,dc=com",
+            password="servicepass",
+            base_dn="dc=test,dc=com"
+        )
+        self.directory = FakeLDAPDirectory({
+            "cn=service,dc=test,dc=com": "servicepass",
+            "uid=alice,ou=users,dc=test,dc=com": "alicepass",
+        })
+        self.modules = patch.dict(sys.modules, {'ldap': self.directory.module})
+        self.modules.start()
+        self.auth_service = AuthenticationService(self.ldap_config, "test_admin_pass")
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.auth_service.close_connection()
+        self.modules.stop()
+
+    def test_connections_reused_across_logins(self):
+        """Test that repeated logins do not open new LDAP connections."""
+        for _ in range(5):
+            assert self.auth_service.authenticate_user("alice", "alicepass") is True
+            self.auth_service.clear_cache()
+
+        assert len(self.directory.connections) == 2
+
+    def test_dn_lookup_cached(self):
+        """Test that the uid to DN search is skipped for repeat users."""
+        assert self.auth_service.authenticate_user("alice", "alicepass") is True
+        assert self.auth_service.authenticate_user("alice", "wrongpass") is False
+        assert self.auth_service.authenticate_user("alice", "alicepass") is True
+
+        assert self.directory.searches == 1
+        assert self.auth_service.cache_stats()['dn_cache']['hits'] >= 1
+
+    def test_positive_result_cached(self):
+        """Test that a successful login is served from the result cache."""
+        self.auth_service.authenticate_user("alice", "alicepass")
+        self.directory.passwords.clear()
+
+        assert self.auth_service.authenticate_user("alice", "alicepass") is True
+        assert self.auth_service.cache_stats()['auth_cache']['hits'] == 1
+
+    def test_negative_result_cached_for_unknown_user(self):
+        """Test that a missing user is cached as a failed login."""
+        assert self.auth_service.authenticate_user("mallory", "guess") is False
+        assert self.auth_service.authenticate_user("mallory", "guess") is False
+
+        assert self.directory.searches == 1
+        stats = self.auth_service.cache_stats()['auth_cache']
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_cache_does_not_accept_other_password(self):
+        """Test that a cached success is keyed on the password too."""
+        assert self.auth_service.authenticate_user("alice", "alicepass") is True
+        assert self.auth_service.authenticate_user("alice", "not-alicepass") is False
+
+    def test_result_cache_evicts_least_recently_used(self):
+        """Test that the result cache stays within its configured size."""
+        self.ldap_config.auth_cache_size = 2
+        service = AuthenticationService(self.ldap_config, "test_admin_pass")
+
+        for i in range(5):
+            service.authenticate_user(f"user{i}", "password")
+
+        stats = service.cache_stats()['auth_cache']
+        assert stats['size'] == 2
+        assert stats['evictions'] == 3
+        service.close_connection()
+
+    def test_close_connection_unbinds_pooled_connections(self):
+        """Test that closing the service unbinds every pooled connection."""
+        self.auth_service.authenticate_user("alice", "alicepass")
+        self.auth_service.close_connection()
+
+        assert all(conn.unbound for conn in self.directory.connections)
\ No newline at end of file
@@ -0,0 +1,512 @@
+import pytest
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.backup_service import BackupService
+from after.backup_manifest import BackupManifest, rebuild_snapshot
+from after import chunk_codec
+from after.config import BackupConfig, APIConfig, load_config
+from after.data_processor import DataProcessor
+from after.exceptions import BackupError
+from after.metrics import BACKUP_UPLOAD_FAILURES, BACKUP_UPLOAD_LATENCY
+
+
+RECORDS = [{'id': '1', 'name': 'JOHN DOE', 'email': 'john@example.com', 'email_valid': True}]
+
+
+class BackupStandIn:
+    """Local HTTP server that records backup uploads."""
+
+    def __init__(self, delay=0.0, fail_first=0, status=503, fail_requests=(), trickle=0.0):
+        self.delay = delay
+        self.trickle = trickle
+        self.fail_first = fail_first
+        self.fail_requests = set(fail_requests)
+        self.status = status
+        self.requests = []
+        self.chunks = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                if self.headers['Content-Type'] == 'application/json':
+                    stand_in.requests.append((self.client_address, json.loads(body)))
+                else:
+                    stand_in.requests.append((self.client_address, None))
+                    stand_in.chunks.append((dict(self.headers), body))
+                time.sleep(stand_in.delay)
+                count = len(stand_in.requests)
+                failing = count <= stand_in.fail_first or count in stand_in.fail_requests
+                status = stand_in.status if failing else 200
+                body = b'x' * 20 if stand_in.trickle else b''
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                try:
+                    for byte in range(len(body)):
+                        self.wfile.write(body[byte:byte + 1])
+                        self.wfile.flush()
+                        time.sleep(stand_in.trickle)
+                except OSError:
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/backup"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class TestBackupService:
+    """Test cases for concurrent BackupService uploads."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.stand_ins = []
+        self.api_config = APIConfig(api_key="test-api-key", secret_key="s", encryption_key="e")
+        self.service = None
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        if self.service is not None:
+            self.service.close()
+        for stand_in in self.stand_ins:
+            stand_in.stop()
+
+    def make_service(self, *stand_ins, urls=(), **options):
+        self.stand_ins.extend(stand_ins)
+        options.setdefault('retry_backoff', 0.01)
+        config = BackupConfig(urls=[s.url for s in stand_ins] + list(urls), simulate=False, **options)
+        self.service = BackupService(config, self.api_config)
+        return self.service
+
+    def test_uploads_payload_to_every_target(self):
+        """Test that every target receives the JSON backup payload."""
+        first, second = BackupStandIn(), BackupStandIn()
+        service = self.make_service(first, second)
+
+        assert service.backup_data(RECORDS) is True
+
+        for stand_in in (first, second):
+            assert len(stand_in.requests) == 1
+            payload = stand_in.requests[0][1]
+            assert payload['data'] == RECORDS
+            assert payload['api_key'] == "test-api-key"
+
+    def test_targets_upload_concurrently(self):
+        """Test that latency follows the slowest target rather than the sum."""
+        service = self.make_service(*(BackupStandIn(delay=0.2) for _ in range(3)))
+
+        start = time.perf_counter()
+        service.backup_data(RECORDS)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+
+    def test_slow_target_times_out(self):
+        """Test that a target exceeding its timeout fails without failing the backup."""
+        fast, slow = BackupStandIn(), BackupStandIn(delay=0.4)
+        service = self.make_service(fast, slow, timeout=0.1, max_retries=0)
+
+        assert service.backup_data(RECORDS) is True
+
+        stats = service.latency_stats()
+        assert stats[fast.url]['uploads'] == 1
+        assert stats[slow.url]['uploads'] == 0
+        assert stats[slow.url]['failures'] == 1
+
+    def test_trickling_target_hits_deadline(self):
+        """Test that a target sending its response byte by byte is cut off at the upload deadline."""
+        trickling = BackupStandIn(trickle=0.1)
+        service = self.make_service(trickling, timeout=1.0, deadline=0.3, max_retries=3)
+
+        with pytest.raises(BackupError, match="deadline"):
+            service.backup_data(RECORDS)
+
+        assert len(trickling.requests) == 1
+        assert service.latency_stats()[trickling.url]['failures'] == 1
+
+    def test_retryable_status_is_retried(self):
+        """Test that 5xx responses are retried until the target accepts the upload."""
+        flaky = BackupStandIn(fail_first=2, status=503)
+        service = self.make_service(flaky, max_retries=2)
+
+        assert service.backup_data(RECORDS) is True
+
+        assert len(flaky.requests) == 3
+        assert service.latency_stats()[flaky.url]['retries'] == 2
+
+    def test_client_error_not_retried(self):
+        """Test that a rejected payload fails immediately."""
+        rejecting = BackupStandIn(fail_first=10, status=400)
+        service = self.make_service(rejecting, max_retries=3)
+
+        with pytest.raises(BackupError, match="HTTP 400"):
+            service.backup_data(RECORDS)
+        assert len(rejecting.requests) == 1
+
+    def test_upload_metrics_recorded(self):
+        """Test that upload latencies and failures are recorded per target."""
+        accepting, rejecting = BackupStandIn(), BackupStandIn(fail_first=10, status=400)
+        service = self.make_service(accepting, rejecting)
+
+        assert service.backup_data(RECORDS) is True
+
+        assert BACKUP_UPLOAD_LATENCY.count(accepting.url) == 1
+        assert BACKUP_UPLOAD_LATENCY.count(rejecting.url) == 0
+        assert BACKUP_UPLOAD_FAILURES.value(rejecting.url) == 1
+
+    def test_upload_metrics_disabled(self):
+        """Test that a service built with metrics disabled records no upload metrics."""
+        accepting, rejecting = BackupStandIn(), BackupStandIn(fail_first=10, status=400)
+        self.stand_ins.extend([accepting, rejecting])
+        config = BackupConfig(urls=[accepting.url, rejecting.url], simulate=False, max_retries=0)
+        self.service = BackupService(config, self.api_config, metrics_enabled=False)
+
+        assert self.service.backup_data(RECORDS) is True
+
+        assert BACKUP_UPLOAD_LATENCY.count(accepting.url) == 0
+        assert BACKUP_UPLOAD_FAILURES.value(rejecting.url) == 0
+
+    def test_connection_kept_alive_between_backups(self):
+        """Test that consecutive backups reuse the same connection."""
+        stand_in = BackupStandIn()
+        service = self.make_service(stand_in)
+
+        service.backup_data(RECORDS)
+        service.backup_data(RECORDS)
+
+        assert stand_in.requests[0][0] == stand_in.requests[1][0]
+        stats = service.latency_stats()[stand_in.url]
+        assert stats['uploads'] == 2
+        assert stats['min_latency'] <= stats['avg_latency'] <= stats['max_latency']
+
+    def test_all_targets_failing_raises(self):
+        """Test that a backup with no reachable target raises BackupError."""
+        service = self.make_service(urls=['ftp://example.com/backup'], max_retries=0)
+
+        with pytest.raises(BackupError, match="All backup operations failed"):
+            service.backup_data(RECORDS)
+
+    def test_simulated_backup_sends_nothing(self):
+        """Test that the default simulate mode makes no requests."""
+        stand_in = BackupStandIn()
+        self.stand_ins.append(stand_in)
+        service = BackupService(BackupConfig(urls=[stand_in.url]), self.api_config)
+
+        assert service.backup_data(RECORDS) is True
+        assert stand_in.requests == []
+
+
+class TestIncrementalBackup:
+    """Test cases for manifest-based delta backups."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.stand_in = BackupStandIn()
+        self.api_config = APIConfig(api_key="test-api-key", secret_key="s", encryption_key="e")
+        self.records = [
+            {'id': str(i), 'name': f'USER {i}', 'email': f'user{i}@example.com', 'created_date': '2024-01-01'}
+            for i in range(5)
+        ]
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.stand_in.stop()
+
+    def make_service(self, tmp_path):
+        config = BackupConfig(urls=[self.stand_in.url], simulate=False, incremental=True,
+                              manifest_path=str(tmp_path / "manifest.json"))
+        return BackupService(config, self.api_config)
+
+    def payloads(self):
+        return [payload for _, payload in self.stand_in.requests]
+
+    def test_first_backup_is_full(self, tmp_path):
+        """Test that an empty manifest sends every record as a full snapshot."""
+        service = self.make_service(tmp_path)
+
+        service.backup_data(self.records)
+        service.close()
+
+        payload = self.payloads()[0]
+        assert payload['type'] == 'full'
+        assert payload['sequence'] == 1
+        assert payload['data'] == self.records
+        assert payload['deleted'] == []
+
+    def test_only_changes_and_tombstones_sent(self, tmp_path):
+        """Test that unchanged records are skipped and missing ids are tombstoned."""
+        service = self.make_service(tmp_path)
+        service.backup_data(self.records)
+
+        changed = [dict(r, created_date='2024-02-02') for r in self.records[:4]]
+        changed[1]['email'] = 'new@example.com'
+        changed.append({'id': '9', 'name': 'NEW USER'})
+        service.backup_data(changed)
+        service.close()
+
+        delta = self.payloads()[1]
+        assert delta['type'] == 'delta'
+        assert delta['sequence'] == 2
+        assert [r['id'] for r in delta['data']] == ['1', '9']
+        assert delta['deleted'] == ['4']
+
+    def test_unchanged_data_sends_nothing(self, tmp_path):
+        """Test that a repeat backup of the same records makes no request."""
+        service = self.make_service(tmp_path)
+        service.backup_data(self.records)
+
+        assert service.backup_data(self.records) is True
+        service.close()
+        assert len(self.stand_in.requests) == 1
+
+    def test_manifest_persists_across_instances(self, tmp_path):
+        """Test that the manifest on disk is picked up by a new service."""
+        first = self.make_service(tmp_path)
+        first.backup_data(self.records)
+        first.close()
+
+        second = self.make_service(tmp_path)
+        second.backup_data(self.records + [{'id': '5', 'name': 'LATE'}])
+        second.close()
+
+        assert self.payloads()[1]['data'] == [{'id': '5', 'name': 'LATE'}]
+        assert self.payloads()[1]['sequence'] == 2
+
+    def test_partial_chunk_has_no_tombstones(self, tmp_path):
+        """Test that a chunk backup does not tombstone records outside the chunk."""
+        service = self.make_service(tmp_path)
+        service.backup_data(self.records)
+
+        service.backup_data([dict(self.records[0], name='RENAMED')], complete=False)
+        service.close()
+
+        assert self.payloads()[1]['deleted'] == []
+        assert service.manifest.hashes.keys() == {'0', '1', '2', '3', '4'}
+
+    def test_failed_upload_keeps_manifest(self, tmp_path):
+        """Test that the manifest only advances once a delta was accepted."""
+        self.stand_in.fail_first = 1
+        self.stand_in.status = 400
+        service = self.make_service(tmp_path)
+
+        with pytest.raises(BackupError):
+            service.backup_data(self.records)
+        service.backup_data(self.records)
+        service.close()
+
+        assert self.payloads()[1]['type'] == 'full'
+        assert BackupManifest(str(tmp_path / "manifest.json")).diff(self.records) == ([], [], {})
+
+    def test_simulated_backup_keeps_manifest(self, tmp_path):
+        """Test that a simulated backup does not mark records as backed up."""
+        manifest_path = str(tmp_path / "manifest.json")
+        simulated = BackupService(BackupConfig(urls=[self.stand_in.url], incremental=True,
+                                               manifest_path=manifest_path), self.api_config)
+        simulated.backup_data(self.records)
+        simulated.close()
+
+        service = self.make_service(tmp_path)
+        service.backup_data(self.records)
+        service.close()
+
+        assert self.payloads()[0]['type'] == 'full'
+        assert self.payloads()[0]['data'] == self.records
+
+    def test_partial_failure_keeps_manifest(self, tmp_path):
+        """Test that a delta one target rejected is sent again to every target."""
+        rejecting = BackupStandIn(fail_first=1, status=400)
+        try:
+            config = BackupConfig(urls=[self.stand_in.url, rejecting.url], simulate=False, incremental=True,
+                                  manifest_path=str(tmp_path / "manifest.json"))
+            service = BackupService(config, self.api_config)
+            assert service.backup_data(self.records) is True
+            service.backup_data(self.records)
+            service.close()
+        finally:
+            rejecting.stop()
+
+        assert [payload['sequence'] for payload in self.payloads()] == [1, 2]
+        assert rejecting.requests[1][1]['data'] == self.records
+        assert BackupManifest(str(tmp_path / "manifest.json")).diff(self.records) == ([], [], {})
+
+    def test_uncommitted_chunks_rebuild_in_full(self, tmp_path):
+        """Test that chunks streamed into an empty manifest while a target fails all rebuild."""
+        rejecting = BackupStandIn(status=400, fail_first=100)
+        try:
+            config = BackupConfig(urls=[self.stand_in.url, rejecting.url], simulate=False, incremental=True,
+                                  max_retries=0, manifest_path=str(tmp_path / "manifest.json"))
+            service = BackupService(config, self.api_config)
+            for start in range(0, len(self.records), 2):
+                service.backup_data(self.records[start:start + 2], complete=False)
+            service.close()
+        finally:
+            rejecting.stop()
+
+        payloads = self.payloads()
+        assert [payload['type'] for payload in payloads] == ['delta'] * 3
+        assert [payload['sequence'] for payload in payloads] == [1, 2, 3]
+        assert service.manifest.hashes == {}
+        assert rebuild_snapshot([], reversed(payloads)) == self.records
+
+    def test_rebuild_snapshot_from_deltas(self, tmp_path):
+        """Test that base plus deltas reproduce the latest full dataset."""
+        service = self.make_service(tmp_path)
+        service.backup_data(self.records)
+
+        second = [dict(self.records[1], name='CHANGED')] + self.records[2:] + [{'id': '5', 'name': 'ADDED'}]
+        service.backup_data(second)
+        third = second[:2] + [dict(second[2], email='moved@example.com')] + second[3:4]
+        service.backup_data(third)
+        service.close()
+
+        base, *deltas = self.payloads()
+        assert base['type'] == 'full'
+        assert len(deltas) == 2
+        assert rebuild_snapshot(base['data'], reversed(deltas)) == third
+
+
+class TestChunkedBackup:
+    """Test cases for compressed, chunked backup streaming."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.stand_in = BackupStandIn()
+        self.api_config = APIConfig(api_key="test-api-key", secret_key="s", encryption_key="e")
+        self.records = [{'id': str(i), 'name': f'USER {i}', 'email': f'user{i}@example.com'} for i in range(25)]
+        self.service = None
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        if self.service is not None:
+            self.service.close()
+        self.stand_in.stop()
+
+    def make_service(self, **options):
+        options.setdefault('chunk_records', 10)
+        config = BackupConfig(urls=[self.stand_in.url], simulate=False, max_retries=0, **options)
+        self.service = BackupService(config, self.api_config)
+        return self.service
+
+    def received(self):
+        ordered = sorted(self.stand_in.chunks, key=lambda chunk: int(chunk[0]['X-Chunk-Index']))
+        return [body for _, body in ordered]
+
+    def test_chunks_reassemble_to_payload(self):
+        """Test that the uploaded chunks decode back to the metadata and records."""
+        self.make_service(chunked=True).backup_data(self.records)
+
+        headers = [chunk_headers for chunk_headers, _ in self.stand_in.chunks]
+        assert [h['X-Chunk-Index'] for h in headers] == ['0', '1', '2', '3']
+        assert [h['X-Chunk-Final'] for h in headers] == ['false', 'false', 'false', 'true']
+        assert len({h['X-Backup-Id'] for h in headers}) == 1
+        assert headers[0]['Content-Encoding'] == 'gzip'
+
+        payload = chunk_codec.decode_chunks(self.received(), 'gzip')
+        assert payload['data'] == self.records
+        assert payload['api_key'] == "test-api-key"
+        assert payload['chunk_records'] == 10
+
+    def test_compression_shrinks_payload(self):
+        """Test that compressed chunks are smaller than the plain JSON payload."""
+        self.make_service(chunk_records=100).backup_stream(iter(self.records * 20))
+
+        plain = len(json.dumps({'data': self.records * 20}).encode('utf-8'))
+        assert sum(len(body) for body in self.received()) < plain / 4
+
+    @pytest.mark.parametrize("codec", ['zlib', 'none'])
+    def test_other_codecs(self, codec):
+        """Test that the configured codec is applied and advertised."""
+        self.make_service(compression=codec).backup_stream(iter(self.records))
+
+        assert self.stand_in.chunks[0][0]['Content-Encoding'] == chunk_codec.CONTENT_ENCODINGS[codec]
+        assert chunk_codec.decode_chunks(self.received(), codec)['data'] == self.records
+
+    def test_zstd_falls_back_to_gzip(self, monkeypatch):
+        """Test that zstd requests use gzip when zstandard is not installed."""
+        monkeypatch.setattr(chunk_codec, '_load_zstandard', lambda: None)
+
+        assert chunk_codec.resolve_codec('zstd') == 'gzip'
+        with pytest.raises(ValueError):
+            chunk_codec.resolve_codec('brotli')
+
+    def test_resume_continues_from_failed_chunk(self):
+        """Test that a resumed stream re-sends only the chunks not yet acknowledged."""
+        self.stand_in.fail_requests = {3}
+        self.stand_in.status = 400
+        service = self.make_service()
+
+        with pytest.raises(BackupError, match="at chunk 2"):
+            service.backup_stream(iter(self.records))
+        backup_id = service.stream_progress['backup_id']
+        assert service.stream_progress['pending'] == {self.stand_in.url: 2}
+
+        service.backup_stream(iter(self.records), resume=True)
+
+        indexes = [chunk_headers['X-Chunk-Index'] for chunk_headers, _ in self.stand_in.chunks]
+        assert indexes == ['0', '1', '2', '2', '3']
+        assert {chunk_headers['X-Backup-Id'] for chunk_headers, _ in self.stand_in.chunks} == {backup_id}
+        assert service.stream_progress is None
+
+        bodies = {int(h['X-Chunk-Index']): body for h, body in self.stand_in.chunks}
+        assert chunk_codec.decode_chunks([bodies[i] for i in sorted(bodies)], 'gzip')['data'] == self.records
+
+    def test_empty_stream_sends_metadata_only(self):
+        """Test that an empty record stream still sends a final metadata chunk."""
+        self.make_service().backup_stream(iter([]))
+
+        assert len(self.stand_in.chunks) == 1
+        assert self.stand_in.chunks[0][0]['X-Chunk-Final'] == 'true'
+
+    def test_open_stream_continues_across_writes(self):
+        """Test that batches written to one backup stream share its id and chunk indices."""
+        writer = self.make_service().open_stream()
+        for start, end in ((0, 7), (7, 18), (18, 25)):
+            writer.write_many(self.records[start:end])
+        writer.close()
+
+        headers = [chunk_headers for chunk_headers, _ in self.stand_in.chunks]
+        assert [h['X-Chunk-Index'] for h in headers] == ['0', '1', '2', '3']
+        assert [h['X-Chunk-Final'] for h in headers] == ['false', 'false', 'false', 'true']
+        assert len({h['X-Backup-Id'] for h in headers}) == 1
+        assert chunk_codec.decode_chunks(self.received(), 'gzip')['data'] == self.records
+        assert writer.record_count == len(self.records)
+
+    def test_process_stream_sends_one_backup(self, monkeypatch):
+        """Test that a chunked process_stream run is backed up as a single stream."""
+        for name, value in {"BACKUP_URLS": self.stand_in.url, "BACKUP_SIMULATE": "false",
+                            "BACKUP_CHUNKED": "true", "BACKUP_CHUNK_RECORDS": "4",
+                            "BACKUP_MAX_RETRIES": "0"}.items():
+            monkeypatch.setenv(name, value)
+        input_data = [{'id': str(i), 'name': f'user {i}', 'email': f'user{i}@example.com'} for i in range(10)]
+        processor = DataProcessor(config=load_config())
+        try:
+            result = processor.process_stream(input_data, chunk_size=3)
+        finally:
+            processor.cleanup()
+
+        headers = [chunk_headers for chunk_headers, _ in self.stand_in.chunks]
+        assert 'backup' not in result['error_summary']['by_category']
+        assert [h['X-Chunk-Index'] for h in headers] == ['0', '1', '2', '3']
+        assert [h['X-Chunk-Final'] for h in headers] == ['false', 'false', 'false', 'true']
+        assert len({h['X-Backup-Id'] for h in headers}) == 1
+        assert [record['id'] for record in chunk_codec.decode_chunks(self.received(), 'gzip')['data']] == \
+            [str(i) for i in range(10)]
\ No newline at end of file
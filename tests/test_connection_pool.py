@@ -0,0 +1,152 @@
+import pytest
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.connection_pool import ConnectionPool
+from after.exceptions import DatabaseError
+
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool class."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.created = []
+
+        def factory():
+            conn = Mock()
+            self.created.append(conn)
+            return conn
+
+        self.factory = factory
+
+    def test_connection_reused_after_release(self):
+        """Test that a released connection is handed out again."""
+        pool = ConnectionPool(self.factory, max_size=2)
+
+        with pool.checkout() as first:
+            pass
+        with pool.checkout() as second:
+            pass
+
+        assert first is second
+        assert len(self.created) == 1
+        assert pool.idle_count == 1
+
+    def test_checkout_times_out_when_exhausted(self):
+        """Test that checkout waits at most the timeout when the pool is full."""
+        pool = ConnectionPool(self.factory, max_size=1)
+        pool.acquire()
+
+        with pytest.raises(DatabaseError, match="Timed out"):
+            pool.acquire(timeout=0.05)
+
+    def test_waiting_checkout_gets_released_connection(self):
+        """Test that a blocked checkout is woken up by a release."""
+        pool = ConnectionPool(self.factory, max_size=1)
+        conn = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(conn,)).start()
+
+        assert pool.acquire(timeout=1) is conn
+
+    def test_unhealthy_connection_replaced(self):
+        """Test that idle connections failing the health check are discarded."""
+        health_check = Mock(side_effect=Exception("server gone away"))
+        pool = ConnectionPool(self.factory, health_check=health_check, health_check_interval=0)
+
+        stale = pool.acquire()
+        pool.release(stale)
+        fresh = pool.acquire()
+
+        assert fresh is not stale
+        stale.close.assert_called_once()
+        assert pool.size == 1
+
+    def test_idle_connections_evicted_down_to_min_size(self):
+        """Test that connections idle for too long are closed, keeping min_size."""
+        pool = ConnectionPool(self.factory, min_size=1, max_size=3, max_idle_time=0.01)
+        connections = [pool.acquire() for _ in range(3)]
+        for conn in connections:
+            pool.release(conn)
+
+        time.sleep(0.02)
+        pool.acquire()
+
+        assert pool.size == 1
+        assert sum(conn.close.call_count for conn in connections) == 2
+
+    def test_min_size_opened_up_front(self):
+        """Test that min_size connections are opened when the pool is created."""
+        pool = ConnectionPool(self.factory, min_size=2, max_size=3)
+
+        assert len(self.created) == 2
+        assert pool.idle_count == pool.size == 2
+        with pool.checkout() as conn:
+            assert conn in self.created
+        assert len(self.created) == 2
+
+    def test_idle_connections_evicted_on_release(self):
+        """Test that idle connections past max_idle_time are closed when another is released."""
+        pool = ConnectionPool(self.factory, min_size=0, max_size=2, max_idle_time=0.01)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+
+        time.sleep(0.02)
+        pool.release(second)
+
+        first.close.assert_called_once()
+        assert pool.size == 1
+
+    def test_close_drains_pool(self):
+        """Test that close closes idle connections and rejects new checkouts."""
+        pool = ConnectionPool(self.factory, max_size=2)
+        idle = pool.acquire()
+        busy = pool.acquire()
+        pool.release(idle)
+
+        pool.close()
+
+        idle.close.assert_called_once()
+        busy.close.assert_not_called()
+        pool.release(busy)
+        busy.close.assert_called_once()
+        assert pool.size == 0
+        with pytest.raises(DatabaseError, match="closed"):
+            pool.acquire()
+
+    def test_factory_failure_frees_slot(self):
+        """Test that a failed connection attempt does not leak pool capacity."""
+        pool = ConnectionPool(Mock(side_effect=Exception("login failed")), max_size=1)
+
+        with pytest.raises(Exception, match="login failed"):
+            pool.acquire()
+        assert pool.size == 0
+
+    def test_concurrent_checkouts_respect_max_size(self):
+        """Test that concurrent workers never open more than max_size connections."""
+        pool = ConnectionPool(self.factory, max_size=3)
+
+        def worker():
+            for _ in range(20):
+                with pool.checkout():
+                    time.sleep(0.001)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(self.created) <= 3
+        assert pool.idle_count == pool.size
+
+    def test_invalid_sizes(self):
+        """Test that inconsistent pool sizes are rejected."""
+        with pytest.raises(ValueError):
+            ConnectionPool(self.factory, min_size=3, max_size=2)
\ No newline at end of file
@@ -0,0 +1,396 @@
+import pytest
+import sys
+import os
+import json
+import asyncio
+import threading
+import time
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.data_processor import DataProcessor
+from after.reporting_service import ReportingService, ReportAccumulator
+from after.config import get_config, load_config
+from after.instrumentation import Instrumentation, PipelineHooks
+
+
+SAMPLE_DATA = [
+    {"id": "1", "name": "john doe", "email": "john@example.com", "phone": "(555) 123-4567"},
+    '{"id": "2", "name": "jane smith", "email": "jane@example.com", "phone": "555-987-6543"}',
+    '<user><id>3</id><name>bob wilson</name><email>bob@example.com</email><phone>555-555-5555</phone></user>',
+    {"id": "4", "name": "bad record", "email": "not-an-email", "phone": "123"},
+    "plain text data",
+]
+
+
+def strip_timestamps(records):
+    return [{k: v for k, v in r.items() if k != 'created_date'} for r in records]
+
+
+class TestDataProcessorStreaming:
+    """Test cases for the streaming DataProcessor pipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.processor = DataProcessor()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.processor.cleanup()
+
+    def test_iter_process_is_lazy(self):
+        """Test that iter_process consumes input one item at a time."""
+        consumed = []
+
+        def source():
+            for item in SAMPLE_DATA:
+                consumed.append(item)
+                yield item
+
+        records = self.processor.iter_process(source())
+        first = next(records)
+
+        assert first['id'] == '1'
+        assert len(consumed) == 1
+
+    def test_process_stream_matches_process_everything(self, tmp_path):
+        """Test that streaming and batch processing produce the same result."""
+        batch_file = tmp_path / "batch.json"
+        stream_file = tmp_path / "stream.json"
+
+        batch = DataProcessor().process_everything(SAMPLE_DATA, output_file=str(batch_file), backup=False)
+        stream = self.processor.process_stream(iter(SAMPLE_DATA), output_file=str(stream_file),
+                                               backup=False, chunk_size=2)
+
+        assert stream['success'] is True
+        assert stream['processed_count'] == batch['processed_count']
+        assert sorted(stream['errors']) == sorted(batch['errors'])
+        for key in ('total_records', 'valid_emails', 'valid_phones', 'error_count'):
+            assert stream['report'][key] == batch['report'][key]
+
+        batch_records = json.loads(batch_file.read_text(encoding='utf-8'))
+        stream_records = json.loads(stream_file.read_text(encoding='utf-8'))
+        assert strip_timestamps(stream_records) == strip_timestamps(batch_records)
+
+    def test_process_stream_flushes_bounded_chunks(self):
+        """Test that sinks never receive more than chunk_size records at once."""
+        chunk_sizes = []
+        self.processor.save_processed_data = lambda chunk: chunk_sizes.append(len(chunk)) or True
+
+        result = self.processor.process_stream(SAMPLE_DATA * 3, backup=False, chunk_size=4)
+
+        assert result['processed_count'] == 12
+        assert chunk_sizes == [4, 4, 4]
+
+    def test_process_stream_no_valid_data(self, tmp_path):
+        """Test streaming with input that cannot be parsed."""
+        output_file = tmp_path / "empty.json"
+
+        result = self.processor.process_stream(["plain text", None], output_file=str(output_file))
+
+        assert result['success'] is False
+        assert result['processed_count'] == 0
+        assert len(result['errors']) == 2
+        assert not output_file.exists()
+
+    def test_process_stream_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            self.processor.process_stream(SAMPLE_DATA, chunk_size=0)
+
+
+class TestDataProcessorParallel:
+    """Test cases for the process-pool parse and validate stage."""
+
+    def test_parallel_matches_sequential(self):
+        """Test that worker processes keep record order and merge errors."""
+        input_data = SAMPLE_DATA * 5
+
+        sequential = DataProcessor().process_everything(input_data, backup=False)
+        parallel = DataProcessor(workers=2, worker_chunk_size=3).process_everything(input_data, backup=False)
+
+        assert parallel['processed_count'] == sequential['processed_count']
+        assert parallel['errors'] == sequential['errors']
+        assert parallel['report']['valid_emails'] == sequential['report']['valid_emails']
+
+    def test_parallel_preserves_order(self):
+        """Test that processed records come back in input order."""
+        input_data = [{"id": str(i), "email": f"user{i}@example.com", "phone": "5551234567"} for i in range(50)]
+        processor = DataProcessor(workers=3, worker_chunk_size=7)
+
+        parsed_count, processed = processor.parse_and_validate_parallel(input_data)
+
+        assert parsed_count == 50
+        assert [r['id'] for r in processed] == [str(i) for i in range(50)]
+        assert len(processor.errors) == 0
+
+    def test_invalid_worker_count(self):
+        """Test that a non-positive worker count is rejected."""
+        with pytest.raises(ValueError):
+            DataProcessor(workers=0)
+
+
+class TestDataProcessorAsync:
+    """Test cases for the asynchronous DataProcessor pipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.processor = DataProcessor()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.processor.cleanup()
+
+    def test_async_matches_process_everything(self, tmp_path):
+        """Test that the async pipeline returns the same result shape and counts."""
+        output_file = tmp_path / "async.json"
+
+        expected = DataProcessor().process_everything(SAMPLE_DATA, backup=True)
+        result = asyncio.run(self.processor.process_everything_async(SAMPLE_DATA, output_file=str(output_file)))
+
+        assert result['success'] is True
+        assert result['processed_count'] == expected['processed_count']
+        assert result['errors'] == expected['errors']
+        assert len(json.loads(output_file.read_text(encoding='utf-8'))) == 4
+
+    def test_async_sinks_run_concurrently(self, tmp_path):
+        """Test that every sink is running before any of them finishes."""
+        # Each sink waits for the other two, so their spans only overlap if they run concurrently
+        all_started = threading.Barrier(3)
+        spans = []
+
+        def waiting_sink(*args):
+            started = time.perf_counter()
+            try:
+                all_started.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                pass
+            spans.append((started, time.perf_counter()))
+            return True
+
+        self.processor.save_processed_data = waiting_sink
+        self.processor.save_to_file = waiting_sink
+        self.processor.backup_data = waiting_sink
+
+        result = asyncio.run(self.processor.process_everything_async(SAMPLE_DATA, output_file=str(tmp_path / "out.json")))
+
+        assert result['success'] is True
+        assert len(spans) == 3
+        assert not all_started.broken
+        assert max(start for start, _ in spans) < min(end for _, end in spans)
+
+    def test_async_no_valid_data(self):
+        """Test the async pipeline with input that cannot be parsed."""
+        result = asyncio.run(self.processor.process_everything_async(["plain text"]))
+
+        assert result['success'] is False
+        assert result['processed_count'] == 0
+
+
+class TestDataProcessorReporting:
+    """Test cases for incremental report aggregation."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.processor = DataProcessor()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.processor.cleanup()
+
+    def test_accumulator_matches_generate_report(self):
+        """Test that the running counters agree with a full rescan of the records."""
+        result = self.processor.process_everything(SAMPLE_DATA, backup=False)
+        expected = ReportingService.generate_report(self.processor.processed_data, self.processor.errors)
+
+        for key in ('total_records', 'valid_emails', 'valid_phones', 'error_count'):
+            assert result['report'][key] == expected[key]
+
+    def test_accumulators_merge(self):
+        """Test that per-chunk accumulators merge into the whole-run totals."""
+        records = [
+            {'email_valid': True, 'phone_valid': True},
+            {'email_valid': False, 'phone_valid': True},
+            {'email_valid': True, 'phone_valid': False},
+        ]
+        whole = ReportAccumulator()
+        whole.add_many(records)
+        first = ReportAccumulator()
+        first.add_many(records[:1])
+        second = ReportAccumulator()
+        second.add_many(records[1:])
+
+        merged = first.merge(second)
+
+        assert merged is first
+        assert (merged.total_records, merged.valid_emails, merged.valid_phones) == \
+            (whole.total_records, whole.valid_emails, whole.valid_phones) == (3, 2, 2)
+        assert merged.report(2)['error_count'] == 2
+
+    def test_parallel_report_matches_sequential(self):
+        """Test that worker accumulators merge to the sequential report."""
+        input_data = SAMPLE_DATA * 5
+
+        sequential = DataProcessor().process_everything(input_data, backup=False)
+        parallel = DataProcessor(workers=2, worker_chunk_size=3).process_everything(input_data, backup=False)
+
+        for key in ('total_records', 'valid_emails', 'valid_phones', 'error_count'):
+            assert parallel['report'][key] == sequential['report'][key]
+
+    def test_stream_progress_reports(self):
+        """Test that process_stream emits a partial report after each chunk."""
+        progress = []
+
+        result = self.processor.process_stream(SAMPLE_DATA, backup=False, chunk_size=2,
+                                               progress_callback=progress.append)
+
+        assert [report['total_records'] for report in progress] == [2, 4]
+        assert progress[-1]['valid_emails'] == result['report']['valid_emails']
+        assert self.processor.partial_report()['total_records'] == result['processed_count']
+
+
+class TestDataProcessorStartup:
+    """Test cases for lazy service construction and config caching."""
+
+    def test_services_built_on_first_use(self):
+        """Test that a new processor constructs no services until they are used."""
+        processor = DataProcessor()
+        assert processor.active_services() == []
+
+        processor.file_service
+        assert processor.active_services() == ['file_service']
+        assert processor.file_service is processor.file_service
+
+    def test_file_only_job_skips_other_services(self, tmp_path):
+        """Test that writing a file never builds the LDAP, database or backup services."""
+        processor = DataProcessor()
+
+        processor.save_to_file(str(tmp_path / "out.json"), [{'id': '1'}])
+        processor.cleanup()
+
+        assert processor.active_services() == ['file_service']
+
+    def test_config_loaded_once(self, monkeypatch):
+        """Test that processors share the cached config until it is reloaded."""
+        first = DataProcessor()
+        monkeypatch.setenv("API_KEY", "rotated-key")
+
+        assert DataProcessor().config is first.config
+        try:
+            assert get_config(reload=True).api.api_key == "rotated-key"
+        finally:
+            monkeypatch.undo()
+            get_config(reload=True)
+
+class RecordingHooks(PipelineHooks):
+    """Hooks that record every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def on_stage_start(self, stage):
+        self.calls.append(('start', stage))
+
+    def on_stage_end(self, stage, stats):
+        self.calls.append(('end', stage, stats['records']))
+
+
+class FailingHooks(PipelineHooks):
+    """Hooks that raise on every call."""
+
+    def on_stage_start(self, stage):
+        raise RuntimeError("hook failure")
+
+
+class TestDataProcessorInstrumentation:
+    """Test cases for per-stage timing, hooks and profiling."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.processor = DataProcessor()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.processor.cleanup()
+
+    def test_report_includes_stage_timings(self, tmp_path):
+        """Test that every batch stage is timed with its record count."""
+        result = self.processor.process_everything(SAMPLE_DATA, str(tmp_path / "out.json"), backup=False)
+        stages = result['report']['stages']
+
+        assert list(stages) == ['parse', 'validate', 'database', 'file', 'report']
+        assert stages['parse']['records'] == len(SAMPLE_DATA)
+        assert stages['parse']['bytes'] > 0
+        assert stages['validate']['records'] == 4
+        assert stages['file']['records'] == result['processed_count']
+        assert stages['file']['bytes'] == os.path.getsize(tmp_path / "out.json")
+        for stats in stages.values():
+            assert stats['calls'] == 1
+            assert stats['wall_time'] >= 0 and stats['cpu_time'] >= 0
+        assert 'profile' not in result['report']
+
+    def test_stage_counters_reset_per_run(self):
+        """Test that a second run does not add to the first run's counters."""
+        self.processor.process_everything(SAMPLE_DATA, backup=False)
+        result = self.processor.process_everything(SAMPLE_DATA, backup=False)
+
+        assert result['report']['stages']['parse']['calls'] == 1
+
+    def test_stream_stages(self, tmp_path):
+        """Test that the streaming pipeline times each chunk and the output file."""
+        output = tmp_path / "out.jsonl"
+        result = self.processor.process_stream(SAMPLE_DATA, str(output), backup=False, chunk_size=2)
+        stages = result['report']['stages']
+
+        assert stages['parse_validate']['records'] == len(SAMPLE_DATA)
+        assert stages['parse_validate']['calls'] == 3
+        assert stages['file']['calls'] == 3
+        assert stages['file']['bytes'] == os.path.getsize(output)
+        assert stages['report']['records'] == result['processed_count']
+
+    def test_hooks_called_around_stages(self):
+        """Test that hooks see the start and end of every stage."""
+        hooks = RecordingHooks()
+        processor = DataProcessor(hooks=[hooks])
+        try:
+            processor.process_everything(SAMPLE_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert hooks.calls[:2] == [('start', 'parse'), ('end', 'parse', len(SAMPLE_DATA))]
+        assert [call[1] for call in hooks.calls if call[0] == 'start'] == ['parse', 'validate', 'database', 'report']
+
+    def test_failing_hook_does_not_break_pipeline(self):
+        """Test that an exception in a hook is logged and ignored."""
+        processor = DataProcessor(hooks=[FailingHooks()])
+        try:
+            result = processor.process_everything(SAMPLE_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert result['processed_count'] == 4
+
+    def test_profiling_opt_in(self, tmp_path):
+        """Test that cProfile and tracemalloc output is attached when enabled."""
+        self.processor.instrumentation = Instrumentation(profile=True, trace_memory=True, profile_top=5,
+                                                         profile_output=str(tmp_path / "run.prof"))
+        result = self.processor.process_everything(SAMPLE_DATA, backup=False)
+        profile = result['report']['profile']
+
+        assert 'function calls' in profile['profile']
+        assert profile['memory']['peak_bytes'] > 0
+        assert len(profile['memory']['top']) <= 5
+        assert (tmp_path / "run.prof").exists()
+
+    def test_profiling_from_config(self, monkeypatch):
+        """Test that the PIPELINE_PROFILE environment variable enables profiling."""
+        monkeypatch.setenv("PIPELINE_PROFILE", "true")
+        processor = DataProcessor(config=load_config())
+        try:
+            result = processor.process_everything(SAMPLE_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert 'profile' in result['report']['profile']
+        assert 'memory' not in result['report']['profile']
\ No newline at end of file
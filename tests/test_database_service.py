@@ -9,6 +9,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
 
 from after.database_service import DatabaseService
 from after.config import DatabaseConfig
+from after.exceptions import DatabaseError
+from after.connection_pool import ConnectionPool
+from after.metrics import DATABASE_COMMIT_LATENCY
 
 
 class TestDatabaseService:
@@ -160,6 +163,80 @@ class TestDatabaseService:
         result = invalid_db_service.save_user_data(test_data)
         assert result is False
 
+    def test_save_user_data_chunked_commits(self):
+        """Test that records are inserted in batches with a commit per batch."""
+        conn = Mock()
+        cursor = conn.cursor.return_value
+        commits_before = DATABASE_COMMIT_LATENCY.count()
+
+        with patch.object(self.db_service, '_get_connection', return_value=conn):
+            test_data = [{'id': str(i), 'name': 'User'} for i in range(25)]
+
+            result = self.db_service.save_user_data(test_data, batch_size=10)
+
+            assert result is True
+            assert [len(call.args[1]) for call in cursor.executemany.call_args_list] == [10, 10, 5]
+            assert conn.commit.call_count == 3
+            assert cursor.fast_executemany is True
+            assert DATABASE_COMMIT_LATENCY.count() - commits_before == 3
+
+    def test_save_user_data_rejects_non_positive_batch_size(self):
+        """Test that an explicit batch size of zero is rejected instead of falling back to the default."""
+        with patch.object(self.db_service, '_get_connection') as get_connection:
+            for batch_size in (0, -1):
+                with pytest.raises(ValueError, match="batch_size must be at least 1"):
+                    self.db_service.save_user_data([{'id': '1'}], batch_size=batch_size)
+
+        get_connection.assert_not_called()
+
+    def test_save_user_data_failure_rolls_back_current_batch(self):
+        """Test that a failing batch does not undo previously committed batches."""
+        with sqlite3.connect(':memory:') as conn:
+            cursor = conn.cursor()
+            cursor.execute('CREATE TABLE users (id TEXT PRIMARY KEY, name TEXT, email TEXT, phone TEXT, '
+                           'created_date TEXT, email_valid INTEGER, phone_valid INTEGER)')
+
+            with patch.object(self.db_service, '_get_connection', return_value=conn):
+                test_data = [{'id': str(i)} for i in range(4)] + [{'id': '0'}]
+
+                with pytest.raises(DatabaseError):
+                    self.db_service.save_user_data(test_data, batch_size=2)
+
+                cursor.execute("SELECT COUNT(*) FROM users")
+                assert cursor.fetchone()[0] == 4
+
+    def test_save_user_data_failure_discards_connection(self):
+        """Test that a connection whose save failed is closed instead of returned to the pool."""
+        broken = Mock()
+        broken.cursor.return_value.executemany.side_effect = Exception("connection reset")
+        pool = ConnectionPool(Mock(side_effect=[broken]), min_size=0, max_size=1)
+
+        with patch.object(self.db_service, '_get_pool', return_value=pool):
+            self.db_service._pool = pool
+            with pytest.raises(DatabaseError):
+                self.db_service.save_user_data([{'id': '1'}])
+
+        broken.close.assert_called_once()
+        assert pool.size == 0
+
+    def test_save_user_data_reuses_pooled_connection(self):
+        """Test that consecutive saves share one pooled connection until the pool is drained."""
+        factory = Mock(side_effect=lambda: Mock())
+        pool = ConnectionPool(factory, max_size=2)
+
+        with patch.object(self.db_service, '_get_pool', return_value=pool):
+            self.db_service._pool = pool
+            assert self.db_service.save_user_data([{'id': '1'}]) is True
+            assert self.db_service.save_user_data([{'id': '2'}]) is True
+
+            assert factory.call_count == 1
+            assert pool.idle_count == 1
+
+            self.db_service.close_connection()
+
+            assert pool.idle_count == 0
+            assert self.db_service._pool is None
+
     def teardown_method(self):
         """Clean up after each test method."""
         if hasattr(self.db_service, 'connection') and self.db_service.connection:
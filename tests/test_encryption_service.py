@@ -0,0 +1,97 @@
+import pytest
+import sys
+import os
+import io
+import base64
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.encryption_service import EncryptionService
+from after.config import APIConfig
+from after.exceptions import EncryptionError
+
+
+class TrickleReader(io.RawIOBase):
+    """Readable stream that returns at most a few bytes per read, like a pipe or socket."""
+
+    def __init__(self, data, step=5):
+        self._data = io.BytesIO(data)
+        self._step = step
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(min(len(buffer), self._step))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestEncryptionServiceStreaming:
+    """Test cases for streaming and batch EncryptionService operations."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.service = EncryptionService(APIConfig(api_key="k", secret_key="s", encryption_key="e"))
+        self.content = ''.join(f'{{"id": "{i}", "name": "José {i}"}}\n' for i in range(500)).encode('utf-8')
+
+    @pytest.mark.parametrize("block_size", [3, 7, 1024, 1 << 20])
+    def test_stream_matches_whole_encryption(self, block_size):
+        """Test that block-wise encryption equals encrypting the content at once."""
+        encrypted = io.BytesIO()
+
+        written = self.service.encrypt_stream(io.BytesIO(self.content), encrypted, block_size)
+
+        assert encrypted.getvalue() == base64.b64encode(self.content)
+        assert written == len(encrypted.getvalue())
+
+    def test_short_reads_keep_blocks_aligned(self):
+        """Test that sources returning partial reads still produce valid output."""
+        encrypted = io.BytesIO()
+
+        self.service.encrypt_stream(TrickleReader(self.content), encrypted, block_size=1024)
+
+        assert encrypted.getvalue() == base64.b64encode(self.content)
+
+    @pytest.mark.parametrize("block_size", [3, 999, 1 << 16])
+    def test_stream_round_trip(self, block_size):
+        """Test that decrypt_stream restores the original bytes."""
+        encrypted = io.BytesIO()
+        decrypted = io.BytesIO()
+        self.service.encrypt_stream(io.BytesIO(self.content), encrypted, block_size)
+        encrypted.seek(0)
+
+        self.service.decrypt_stream(TrickleReader(encrypted.getvalue(), step=11), decrypted, block_size)
+
+        assert decrypted.getvalue() == self.content
+
+    def test_decrypt_stream_corrupt_input(self):
+        """Test that truncated ciphertext raises EncryptionError."""
+        with pytest.raises(EncryptionError):
+            self.service.decrypt_stream(io.BytesIO(b'YWJjZ'), io.BytesIO())
+
+    def test_invalid_block_size(self):
+        """Test that blocks smaller than one base64 group are rejected."""
+        with pytest.raises(ValueError):
+            self.service.encrypt_stream(io.BytesIO(b'abc'), io.BytesIO(), block_size=2)
+
+    def test_encrypt_many_matches_encrypt_data(self):
+        """Test that batch encryption matches the single-value API."""
+        values = ['john@example.com', 12345, None, '', 'José']
+
+        encrypted = self.service.encrypt_many(values)
+
+        assert encrypted == [self.service.encrypt_data(value) for value in values]
+        assert self.service.decrypt_many(encrypted) == [str(value) for value in values]
+
+    def test_encrypting_writer_text_output(self):
+        """Test that text written through the wrapper is encrypted incrementally."""
+        destination = io.BytesIO()
+        writer = self.service.encrypting_writer(destination, close_destination=False)
+
+        with io.TextIOWrapper(writer, encoding='utf-8', write_through=True) as text:
+            for line in self.content.decode('utf-8').splitlines(keepends=True):
+                text.write(line)
+
+        assert destination.getvalue() == base64.b64encode(self.content)
\ No newline at end of file
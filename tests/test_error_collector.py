@@ -0,0 +1,179 @@
+import pytest
+import sys
+import os
+import json
+import pickle
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.error_collector import ErrorCollector, ErrorEntry
+from after.data_processor import DataProcessor
+from after.config import load_config
+
+
+class Unprintable:
+    """Value whose string form must never be built."""
+
+    def __str__(self):
+        raise AssertionError("message was formatted")
+
+
+class TestErrorCollector:
+    """Test cases for ErrorCollector."""
+
+    def test_counts_by_category(self):
+        """Test that errors are counted by stage and error type."""
+        collector = ErrorCollector()
+        collector.add('parse', 'ParseError', "bad input")
+        collector.add('validate', 'invalid_email', "Invalid email: %s", "x")
+        collector.add('validate', 'invalid_email', "Invalid email: %s", "y")
+
+        assert len(collector) == 3
+        assert collector.by_category() == {'parse': {'ParseError': 1}, 'validate': {'invalid_email': 2}}
+        assert list(collector) == ["bad input", "Invalid email: x", "Invalid email: y"]
+
+    def test_samples_are_bounded(self):
+        """Test that only the most recent errors are kept as samples."""
+        collector = ErrorCollector(max_samples=3)
+        for i in range(10):
+            collector.add('validate', 'invalid_phone', "Invalid phone: %s", i)
+
+        assert collector.messages() == ["Invalid phone: 7", "Invalid phone: 8", "Invalid phone: 9"]
+        assert collector.summary() == {
+            'total': 10,
+            'by_category': {'validate': {'invalid_phone': 10}},
+            'sampled': 3,
+            'dropped': 7,
+            'spill_path': None
+        }
+
+    def test_messages_formatted_lazily(self):
+        """Test that recording an error does not build its message."""
+        collector = ErrorCollector(max_samples=1)
+        collector.add('validate', 'invalid_email', "Invalid email: %s", Unprintable())
+        collector.add('validate', 'invalid_email', "Invalid email: %s", "shown")
+
+        assert collector.messages() == ["Invalid email: shown"]
+
+    def test_spill_to_disk(self, tmp_path):
+        """Test that every error is appended to the spill file, beyond the samples kept in memory."""
+        path = tmp_path / "errors.jsonl"
+        collector = ErrorCollector(max_samples=1, spill_path=str(path))
+        for i in range(5):
+            collector.add('parse', 'ParseError', "bad record %s", i)
+        collector.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line['message'] for line in lines] == [f"bad record {i}" for i in range(5)]
+        assert lines[0] == {'stage': 'parse', 'error_type': 'ParseError', 'message': "bad record 0"}
+        assert len(collector.samples) == 1
+
+    def test_merge_and_pickle(self, tmp_path):
+        """Test that a collector survives pickling and merges into another."""
+        worker = ErrorCollector(max_samples=2, spill_path=str(tmp_path / "errors.jsonl"))
+        worker.add('parse', 'ParseError', "one")
+        worker.add('parse', 'ParseError', "two")
+        copy = pickle.loads(pickle.dumps(worker))
+        worker.close()
+
+        collector = ErrorCollector(max_samples=3)
+        collector.add('file', 'APIException', "zero")
+        collector.merge(copy)
+
+        assert collector.messages() == ["zero", "one", "two"]
+        assert collector.counts['parse', 'ParseError'] == 2
+
+    def test_negative_max_samples(self):
+        """Test that a negative sample size is rejected."""
+        with pytest.raises(ValueError):
+            ErrorCollector(max_samples=-1)
+
+    def test_entry_repr(self):
+        """Test the entry representation."""
+        entry = ErrorEntry('parse', 'ParseError', "bad %s", ('row',))
+        assert repr(entry) == "ErrorEntry('parse', 'ParseError', 'bad row')"
+
+
+class TestDataProcessorErrors:
+    """Test cases for bounded error collection in DataProcessor."""
+
+    BAD_DATA = [{"id": str(i), "email": "bad", "phone": "1"} for i in range(50)] + ["plain text data"]
+
+    def test_result_errors_are_bounded(self, monkeypatch):
+        """Test that the result holds at most ERROR_MAX_SAMPLES messages but counts every error."""
+        monkeypatch.setenv("ERROR_MAX_SAMPLES", "5")
+        processor = DataProcessor(config=load_config())
+        try:
+            result = processor.process_everything(self.BAD_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert len(result['errors']) == 5
+        assert result['error_summary']['total'] == 101
+        assert result['error_summary']['by_category'] == {
+            'parse': {'ParseError': 1},
+            'validate': {'invalid_email': 50, 'invalid_phone': 50}
+        }
+        assert result['report']['error_count'] == 101
+
+    def test_spill_file(self, tmp_path, monkeypatch):
+        """Test that ERROR_LOG_PATH receives every error of a run."""
+        path = tmp_path / "errors.jsonl"
+        monkeypatch.setenv("ERROR_MAX_SAMPLES", "2")
+        monkeypatch.setenv("ERROR_LOG_PATH", str(path))
+        processor = DataProcessor(config=load_config())
+        try:
+            processor.process_stream(self.BAD_DATA, backup=False, chunk_size=10)
+        finally:
+            processor.cleanup()
+
+        assert len(path.read_text().splitlines()) == 101
+
+    def test_parallel_workers_spill(self, tmp_path, monkeypatch):
+        """Test that worker processes spill their errors and send back bounded samples."""
+        path = tmp_path / "errors.jsonl"
+        monkeypatch.setenv("ERROR_MAX_SAMPLES", "3")
+        monkeypatch.setenv("ERROR_LOG_PATH", str(path))
+        processor = DataProcessor(workers=2, worker_chunk_size=10, config=load_config())
+        try:
+            result = processor.process_everything(self.BAD_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert len(result['errors']) == 3
+        assert result['error_summary']['total'] == 101
+        assert len(path.read_text().splitlines()) == 101
+
+    def test_parallel_spill_matches_sequential(self, tmp_path, monkeypatch):
+        """Test that worker spills are merged into whole lines in the sequential order."""
+        monkeypatch.setenv("ERROR_MAX_SAMPLES", "3")
+        spilled = {}
+        for workers in (1, 2):
+            path = tmp_path / f"errors-{workers}.jsonl"
+            monkeypatch.setenv("ERROR_LOG_PATH", str(path))
+            processor = DataProcessor(workers=workers, worker_chunk_size=7, config=load_config())
+            try:
+                processor.process_everything(self.BAD_DATA, backup=False)
+            finally:
+                processor.cleanup()
+            spilled[workers] = path.read_text()
+
+        assert spilled[2] == spilled[1]
+        assert [json.loads(line)['stage'] for line in spilled[2].splitlines()][:1] == ['parse']
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['errors-1.jsonl', 'errors-2.jsonl']
+
+    def test_merge_appends_spill_file(self, tmp_path):
+        """Test that merging a spilling collector appends its file and removes it."""
+        target = ErrorCollector(spill_path=str(tmp_path / "errors.jsonl"))
+        target.add('file', 'APIException', "zero")
+        worker = ErrorCollector(spill_path=str(tmp_path / "errors.jsonl.0.parse"))
+        worker.add('parse', 'ParseError', "one")
+        worker.close()
+
+        target.merge(worker)
+        target.close()
+
+        lines = (tmp_path / "errors.jsonl").read_text().splitlines()
+        assert [json.loads(line)['message'] for line in lines] == ["zero", "one"]
+        assert not (tmp_path / "errors.jsonl.0.parse").exists()
\ No newline at end of file
@@ -0,0 +1,169 @@
+import pytest
+import sys
+import os
+import gzip
+import io
+import json
+import xml.etree.ElementTree as ET
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.config import APIConfig
+from after.encryption_service import EncryptionService
+from after.file_service import FileService
+from after.exceptions import APIException
+
+
+RECORDS = [
+    {'id': '1', 'name': 'JOHN DOE', 'email': 'john@example.com', 'phone': '5551234567',
+     'email_valid': True, 'phone_valid': True, 'created_date': '2024-01-01T00:00:00'},
+    {'id': '2', 'name': 'JOSÉ ÑUÑEZ', 'email': 'bad', 'phone': '', 'email_valid': False,
+     'phone_valid': False, 'created_date': None, 'tags': ['a', {'b': 1}]},
+]
+
+
+class TestFileServiceStreaming:
+    """Test cases for FileService streaming writers."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.file_service = FileService()
+
+    def test_json_stream_matches_save_to_json(self, tmp_path):
+        """Test that the streaming JSON writer reproduces save_to_json byte for byte."""
+        expected_file = tmp_path / "expected.json"
+        stream_file = tmp_path / "stream.json"
+
+        self.file_service.save_to_json(str(expected_file), RECORDS)
+        self.file_service.save_stream(str(stream_file), iter(RECORDS))
+
+        assert stream_file.read_bytes() == expected_file.read_bytes()
+
+    def test_json_stream_empty(self, tmp_path):
+        """Test that an empty stream still produces a valid JSON array."""
+        expected_file = tmp_path / "expected.json"
+        stream_file = tmp_path / "stream.json"
+
+        self.file_service.save_to_json(str(expected_file), [])
+        self.file_service.save_stream(str(stream_file), iter([]))
+
+        assert stream_file.read_bytes() == expected_file.read_bytes()
+
+    def test_compact_json_stream(self, tmp_path):
+        """Test that compact mode writes valid, unindented JSON."""
+        stream_file = tmp_path / "compact.json"
+
+        self.file_service.save_stream(str(stream_file), iter(RECORDS), compact=True)
+
+        content = stream_file.read_text(encoding='utf-8')
+        assert '\n' not in content
+        assert json.loads(content) == RECORDS
+
+    def test_ndjson_stream(self, tmp_path):
+        """Test that NDJSON output has one record per line."""
+        stream_file = tmp_path / "records.ndjson"
+
+        self.file_service.save_to_file(str(stream_file), RECORDS, 'ndjson')
+
+        lines = stream_file.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == RECORDS
+
+    def test_gzip_stream(self, tmp_path):
+        """Test that compressed output round-trips through gzip."""
+        stream_file = tmp_path / "records.ndjson.gz"
+
+        self.file_service.save_stream(str(stream_file), iter(RECORDS), 'ndjson', compress=True)
+
+        with gzip.open(stream_file, 'rt', encoding='utf-8') as f:
+            assert [json.loads(line) for line in f] == RECORDS
+
+    def test_encrypted_stream_matches_encrypt_stream(self, tmp_path):
+        """Test that encrypted output equals encrypting the plain file and decrypts back to it."""
+        plain_file = tmp_path / "plain.json"
+        stream_file = tmp_path / "stream.json.enc"
+        encryption = EncryptionService(APIConfig(api_key="k", secret_key="s", encryption_key="e"))
+
+        self.file_service.save_stream(str(plain_file), iter(RECORDS))
+        self.file_service.save_stream(str(stream_file), iter(RECORDS), encrypt=True)
+
+        expected = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(plain_file.read_bytes()), expected)
+        assert stream_file.read_bytes() == expected.getvalue()
+
+        decrypted = io.BytesIO()
+        with open(stream_file, 'rb') as f:
+            encryption.decrypt_stream(f, decrypted)
+        assert decrypted.getvalue() == plain_file.read_bytes()
+
+    def test_encrypted_gzip_stream(self, tmp_path):
+        """Test that compressed output is encrypted after gzip and closes every layer."""
+        stream_file = tmp_path / "records.ndjson.gz.enc"
+        encryption = EncryptionService(APIConfig(api_key="k", secret_key="s", encryption_key="e"))
+
+        with self.file_service.open_stream(str(stream_file), 'ndjson', compress=True, encrypt=True) as writer:
+            writer.write_many(RECORDS)
+        assert writer._sink.closed
+
+        decrypted = io.BytesIO()
+        with open(stream_file, 'rb') as f:
+            encryption.decrypt_stream(f, decrypted)
+        lines = gzip.decompress(decrypted.getvalue()).decode('utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == RECORDS
+
+    def test_incremental_writer(self, tmp_path):
+        """Test that records can be written as they are produced."""
+        stream_file = tmp_path / "incremental.json"
+
+        with self.file_service.open_stream(str(stream_file)) as writer:
+            for record in RECORDS:
+                writer.write(record)
+
+        assert writer.count == 2
+        assert json.loads(stream_file.read_text(encoding='utf-8')) == RECORDS
+
+    def test_xml_stream_matches_element_tree(self, tmp_path):
+        """Test that the streaming XML writer matches the ElementTree output byte for byte."""
+        records = RECORDS + [{'id': '3', 'name': 'A & B <tag> "quoted"', 'email': '', 'phone': 0}, {}]
+        expected_file = tmp_path / "expected.xml"
+        stream_file = tmp_path / "stream.xml"
+
+        root = ET.Element("data")
+        for item in records:
+            record = ET.SubElement(root, "record")
+            for key, value in item.items():
+                elem = ET.SubElement(record, str(key))
+                elem.text = str(value) if value is not None else ""
+        ET.ElementTree(root).write(str(expected_file), encoding='utf-8', xml_declaration=True)
+
+        self.file_service.save_to_xml(str(stream_file), iter(records))
+
+        assert stream_file.read_bytes() == expected_file.read_bytes()
+
+    def test_xml_stream_empty_records(self, tmp_path):
+        """Test that records without fields match ElementTree's self-closed elements."""
+        expected_file = tmp_path / "expected.xml"
+        stream_file = tmp_path / "stream.xml"
+
+        root = ET.Element("data")
+        for _ in range(2):
+            ET.SubElement(root, "record")
+        ET.ElementTree(root).write(str(expected_file), encoding='utf-8', xml_declaration=True)
+        self.file_service.save_stream(str(stream_file), iter([{}, {}]), 'xml')
+
+        assert stream_file.read_bytes() == expected_file.read_bytes()
+
+    def test_xml_stream_empty(self, tmp_path):
+        """Test that an empty XML stream matches an empty ElementTree document."""
+        expected_file = tmp_path / "expected.xml"
+        stream_file = tmp_path / "stream.xml"
+
+        ET.ElementTree(ET.Element("data")).write(str(expected_file), encoding='utf-8', xml_declaration=True)
+        self.file_service.save_stream(str(stream_file), iter([]), 'xml')
+
+        assert stream_file.read_bytes() == expected_file.read_bytes()
+
+    def test_unsupported_stream_format(self, tmp_path):
+        """Test that unknown stream formats are rejected."""
+        with pytest.raises(APIException, match="Unsupported stream format"):
+            self.file_service.open_stream(str(tmp_path / "out.csv"), 'csv')
\ No newline at end of file
@@ -0,0 +1,76 @@
+import pytest
+import sys
+import os
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Cumulative import-time budgets in microseconds, generous enough for slow CI machines
+PACKAGE_BUDGET_US = 50_000
+PROCESSOR_BUDGET_US = 300_000
+
+# Modules that only specific features need and must not be imported up front
+DEFERRED_MODULES = [
+    'asyncio',
+    'concurrent.futures',
+    'xml.etree.ElementTree',
+    'http.client',
+    'http.server',
+    'after.auth_service',
+    'after.backup_service',
+    'after.database_service',
+    'after.encryption_service',
+    'after.file_service',
+]
+
+
+def import_times(statement):
+    """Run ``statement`` in a fresh interpreter under -X importtime; return cumulative times by module."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def loaded_modules(statement):
+    """Run ``statement`` in a fresh interpreter and return the names in sys.modules afterwards."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestImportTime:
+    """Import-time regression tests for the after package."""
+
+    def test_package_import_is_lazy(self):
+        """Test that importing the package pulls in none of its submodules."""
+        modules = loaded_modules('import after')
+        times = import_times('import after')
+
+        assert [module for module in modules if module.startswith('after.')] == []
+        assert times['after'] < PACKAGE_BUDGET_US
+
+    def test_processor_import_defers_optional_modules(self):
+        """Test that DataProcessor imports without services, asyncio or XML support."""
+        modules = loaded_modules('from after import DataProcessor')
+        times = import_times('import after.data_processor')
+
+        assert 'after.data_processor' in modules
+        assert [module for module in DEFERRED_MODULES if module in modules] == []
+        assert times['after.data_processor'] < PROCESSOR_BUDGET_US
+
+    def test_lazy_exports_resolve(self):
+        """Test that every name in __all__ resolves through the lazy loader."""
+        import after
+
+        for name in after.__all__:
+            assert getattr(after, name) is not None
+        with pytest.raises(AttributeError):
+            after.NoSuchExport
\ No newline at end of file
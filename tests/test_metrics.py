@@ -0,0 +1,186 @@
+import pytest
+import sys
+import os
+import urllib.request
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.metrics import MetricsRegistry, RECORDS_FAILED, RECORDS_PROCESSED, RECORDS_SAVED
+from after.data_processor import DataProcessor
+from after.config import load_config
+
+
+SAMPLE_DATA = [
+    {"id": "1", "name": "john doe", "email": "john@example.com", "phone": "(555) 123-4567"},
+    '{"id": "2", "name": "jane smith", "email": "jane@example.com", "phone": "555-987-6543"}',
+    {"id": "3", "name": "bad record", "email": "not-an-email", "phone": "123"},
+    "plain text data",
+]
+
+
+class TestMetricsRegistry:
+    """Test cases for the in-process metrics registry."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.registry = MetricsRegistry()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.registry.stop_servers()
+
+    def test_counter_render(self):
+        """Test that labelled counters are exported in the Prometheus text format."""
+        counter = self.registry.counter('jobs_total', 'Jobs run', ('queue',))
+        counter.labels('fast').inc()
+        counter.labels('fast').inc(2)
+        counter.inc(1, 'say "hi"\n')
+
+        text = self.registry.render()
+
+        assert '# HELP jobs_total Jobs run\n# TYPE jobs_total counter\n' in text
+        assert 'jobs_total{queue="fast"} 3\n' in text
+        assert 'jobs_total{queue="say \\"hi\\"\\n"} 1\n' in text
+        assert counter.value('fast') == 3
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets count every observation at or below their bound."""
+        histogram = self.registry.histogram('latency_seconds', 'Latency', buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert self.registry.get_sample_value('latency_seconds_bucket', {'le': '0.1'}) == 2
+        assert self.registry.get_sample_value('latency_seconds_bucket', {'le': '1.0'}) == 3
+        assert self.registry.get_sample_value('latency_seconds_bucket', {'le': '+Inf'}) == 4
+        assert self.registry.get_sample_value('latency_seconds_count') == 4
+        assert self.registry.get_sample_value('latency_seconds_sum') == pytest.approx(3.65)
+
+    def test_metric_reused_by_name(self):
+        """Test that registering a name twice returns the same metric, but not across types."""
+        counter = self.registry.counter('events_total', 'Events')
+
+        assert self.registry.counter('events_total', 'Events') is counter
+        with pytest.raises(ValueError):
+            self.registry.histogram('events_total', 'Events')
+
+    def test_wrong_label_count(self):
+        """Test that a label value count that does not match the label names is rejected."""
+        counter = self.registry.counter('events_total', 'Events', ('kind',))
+
+        with pytest.raises(ValueError):
+            counter.labels('a', 'b')
+
+    def test_write_textfile(self, tmp_path):
+        """Test that the textfile export holds the rendered metrics."""
+        self.registry.counter('events_total', 'Events').inc()
+        path = tmp_path / "metrics.prom"
+
+        self.registry.write_textfile(str(path))
+
+        assert path.read_text() == self.registry.render()
+        assert not (tmp_path / "metrics.prom.tmp").exists()
+
+    def test_http_endpoint(self):
+        """Test that the HTTP endpoint serves the current metrics."""
+        counter = self.registry.counter('events_total', 'Events')
+        server = self.registry.serve(0)
+
+        counter.inc(5)
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            body = response.read().decode('utf-8')
+            content_type = response.headers['Content-Type']
+
+        assert 'events_total 5\n' in body
+        assert content_type.startswith('text/plain')
+        assert self.registry.serve(server.port) is server
+
+
+class TestDataProcessorMetrics:
+    """Test cases for the pipeline metrics recorded by DataProcessor."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.processor = DataProcessor()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        self.processor.cleanup()
+
+    def test_stage_records_counted(self, tmp_path):
+        """Test that records are counted per stage and per saving sink."""
+        parsed_before = RECORDS_PROCESSED.value('parse')
+        saved_before = RECORDS_SAVED.value('file')
+
+        result = self.processor.process_everything(SAMPLE_DATA, str(tmp_path / "out.json"), backup=False)
+
+        assert RECORDS_PROCESSED.value('parse') - parsed_before == len(SAMPLE_DATA)
+        assert RECORDS_SAVED.value('file') - saved_before == result['processed_count']
+
+    def test_failures_counted_by_error_type(self):
+        """Test that parse errors and invalid fields are counted by error type."""
+        parse_before = RECORDS_FAILED.value('parse', 'ParseError')
+        email_before = RECORDS_FAILED.value('validate', 'invalid_email')
+
+        self.processor.process_everything(SAMPLE_DATA, backup=False)
+
+        assert RECORDS_FAILED.value('parse', 'ParseError') - parse_before == 1
+        assert RECORDS_FAILED.value('validate', 'invalid_email') - email_before == 1
+
+    def test_parallel_failures_counted(self):
+        """Test that failures counted in worker processes reach the registry."""
+        processor = DataProcessor(workers=2, worker_chunk_size=2)
+        parse_before = RECORDS_FAILED.value('parse', 'ParseError')
+        try:
+            processor.process_everything(SAMPLE_DATA * 2, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert RECORDS_FAILED.value('parse', 'ParseError') - parse_before == 2
+
+    def test_sink_failure_counted(self, tmp_path):
+        """Test that a failing sink is counted under its stage."""
+        before = RECORDS_FAILED.value('file', 'APIException')
+
+        self.processor.process_everything(SAMPLE_DATA, str(tmp_path / "missing" / "out.json"), backup=False)
+
+        assert RECORDS_FAILED.value('file', 'APIException') - before == 1
+
+    def test_failures_published_per_chunk(self):
+        """Test that process_stream publishes error counts after every chunk, not only at the end."""
+        before = RECORDS_FAILED.value('validate', 'invalid_email')
+        seen = []
+
+        self.processor.process_stream(SAMPLE_DATA * 2, backup=False, chunk_size=1,
+                                      progress_callback=lambda report: seen.append(
+                                          RECORDS_FAILED.value('validate', 'invalid_email') - before))
+
+        assert seen[0] == 0
+        assert seen[2] == 1
+        assert seen[-1] == 2
+
+    def test_textfile_written_after_run(self, tmp_path, monkeypatch):
+        """Test that METRICS_TEXTFILE receives the registry after every run."""
+        path = tmp_path / "pipeline.prom"
+        monkeypatch.setenv("METRICS_TEXTFILE", str(path))
+        processor = DataProcessor(config=load_config())
+        try:
+            processor.process_stream(SAMPLE_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert 'pipeline_records_total{stage="parse_validate"}' in path.read_text()
+
+    def test_metrics_disabled(self, monkeypatch):
+        """Test that METRICS_ENABLED=false leaves the pipeline counters untouched."""
+        monkeypatch.setenv("METRICS_ENABLED", "false")
+        processor = DataProcessor(config=load_config())
+        before = RECORDS_PROCESSED.value('parse')
+        try:
+            processor.process_everything(SAMPLE_DATA, backup=False)
+        finally:
+            processor.cleanup()
+
+        assert RECORDS_PROCESSED.value('parse') == before
+        assert not processor.backup_service.metrics_enabled
+        assert not processor.database_service.metrics_enabled
\ No newline at end of file
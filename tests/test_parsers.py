@@ -1,6 +1,7 @@
 import pytest
 import sys
 import os
+import io
 import json
 
 # Add the after directory to the Python path
@@ -8,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
 
 from after.parsers import DataParser
 from after.exceptions import ParseError
+from after.data_processor import DataProcessor
 
 
 class TestDataParser:
@@ -131,4 +133,190 @@ class TestDataParser:
         
         assert "script" in result  # Should be treated as regular data
         assert result["script"] == "alert('xss')"  # Should be escaped/safe
-        assert result["name"] == "John"
\ No newline at end of file
+        assert result["name"] == "John"
+
+
+class TestXMLRecordStreaming:
+    """Test cases for streaming multi-record XML documents."""
+
+    def write_users(self, path, count):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('<users>')
+            for i in range(count):
+                f.write(f'<user><id>{i}</id><name>user {i}</name><email>user{i}@example.com</email></user>')
+            f.write('</users>')
+
+    def test_iter_xml_records_from_path(self, tmp_path):
+        """Test that every record element is yielded as a dict."""
+        path = tmp_path / "users.xml"
+        self.write_users(path, 1000)
+
+        records = list(DataParser.iter_xml_records(str(path)))
+
+        assert len(records) == 1000
+        assert records[0] == {"id": "0", "name": "user 0", "email": "user0@example.com"}
+        assert records[-1]["id"] == "999"
+
+    def test_iter_xml_records_clears_processed_elements(self):
+        """Test that processed records are released while streaming."""
+        document = b'<users>' + b''.join(
+            f'<user><id>{i}</id></user>'.encode() for i in range(100)) + b'</users>'
+        records = DataParser.iter_xml_records(io.BytesIO(document))
+
+        for _ in range(50):
+            next(records)
+
+        frame_root = records.gi_frame.f_locals['root']
+        assert len(frame_root) <= 1
+
+    def test_iter_xml_records_clears_nested_containers(self):
+        """Test that records inside nested containers are released, not just root children."""
+        document = b'<export>' + b''.join(
+            b'<batch><users>' + b''.join(f'<user><id>{b}-{i}</id></user>'.encode() for i in range(50))
+            + b'</users></batch>' for b in range(4)) + b'</export>'
+        records = DataParser.iter_xml_records(io.BytesIO(document))
+
+        for _ in range(120):
+            next(records)
+
+        containers = records.gi_frame.f_locals['open_elements']
+        assert [elem.tag for elem in containers] == ['export', 'batch', 'users']
+        assert len(containers[-1]) <= 1
+        assert sum(len(list(elem.iter('user'))) for elem in containers[1:]) <= 1
+        assert list(records)[-1] == {"id": "3-49"}
+
+    def test_iter_xml_records_custom_tag(self):
+        """Test streaming records with a custom element name."""
+        document = b'<export><meta>x</meta><row><id>1</id></row><row><id>2</id></row></export>'
+
+        records = list(DataParser.iter_xml_records(io.BytesIO(document), record_tag='row'))
+
+        assert records == [{"id": "1"}, {"id": "2"}]
+
+    def test_iter_xml_records_malformed(self):
+        """Test that malformed documents raise ParseError."""
+        document = b'<users><user><id>1</id></user><user><id>2</id>'
+
+        with pytest.raises(ParseError, match="XML parse error"):
+            list(DataParser.iter_xml_records(io.BytesIO(document)))
+
+    def test_iter_xml_records_feeds_processor(self, tmp_path):
+        """Test that streamed XML records plug straight into DataProcessor."""
+        path = tmp_path / "users.xml"
+        self.write_users(path, 25)
+
+        result = DataProcessor().process_stream(DataParser.iter_xml_records(str(path)), backup=False)
+
+        assert result['success'] is True
+        assert result['processed_count'] == 25
+
+class TestInputSources:
+    """Test cases for file and stream input sources."""
+
+    RECORDS = [{"id": i, "name": f"user {i}", "note": "ünïcödé " * (i % 3)} for i in range(200)]
+
+    def test_iter_ndjson(self, tmp_path):
+        """Test reading newline-delimited JSON line by line."""
+        path = tmp_path / "users.ndjson"
+        path.write_text('\n'.join(json.dumps(r) for r in self.RECORDS) + '\n\n', encoding='utf-8')
+
+        assert list(DataParser.iter_ndjson(str(path))) == self.RECORDS
+
+    def test_iter_ndjson_error_reports_byte_offset(self):
+        """Test that a malformed line is reported with its byte offset."""
+        data = b'{"id": 1}\n{"id": 2\n'
+
+        with pytest.raises(ParseError, match="at byte 10"):
+            list(DataParser.iter_ndjson(io.BytesIO(data)))
+
+    def test_iter_json_array_small_reads(self):
+        """Test that array elements split across read boundaries are decoded."""
+        data = json.dumps(self.RECORDS, indent=2, ensure_ascii=False).encode('utf-8')
+
+        records = list(DataParser.iter_json_array(io.BytesIO(data), read_size=7))
+
+        assert records == self.RECORDS
+
+    def test_iter_json_array_numbers_across_reads(self):
+        """Test that scalars ending at a read boundary are not truncated."""
+        records = list(DataParser.iter_json_array(io.BytesIO(b'[12345, 678]'), read_size=3))
+
+        assert records == [12345, 678]
+
+    @pytest.mark.parametrize("read_size", [1, 2, 3, 4, 5, 64])
+    def test_iter_json_array_number_prefix_at_read_boundary(self, read_size):
+        """Test that a number whose prefix is itself valid JSON is read whole."""
+        records = list(DataParser.iter_json_array(io.BytesIO(b'[1.5e10,2, -0.25E-3 ]'), read_size=read_size))
+
+        assert records == [1.5e10, 2, -0.25e-3]
+
+    def test_iter_ndjson_reports_bad_lines_and_continues(self):
+        """Test that malformed lines go to on_error with their offsets and later lines are read."""
+        data = b'{"id": 1}\n{"id": 2\n{"id": 3}\nnot json\n{"id": 4}\n'
+        errors = []
+
+        records = list(DataParser.iter_ndjson(io.BytesIO(data), on_error=errors.append))
+
+        assert records == [{"id": 1}, {"id": 3}, {"id": 4}]
+        assert [str(error).split(':')[0] for error in errors] == \
+            ["JSON parse error at byte 10", "JSON parse error at byte 29"]
+
+    def test_iter_json_array_is_lazy(self):
+        """Test that elements are yielded before the whole document is read."""
+        stream = io.BytesIO(json.dumps(self.RECORDS).encode('utf-8'))
+        records = DataParser.iter_json_array(stream, read_size=64)
+
+        assert next(records) == self.RECORDS[0]
+        assert stream.tell() < len(stream.getvalue())
+
+    def test_iter_json_array_error_reports_byte_offset(self):
+        """Test that a malformed element is reported with its byte offset."""
+        data = b'[{"id": 1}, {"id": 2,}, {"id": 3}]'
+
+        with pytest.raises(ParseError, match="at byte 12"):
+            list(DataParser.iter_json_array(io.BytesIO(data), read_size=4))
+
+    def test_iter_json_array_requires_array(self):
+        """Test that a non-array document is rejected."""
+        with pytest.raises(ParseError, match="expected a top-level array"):
+            list(DataParser.iter_json_array(io.BytesIO(b'{"id": 1}')))
+
+    def test_iter_records_detects_format(self, tmp_path):
+        """Test that the input format is detected from the first byte."""
+        array_path = tmp_path / "users.json"
+        array_path.write_text(json.dumps(self.RECORDS[:3]), encoding='utf-8')
+        ndjson_path = tmp_path / "users.ndjson"
+        ndjson_path.write_text('\n'.join(json.dumps(r) for r in self.RECORDS[:3]), encoding='utf-8')
+        xml_stream = io.BytesIO(b'  <users><user><id>1</id></user></users>')
+
+        assert list(DataParser.iter_records(str(array_path))) == self.RECORDS[:3]
+        assert list(DataParser.iter_records(str(ndjson_path))) == self.RECORDS[:3]
+        assert list(DataParser.iter_records(xml_stream)) == [{"id": "1"}]
+
+    def test_iter_records_unknown_format(self):
+        """Test that undetectable input is rejected."""
+        with pytest.raises(ParseError, match="Unrecognized input format"):
+            list(DataParser.iter_records(io.BytesIO(b'id,name\n1,John')))
+
+    def test_process_file_records_source_errors(self, tmp_path):
+        """Test that DataProcessor.process_file keeps records read before a source error."""
+        path = tmp_path / "users.ndjson"
+        path.write_text('{"id": "1", "email": "a@example.com", "phone": "5551234567"}\nnot json\n',
+                        encoding='utf-8')
+
+        result = DataProcessor().process_file(str(path), backup=False)
+
+        assert result['processed_count'] == 1
+        assert any('at byte' in error for error in result['errors'])
+
+    def test_process_file_skips_bad_ndjson_lines(self, tmp_path):
+        """Test that process_file records a malformed NDJSON line and keeps reading."""
+        path = tmp_path / "users.ndjson"
+        path.write_text('{"id": "1", "email": "a@example.com", "phone": "5551234567"}\n{"id": "2",\n'
+                        '{"id": "3", "email": "c@example.com", "phone": "5551234567"}\n', encoding='utf-8')
+
+        result = DataProcessor().process_file(str(path), backup=False)
+
+        assert result['processed_count'] == 2
+        assert result['error_summary']['by_category']['parse'] == {'ParseError': 1}
+        assert any('at byte 61' in error for error in result['errors'])
\ No newline at end of file
@@ -0,0 +1,83 @@
+import pytest
+import sys
+import os
+import pickle
+
+# Add the after directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
+
+from after.records import UserRecord
+from after.validators import DataValidator
+from after.database_service import DatabaseService
+from after.reporting_service import ReportingService
+from after.data_processor import DataProcessor
+
+
+USER_DATA = {'id': 7, 'name': 'jane roe', 'email': 'Jane@Example.com', 'phone': '555-987-6543'}
+
+
+class TestUserRecord:
+    """Test cases for the compact UserRecord type."""
+
+    def test_matches_validator_dict(self):
+        """Test that a validated UserRecord equals the dict from validate_user_data."""
+        expected = DataValidator.validate_user_data(USER_DATA)
+        result = DataValidator.validate_user_record(USER_DATA)
+
+        assert isinstance(result['data'], UserRecord)
+        assert result['data'] == expected['data']
+        assert list(result['data'].items()) == list(expected['data'].items())
+        assert result['errors'] == expected['errors']
+
+    def test_unset_field_behaves_like_missing_key(self):
+        """Test that created_date is absent until assigned."""
+        record = DataValidator.validate_user_record(USER_DATA)['data']
+
+        assert 'created_date' not in record
+        assert record.get('created_date', '') == ''
+        with pytest.raises(KeyError):
+            record['created_date']
+
+        record['created_date'] = '2024-01-01'
+        assert list(record)[-1] == 'created_date'
+
+    def test_rejects_unknown_fields(self):
+        """Test that only the fixed record fields can be set."""
+        record = UserRecord()
+
+        with pytest.raises(KeyError):
+            record['nickname'] = 'jr'
+        with pytest.raises(AttributeError):
+            record.nickname = 'jr'
+
+    def test_dict_round_trip_and_pickle(self):
+        """Test conversion to and from dicts and pickling across processes."""
+        record = UserRecord.from_dict(dict(DataValidator.validate_user_data(USER_DATA)['data'],
+                                           created_date='2024-01-01'))
+
+        assert UserRecord.from_dict(record.to_dict()) == record
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_services_accept_user_records(self, tmp_path):
+        """Test that validator, database, file and reporting paths accept UserRecord."""
+        record = DataValidator.validate_user_record(USER_DATA)['data']
+        record['created_date'] = '2024-01-01'
+
+        assert DataValidator.validate_user_data(record)['data'] == DataValidator.validate_user_data(record.to_dict())['data']
+        assert DatabaseService._record_params(record) == DatabaseService._record_params(record.to_dict())
+        assert ReportingService.generate_report([record], [])['valid_emails'] == 1
+
+    def test_compact_pipeline_output_matches(self, tmp_path):
+        """Test that compact records produce the same output files as dict records."""
+        input_data = [USER_DATA, {'id': 8, 'email': 'bad', 'phone': '1'}]
+
+        for compact in (False, True):
+            for fmt in ('json', 'xml'):
+                processor = DataProcessor(compact_records=compact)
+                records = processor.validate_and_process_data(input_data)
+                for r in records:
+                    r['created_date'] = '2024-01-01'
+                processor.file_service.save_to_file(str(tmp_path / f"{compact}.{fmt}"), records, fmt)
+
+        for fmt in ('json', 'xml'):
+            assert (tmp_path / f"True.{fmt}").read_bytes() == (tmp_path / f"False.{fmt}").read_bytes()
\ No newline at end of file
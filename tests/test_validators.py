@@ -1,12 +1,16 @@
 import pytest
 import sys
 import os
+from unittest.mock import patch
 
 # Add the after directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'after'))
 
 from after.validators import DataValidator
 from after.exceptions import ValidationError
+from after.data_processor import DataProcessor
+from after.config import load_config
+from after.error_collector import ErrorCollector
 
 
 class TestDataValidator:
@@ -150,6 +154,16 @@ class TestDataValidator:
         assert any('Invalid email' in error for error in result['errors'])
         assert any('Invalid phone' in error for error in result['errors'])
 
+    def test_validate_user_data_with_collector(self):
+        """Test that invalid fields go to a collector instead of the result when one is given."""
+        collector = ErrorCollector()
+
+        result = DataValidator.validate_user_data({'id': 1, 'email': 'invalid-email', 'phone': '123'}, collector)
+
+        assert result['errors'] == []
+        assert collector.by_category() == {'validate': {'invalid_email': 1, 'invalid_phone': 1}}
+        assert collector.messages() == ["Invalid email: invalid-email", "Invalid phone: 123"]
+
     def test_validate_user_data_non_dict(self):
         """Test user data validation with non-dictionary input."""
         with pytest.raises(ValidationError, match="User data must be a dictionary"):
@@ -166,4 +180,203 @@ class TestDataValidator:
         assert result['data']['email'] == ''
         assert result['data']['phone'] == ''
         assert result['data']['email_valid'] is False
-        assert result['data']['phone_valid'] is False
\ No newline at end of file
+        assert result['data']['phone_valid'] is False
+
+class TestDataValidatorBatch:
+    """Test cases for the batch validation API."""
+
+    RECORDS = [
+        {'id': 12345, 'name': 'john doe', 'email': 'John.Doe@Example.COM', 'phone': '(123) 456-7890'},
+        {'id': 2, 'name': 'bad', 'email': 'invalid-email', 'phone': '123'},
+        "not a dict",
+        {},
+        {'id': None, 'name': None, 'email': None, 'phone': None},
+        {'id': 'x', 'email': 'ok@example.org', 'phone': '+1-555-000-1111'},
+    ]
+
+    def test_validate_batch_matches_per_record(self):
+        """Test that batch results match validate_user_data record by record."""
+        expected_records = []
+        expected_errors = []
+        for record in self.RECORDS:
+            try:
+                result = DataValidator.validate_user_data(record)
+            except ValidationError as e:
+                expected_errors.append(str(e))
+                continue
+            expected_records.append(result['data'])
+            expected_errors.extend(result['errors'])
+
+        batch = DataValidator.validate_batch(self.RECORDS)
+
+        assert list(DataValidator.iter_batch_records(batch)) == expected_records
+        assert batch['errors'] == expected_errors
+        assert batch['rejected'] == [2]
+
+        collector = ErrorCollector()
+        assert DataValidator.validate_batch(self.RECORDS, collector)['errors'] == []
+        assert collector.messages() == expected_errors
+
+    def test_validate_batch_parallel_columns(self):
+        """Test that batch results are returned as parallel columns."""
+        batch = DataValidator.validate_batch(iter(self.RECORDS))
+
+        lengths = {len(batch[field]) for field in ('id', 'name', 'email', 'phone', 'email_valid', 'phone_valid')}
+        assert lengths == {5}
+        assert batch['email_valid'] == [True, False, False, False, True]
+        assert batch['phone_valid'] == [True, False, False, False, True]
+
+    def test_validate_batch_empty(self):
+        """Test batch validation of an empty input."""
+        batch = DataValidator.validate_batch([])
+
+        assert batch['id'] == []
+        assert batch['errors'] == []
+
+class TestDataValidatorColumns:
+    """Test cases for the column validators."""
+
+    PHONES = ["1234567890", "(123) 456-7890", "+1-123-456-7890", "", "123", "abc", None, "123-456"]
+    SSNS = ["123-45-6789", "987-65-4321", "", "123456789", "123-45-678", "12-345-6789",
+            "abc-de-fghi", None, "123-45-67890"]
+    CARDS = ["4111111111111111", "4111-1111-1111-1111", "4111 1111 1111 1112", "1234567890123456",
+             "", "123456789012345", "12345678901234567", "abcd1234567890123", None]
+
+    def test_columns_match_scalar_validators(self):
+        """Test that column results match the scalar validators."""
+        pytest.importorskip("numpy")
+
+        assert list(DataValidator.validate_phone_column(self.PHONES)) == \
+            [DataValidator.validate_phone(p) for p in self.PHONES]
+        assert list(DataValidator.validate_ssn_column(self.SSNS)) == \
+            [DataValidator.validate_ssn(s) for s in self.SSNS]
+        assert list(DataValidator.validate_credit_card_column(self.CARDS)) == \
+            [DataValidator.validate_credit_card(c) for c in self.CARDS]
+
+    @pytest.mark.parametrize("column_check, scalar_check, values", [
+        (DataValidator.validate_phone_column, DataValidator.validate_phone,
+         PHONES + ["123.456.7890", "123-456-7890", "١٢٣٤٥٦٧٨٩٠", "１２３４５６７８９０", "1234567890\n", "12345६७८९०"]),
+        (DataValidator.validate_ssn_column, DataValidator.validate_ssn,
+         SSNS + ["123-45-6789\n", "١٢٣-٤٥-٦٧٨٩", " 123-45-6789", "123-45-6789 "]),
+        (DataValidator.validate_credit_card_column, DataValidator.validate_credit_card,
+         CARDS + ["4111 1111 1111 1111", "4111111111111111\n", "٤١١١١١١١١١١١١١١١", "411111111111111١"]),
+    ])
+    def test_column_scalar_parity(self, column_check, scalar_check, values):
+        """Test that column and scalar validators agree, including on non-ASCII digits and newlines."""
+        pytest.importorskip("numpy")
+
+        assert list(column_check(values)) == [scalar_check(value) for value in values]
+
+    def test_luhn_column_scalar_parity(self):
+        """Test that the Luhn column check agrees with the scalar path on non-ASCII digits."""
+        pytest.importorskip("numpy")
+        cards = self.CARDS + ["٤١١١١١١١١١١١١١١١", "٤١١١١١١١١١١١١١١٢", "4111111111111111\n"]
+
+        with patch('after.validators._load_numpy', return_value=None):
+            expected = DataValidator.validate_credit_card_column(cards, luhn=True)
+
+        assert list(DataValidator.validate_credit_card_column(cards, luhn=True)) == expected
+
+    def test_columns_accept_fixed_width_bytes(self):
+        """Test that a numpy fixed-width bytes column is validated directly."""
+        np = pytest.importorskip("numpy")
+        column = np.array([b"555-123-4567", b"555", b""], dtype="S16")
+
+        result = DataValidator.validate_phone_column(column)
+
+        assert result.dtype == bool
+        assert result.tolist() == [True, False, False]
+
+    def test_credit_card_luhn(self):
+        """Test the vectorized Luhn checksum."""
+        pytest.importorskip("numpy")
+
+        result = DataValidator.validate_credit_card_column(self.CARDS, luhn=True)
+
+        assert result.tolist() == [True, True, False, False, False, False, False, False, False]
+
+    def test_columns_without_numpy(self):
+        """Test that the column validators fall back to scalar checks without numpy."""
+        with patch('after.validators._load_numpy', return_value=None):
+            assert DataValidator.validate_phone_column(self.PHONES) == \
+                [DataValidator.validate_phone(p) for p in self.PHONES]
+            assert DataValidator.validate_ssn_column(self.SSNS) == \
+                [DataValidator.validate_ssn(s) for s in self.SSNS]
+            assert DataValidator.validate_credit_card_column(self.CARDS, luhn=True) == \
+                [True, True, False, False, False, False, False, False, False]
+
+    def test_empty_columns(self):
+        """Test that empty columns produce empty results."""
+        pytest.importorskip("numpy")
+
+        assert len(DataValidator.validate_phone_column([])) == 0
+        assert len(DataValidator.validate_credit_card_column([], luhn=True)) == 0
+
+class TestDataValidatorCache:
+    """Test cases for memoized email and phone validation."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        DataValidator.configure_cache(enabled=True, max_size=3)
+        DataValidator.clear_cache()
+
+    def teardown_method(self):
+        """Clean up after each test method."""
+        DataValidator.configure_cache()
+
+    def test_repeated_values_hit_cache(self):
+        """Test that repeated emails and phones are served from the cache."""
+        user_data = {'id': 1, 'name': 'john', 'email': 'John@Example.com', 'phone': '(123) 456-7890'}
+
+        first = DataValidator.validate_user_data(user_data)
+        second = DataValidator.validate_user_data(dict(user_data, email='john@example.COM'))
+
+        assert first == second
+        stats = DataValidator.cache_stats()
+        assert stats['email']['hits'] == 1
+        assert stats['email']['misses'] == 1
+        assert stats['phone']['hit_rate'] == 0.5
+
+    def test_cached_results_match_uncached(self):
+        """Test that memoized results match validation with the cache disabled."""
+        records = [{'email': e, 'phone': p} for e in ('a@b.com', 'bad', '') for p in ('1234567890', '12', '')] * 3
+
+        cached = [DataValidator.validate_user_data(r) for r in records]
+        DataValidator.configure_cache(enabled=False)
+        uncached = [DataValidator.validate_user_data(r) for r in records]
+
+        assert cached == uncached
+
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts least recently used values beyond its size."""
+        for i in range(10):
+            DataValidator.validate_user_data({'email': f'user{i}@example.com', 'phone': f'555000{i:04d}'})
+
+        stats = DataValidator.cache_stats()
+        assert stats['email']['size'] == 3
+        assert stats['email']['estimated_evictions'] == 7
+
+    def test_cache_disabled_from_config(self, monkeypatch):
+        """Test that the cache can be switched off through configuration."""
+        monkeypatch.setenv("VALIDATION_CACHE_ENABLED", "false")
+
+        processor = DataProcessor(config=load_config())
+        processor.validate_and_process_data([{'email': 'a@b.com', 'phone': '1234567890'}] * 2)
+
+        stats = processor.validation_cache.stats()
+        assert stats['enabled'] is False
+        assert stats['email']['hits'] + stats['email']['misses'] == 0
+
+    def test_processors_keep_their_own_cache(self, monkeypatch):
+        """Test that building a processor with other settings leaves existing caches alone."""
+        first = DataProcessor()
+        first.validate_and_process_data([{'email': 'a@b.com', 'phone': '1234567890'}] * 2)
+        monkeypatch.setenv("VALIDATION_CACHE_ENABLED", "false")
+        DataProcessor(config=load_config())
+
+        first.validate_and_process_data([{'email': 'a@b.com', 'phone': '1234567890'}])
+
+        stats = first.validation_cache.stats()
+        assert stats['enabled'] is True
+        assert stats['email']['hits'] == 2
+        assert DataValidator.cache_stats()['enabled'] is True
\ No newline at end of file